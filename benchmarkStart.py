@@ -0,0 +1,49 @@
+import os
+
+import sys
+import json
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM","offscreen")
+os.environ.setdefault("QT_QUICK_BACKEND","software")
+os.environ.setdefault("QT_QUICK_CONTROLS_STYLE","Material")
+
+from PySide2.QtWidgets import QApplication
+
+from testUtilities.benchmarkSuite import BenchmarkSuite, CASES
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Headless benchmarks of the DynamoChartManager hot paths")
+    parser.add_argument("--cases",nargs="+",choices=CASES,default=CASES,help="The cases to run")
+    parser.add_argument("--sizes",nargs="+",type=int,default=[1000,10000,100000,1000000],
+                        help="The numbers of points per series")
+    parser.add_argument("--series",nargs="+",type=int,default=[1,10,200],help="The numbers of series")
+    parser.add_argument("--types",nargs="+",choices=["line","scatter"],default=["line"],
+                        help="The series types used by the replace and append cases")
+    parser.add_argument("--repeat",type=int,default=5,help="How many times every measure is repeated")
+    parser.add_argument("--calls",type=int,default=100,help="The number of addPoint calls per repetition")
+    parser.add_argument("--max-total",type=int,default=2000000,
+                        help="The configurations with more points than this (all series together) are skipped")
+    parser.add_argument("--render",action="store_true",
+                        help="Show the chart window, so the chart is rendered (untimed) between the measures")
+    parser.add_argument("--output",default=None,help="The JSON file to write the results to (default: stdout)")
+    parser.add_argument("--quiet",action="store_true",help="Do not print the results while they are measured")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    suite = BenchmarkSuite(args.sizes,args.series,args.repeat,args.calls,args.max_total,args.types,
+                           args.render)
+
+    def report(result):
+        sys.stderr.write("{case:>20} {type:>8} {series:>4} series {points:>8} points  median {median:.6f} s\n"
+                         .format(**result))
+
+    results = suite.run(args.cases,None if args.quiet else report)
+    if args.output is None:
+        json.dump(results,sys.stdout,indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output,"w") as outputFile:
+            json.dump(results,outputFile,indent=2)
@@ -18,6 +18,13 @@ ChartView{ // This element is the QML side of the "DynamoChart library".
                           // The value of this property has to be assigned before allowing the user
                           // to interact with the QML chart.
     property var currentSeries: {[]}
+    property bool showMetrics: false  // If true the manager metrics are shown over the top right corner of the plot
+
+    onPlotAreaChanged: {
+        if(manager){
+            manager.plotWidth = plotArea.width;
+        }
+    }
 
     /// <summary>
     /// Adds a series to the chart
@@ -89,6 +96,7 @@ ChartView{ // This element is the QML side of the "DynamoChart library".
         manager.yLogRight = yLogAxisR;
 
         manager.axisAssigned = true;
+        manager.plotWidth = plotArea.width;  // It is used to decimate the series that allow that
         manager.addingSeries.connect(addNewSeries);  // The series have to be added via manager object.
                                                      // When a new series has to be added, a dictionary with the
                                                      // series features is send to the manager object on python side.
@@ -227,6 +235,38 @@ ChartView{ // This element is the QML side of the "DynamoChart library".
     }
     // FAKE SERIES TO VISUALIZE AXIS CORRECTLY - END
 
+    Rectangle{ // Metrics overlay: it tells whether the chart is starved (few updates), overloaded (long update
+               // times) or dropping replaces
+        id: metricsOverlay
+        visible: showMetrics && manager ? true : false
+        x: parent.plotArea.x + parent.plotArea.width - width - 4
+        y: parent.plotArea.y + 4
+        width: metricsText.implicitWidth + 12
+        height: metricsText.implicitHeight + 8
+        color: "#B0000000"
+        radius: 3
+
+        Text{
+            id: metricsText
+            anchors.centerIn: parent
+            color: "white"
+            font.family: "monospace"
+            font.pixelSize: 11
+            text: {
+                var m = metricsOverlay.visible ? manager.metrics : null;
+                if(!m || m.updatesPerSecond === undefined){
+                    return "No metrics yet";
+                }
+                return "updates/s  " + m.updatesPerSecond.toFixed(1) + "\n" +
+                       "points/s   " + m.pointsPerSecond.toFixed(0) + "\n" +
+                       "conversion " + m.conversionTime.toFixed(2) + " ms\n" +
+                       "autoscale  " + m.autoscaleTime.toFixed(2) + " ms\n" +
+                       "replace    " + m.replaceTime.toFixed(2) + " ms\n" +
+                       "dropped    " + m.droppedReplaces;
+            }
+        }
+    }
+
     MouseArea{
         id: dynamoMouse
         anchors.fill: parent
@@ -0,0 +1,15 @@
+import QtQuick 2.0
+
+Item { // Root item loaded by the batch renderer (see dynamoBatchRenderer), which sets its size
+       // RenderMng = the DynamoChartManager of the chart being rendered
+
+    DynamoChart{
+        id: renderChart
+        objectName: "renderChart"
+        anchors.fill: parent
+        manager: RenderMng
+        Component.onCompleted: function(){
+            renderChart.managerAssociation();
+        }
+    }
+}
@@ -11,4 +11,81 @@ LOGY = 'linlog'
 LOGLOG = 'loglog'
 
 ## Others
-MARKERSIZE = 5
\ No newline at end of file
+MARKERSIZE = 5
+
+## Series store
+STORECAPACITY = 1024  # Initial number of points a series store can hold before growing
+APPENDLIMIT = 8  # Above this number of new points the GUI series points are replaced at once instead of appended:
+#                  QXYSeries appends the points one by one, updating the chart for each of them
+
+## Decimation modes
+NODECIMATION = 'none'
+MINMAX = 'minmax'
+LTTB = 'lttb'
+PYRAMID = 'pyramid'
+DECIMATIONS = [NODECIMATION,MINMAX,LTTB,PYRAMID]  # It contains all the allowed values for the "decimation" key of a series
+LTTBPOINTS = 2000  # Default number of points kept by the LTTB decimation ("targetPoints" key of a series)
+LTTBINTERVAL = 33  # Milliseconds the appends to a LTTB series are gathered before decimating it again (no refresh rate)
+
+## Viewport culling
+CULLINGMARGIN = 0.5  # Fraction of the visible x span sent to the GUI on each side of the visible range
+
+## Autoscale growth policy (the defaults fit the linear axes exactly to the data, as without a policy)
+AUTOSCALEHEADROOM = 0.0  # Fraction of the data span left free beyond the data when an autoscaled axis grows
+AUTOSCALENICETICKS = False  # If True the autoscaled linear axes end on multiples of a 1, 2 or 5 tick step
+AUTOSCALESHRINKBAND = 0.0  # The axis shrinks only if the data range is this fraction of its span smaller at least
+AUTOSCALESHRINKDELAY = 0.0  # Seconds the data has to stay inside the smaller range before the axis shrinks
+
+## Instrumentation
+TIMINGSAMPLES = 1024  # Number of the latest call durations kept for every method to compute the percentiles
+TRACESIZE = 4096  # Number of the latest calls kept in the trace ring buffer
+
+## Metrics
+METRICSINTERVAL = 1000  # Milliseconds between two updates of the manager metrics
+
+## Recordings
+RECORDINGMAGIC = b"DYNAMOCH"  # The first bytes of a recording file
+RECORDINGVERSION = 1
+RECORDINGDTYPES = ["float32","float64"]  # It contains all the allowed types for the recorded values
+
+## Playback modes
+PLAYBACKAPPEND = 'append'  # The points reached by the playback are appended to the series
+PLAYBACKWINDOW = 'window'  # The series is replaced with the points in a x window ending at the playback position
+PLAYBACKMODES = [PLAYBACKAPPEND,PLAYBACKWINDOW]
+PLAYBACKRATE = 30  # Default number of playback ticks per second
+PLAYBACKSPAN = 0.1  # Default fraction of the recording x range sent in "window" mode
+
+## Shared memory channels
+SHAREDCAPACITY = 1 << 20  # Default number of points held by the ring buffer of a shared memory channel
+SHAREDPOLLRATE = 30  # Refresh rate (Hz) set to poll the shared memory channels if the manager has none
+
+## Streaming protocol
+# Every frame starts with a header (STREAMHEADER, little endian): operation (uint8), series name length in bytes
+# (uint16) and count (uint32). The utf-8 series name follows, then the payload: "count" float64 x values and "count"
+# float64 y values for STREAMAPPEND and STREAMREPLACE, a "count" bytes long utf-8 JSON dictionary of series features
+# (see DynamoChartManager.addSeries) for STREAMADDSERIES, nothing for STREAMSYNC
+STREAMHEADER = "<BHI"
+STREAMADDSERIES = 1
+STREAMAPPEND = 2
+STREAMREPLACE = 3
+STREAMSYNC = 4  # The server answers STREAMACK once all the frames received before it have been applied
+STREAMACK = b"\x01"
+STREAMBUFFERSIZE = 1 << 20  # Bytes the server reads from a connection before letting the producer wait
+
+## Asyncio ingestion
+ASYNCMAXPENDING = 1 << 20  # Default number of points an asyncio producer can queue before its pushes wait
+
+## Export formats
+EXPORTNPZ = 'npz'  # Compressed numpy archive
+EXPORTRAW = 'raw'  # Recording file (see writeRecording), whose columns can be memory mapped
+EXPORTFORMATS = [EXPORTNPZ,EXPORTRAW]
+
+## Data registry
+REGISTRYVIEWS = 16  # Number of distinct views (see viewKey) of a channel cached for the current data
+
+## Linked axes
+LINKINTERVAL = 16  # Milliseconds the range changes of a linked axis are gathered before updating the other axes
+
+## Batch rendering
+RENDERWIDTH = 900  # Default size, in pixels, of the images rendered by the batch renderer
+RENDERHEIGHT = 400
@@ -0,0 +1,285 @@
+from PySide2.QtCore import QObject, Signal, Slot
+import numpy as np
+import collections
+import threading
+import asyncio
+
+from .definitions import ASYNCMAXPENDING
+
+APPEND = 0  # Operations queued by DynamoAsyncChart
+REPLACE = 1
+DRAIN = 2
+
+## Runs a new asyncio event loop on a daemon thread, so that asyncio producers can run beside the Qt event loop
+# (the coroutines are submitted with asyncio.run_coroutine_threadsafe)
+# @param name String: The thread name
+# @return AbstractEventLoop: The running loop
+def runLoopThread(name="DynamoAsyncLoop"):
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+    threading.Thread(target=run,name=name,daemon=True).start()
+    started.wait()
+
+    return loop
+
+
+## Class _DynamoAsyncBridge
+# Lives in the thread of the manager and applies there the batches submitted by DynamoAsyncChart. When the batch
+# is submitted from another thread the signal is queued, so the manager is only ever called by its own thread
+class _DynamoAsyncBridge(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    submitted = Signal(object)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param manager DynamoChartManager: The manager the batches are applied to
+    def __init__(self,manager):
+
+        QObject.__init__(self)
+        self._manager = manager
+        self.moveToThread(manager.thread())
+        self.submitted.connect(self._apply)
+
+
+    ## Applies a batch and reports the outcome. The unknown series are skipped
+    # @param job Tuple: The list of (operation, dictionary of series) to apply and the function called at the end
+    #                   with the exception raised (None on success) and the set of the unknown series
+    @Slot(object)
+    def _apply(self,job):
+
+        batch,done = job
+        error = None
+        unknown = set()
+        try:
+            for operation,data in batch:
+                for k in [k for k in data.keys() if not self._manager.hasSeries(k)]:
+                    unknown.add(k)
+                    del data[k]
+                if not data:
+                    continue
+                if operation == APPEND:
+                    self._manager.addPoints(data)
+                else:
+                    self._manager.replaceSeries(data)
+        except Exception as e:
+            error = e
+        done(error,unknown)
+
+
+## Class DynamoAsyncChart
+# Awaitable ingestion API for asyncio producers. push and replace queue their points and return once the points have
+# been applied by the manager (addPoints and replaceSeries semantics). Only one batch at a time is handed to the
+# manager thread: what is pushed meanwhile is batched, the appends to the same series being joined, so the GUI sees
+# one call per batch whatever the number of coroutines and pushes.
+# The queued points are bounded: once maxPending points are waiting, the pushes wait for the manager before
+# queueing (backpressure). A push cancelled before its batch is handed to the manager is discarded.
+# The object has to be used from a single asyncio loop, which may run on the manager thread or on another one
+class DynamoAsyncChart(object):
+
+    ## Class constructor
+    # @param manager DynamoChartManager: The manager the points are sent to
+    # @param maxPending Integer: The number of queued points above which the pushes wait
+    def __init__(self,manager,maxPending=ASYNCMAXPENDING):
+
+        self._bridge = _DynamoAsyncBridge(manager)
+        self._maxPending = max(int(maxPending),1)
+        self._loop = None
+        self._waiters = collections.deque()  # [points, future] of the pushes waiting for room, in arrival order
+        self._queue = []  # [operation, series name, x values, y values, future] not handed to the manager yet
+        self._pending = 0  # Points queued or being applied
+        self._inFlight = False
+
+
+    ## Returns the number of points queued or being applied
+    def pending(self):
+
+        return self._pending
+
+
+    ## Binds the object to the running loop at the first use
+    def _bind(self):
+
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("DynamoAsyncChart can be used from a single event loop")
+
+
+    ## Tells whether or not a number of points fits in the queue. A push larger than the queue fits once the queue
+    # is empty
+    # @param count Integer: The number of points to queue
+    def _fits(self,count):
+
+        return self._pending == 0 or self._pending + count <= self._maxPending
+
+
+    ## Waits until there is room for a number of points in the queue. The pushes get room in arrival order, so the
+    # points of a series are never reordered
+    # @param count Integer: The number of points to queue
+    async def _reserve(self,count):
+
+        if not self._waiters and self._fits(count):
+            self._pending += count
+            return
+
+        waiter = [count,self._loop.create_future()]
+        self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._release(0)  # The next waiters may fit now
+            elif not waiter[1].cancelled():
+                self._release(count)  # The room was granted just before the cancellation
+            raise
+
+
+    ## Releases the room of some points and gives it to the waiting pushes
+    # @param count Integer: The number of points released
+    def _release(self,count):
+
+        self._pending -= count
+        while self._waiters and self._fits(self._waiters[0][0]):
+            count,future = self._waiters.popleft()
+            if not future.cancelled():
+                self._pending += count
+                future.set_result(None)
+
+
+    ## Queues an operation and waits until it has been applied
+    # @param operation Integer: APPEND, REPLACE or DRAIN
+    # @param name String: The series name
+    # @param x Numpy array: The x values
+    # @param y Numpy array: The y values
+    async def _submit(self,operation,name,x,y):
+
+        self._bind()
+        if operation != DRAIN:
+            await self._reserve(x.shape[0])
+        future = self._loop.create_future()
+        self._queue.append([operation,name,x,y,future])
+        self._dispatch()
+        await future
+
+
+    ## Appends points to a series
+    # @param name String: The series name
+    # @param x Double or array-like: The x values
+    # @param y Double or array-like: The y values
+    async def push(self,name,x,y):
+
+        x = np.array(x,dtype=np.float64,ndmin=1).ravel()  # Copied: the caller may reuse its buffers
+        y = np.array(y,dtype=np.float64,ndmin=1).ravel()
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("x and y must have the same number of values")
+        if x.shape[0] == 0:
+            return
+        await self._submit(APPEND,name,x,y)
+
+
+    ## Appends points to several series
+    # @param pointsDict Dictionary: For every series name, a list with the x values and the y values
+    async def pushMany(self,pointsDict):
+
+        await asyncio.gather(*[self.push(k,pointsDict[k][0],pointsDict[k][1]) for k in pointsDict.keys()])
+
+
+    ## Replaces the points of a series
+    # @param name String: The series name
+    # @param x Array-like: The x values
+    # @param y Array-like: The y values
+    async def replace(self,name,x,y):
+
+        x = np.array(x,dtype=np.float64,ndmin=1).ravel()
+        y = np.array(y,dtype=np.float64,ndmin=1).ravel()
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("x and y must have the same number of values")
+        await self._submit(REPLACE,name,x,y)
+
+
+    ## Waits until all the points queued before the call have been applied
+    async def drain(self):
+
+        await self._submit(DRAIN,None,None,None)
+
+
+    ## Hands the queued operations to the manager thread as a single batch, unless a batch is already being applied
+    def _dispatch(self):
+
+        if self._inFlight or not self._queue:
+            return
+
+        entries = self._queue
+        self._queue = []
+        discarded = 0
+        batch = []  # (operation, {name: [x,y]}), consecutive operations of the same kind joined
+        for operation,name,x,y,future in entries:
+            if future.cancelled():
+                discarded += x.shape[0] if x is not None else 0
+                continue
+            if operation == DRAIN:
+                continue
+            if not batch or batch[-1][0] != operation:
+                batch.append((operation,{}))
+            data = batch[-1][1]
+            if operation == APPEND and name in data:
+                data[name][0].append(x)
+                data[name][1].append(y)
+            elif operation == APPEND:
+                data[name] = [[x],[y]]
+            else:
+                data[name] = [x,y]  # Only the latest replace of a series matters
+        for operation,data in batch:
+            if operation == APPEND:
+                for k in data.keys():
+                    data[k] = [np.concatenate(data[k][0]) if len(data[k][0]) > 1 else data[k][0][0],
+                               np.concatenate(data[k][1]) if len(data[k][1]) > 1 else data[k][1][0]]
+        if discarded:
+            self._release(discarded)
+
+        count = sum(e[2].shape[0] for e in entries if e[2] is not None and not e[4].cancelled())
+        futures = [(e[1],e[4]) for e in entries]
+        loop = self._loop
+
+        def done(error,unknown):
+            try:
+                loop.call_soon_threadsafe(self._done,futures,count,error,unknown)
+            except RuntimeError:
+                pass  # The loop has been closed
+
+        self._inFlight = True
+        self._bridge.submitted.emit((batch,done))
+
+
+    ## Completes the operations of an applied batch and hands the next one to the manager
+    # @param futures List: The series name and the future of every operation of the batch
+    # @param count Integer: The number of points of the batch
+    # @param error Exception: The exception raised applying the batch, None on success
+    # @param unknown Set: The names of the series skipped because they do not exist
+    def _done(self,futures,count,error,unknown):
+
+        self._inFlight = False
+        for name,future in futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            elif name in unknown:
+                future.set_exception(ValueError("Unknown series {0}".format(name)))
+            else:
+                future.set_result(None)
+        if count:
+            self._release(count)
+        self._dispatch()
@@ -0,0 +1,137 @@
+from PySide2.QtCore import QObject, Signal, Slot, QTimer
+from functools import partial
+
+from .definitions import LINKINTERVAL
+
+XAXISNAMES = ["bottom","top","logBottom","logTop"]  # The chart axes linked by linkCharts
+YAXISNAMES = ["left","right","logLeft","logRight"]
+
+## Links the axes of several charts: the x axes of the same kind (e.g. all the "bottom" ones) share their range and,
+# optionally, the y axes too
+# @param chartManagers List: The DynamoChartManager of the charts to link
+# @param linkX Boolean: If True the x axes are linked
+# @param linkY Boolean: If True the y axes are linked
+# @param interval Integer: The milliseconds the range changes are gathered before updating the other charts
+# @return List: The DynamoAxisLink created, one for every linked kind of axis
+def linkCharts(chartManagers,linkX=True,linkY=False,interval=LINKINTERVAL):
+
+    links = []
+    for axisName in (XAXISNAMES if linkX else []) + (YAXISNAMES if linkY else []):
+        link = DynamoAxisLink(interval)
+        for chartManager in chartManagers:
+            link.addAxis(chartManager,axisName)
+        links.append(link)
+
+    return links
+
+
+## Class DynamoAxisLink
+# Keeps the range of a set of axes, usually of different charts, in sync: a zoom, pan, reset or autoscale of one of
+# them is applied to all the others. The changes are gathered for an interval (about a frame) and only the latest
+# one is applied, so every other axis gets at most one range update per interval whatever the number of changes
+# (e.g. while dragging). The ranges applied by the link are not propagated again.
+# Only one axis of a link should autoscale: with more, the latest autoscaled range wins
+class DynamoAxisLink(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    rangeSynchronized = Signal(float,float)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param interval Integer: The milliseconds the range changes are gathered before updating the other axes
+    # @param parent QObject: The parent object
+    def __init__(self,interval=LINKINTERVAL,parent=None):
+
+        QObject.__init__(self,parent)
+        self._members = {}  # DynamoAxisManager -> [DynamoChartManager of its chart,function connected to rangeChanged]
+        self._source = None  # The axis manager whose range has to be applied to the others, None if nothing changed
+        self._range = None
+        self._applying = False  # True while the range is applied to the linked axes
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(int(interval),0))
+        self._timer.timeout.connect(self._synchronize)
+
+
+    ## Adds an axis to the link. It takes the range of the link at the next change of any linked axis
+    # @param chartManager DynamoChartManager: The manager of the chart the axis belongs to
+    # @param axisName String: The axis name (e.g. "bottom", see DynamoChartManager.axisManager)
+    def addAxis(self,chartManager,axisName):
+
+        manager = chartManager.axisManager(axisName)
+        if manager is None:
+            raise ValueError("Unknown axis {0}".format(axisName))
+        if manager in self._members:
+            return
+
+        changed = partial(self._changed,manager)
+        manager.rangeChanged.connect(changed)
+        self._members[manager] = [chartManager,changed]
+
+
+    ## Removes an axis from the link
+    # @param chartManager DynamoChartManager: The manager of the chart the axis belongs to
+    # @param axisName String: The axis name
+    def removeAxis(self,chartManager,axisName):
+
+        manager = chartManager.axisManager(axisName)
+        if manager not in self._members:
+            return
+
+        manager.rangeChanged.disconnect(self._members.pop(manager)[1])
+        if self._source is manager:
+            self._source = None
+
+
+    ## Removes all the axes from the link
+    @Slot()
+    def clear(self):
+
+        for manager in list(self._members.keys()):
+            manager.rangeChanged.disconnect(self._members.pop(manager)[1])
+        self._source = None
+        self._timer.stop()
+
+
+    ## Records the range change of a linked axis, to be applied to the other axes when the interval ends
+    # @param manager DynamoAxisManager: The axis manager that changed its range
+    # @param minimum Double: The new axis minimum
+    # @param maximum Double: The new axis maximum
+    def _changed(self,manager,minimum,maximum):
+
+        if self._applying:
+            return  # A consequence of the range being applied, not a change to propagate
+
+        self._source = manager
+        self._range = [minimum,maximum]
+        if not self._timer.isActive():
+            self._timer.start()
+
+
+    ## Applies the latest range change to all the other linked axes. The displayed points of every updated chart are
+    # refreshed once (e.g. the decimated series, see DynamoChartManager.refreshViews)
+    @Slot()
+    def _synchronize(self):
+
+        if self._source is None:
+            return
+
+        source = self._source
+        self._source = None
+        self._applying = True
+        try:
+            refreshed = []
+            for manager in self._members.keys():
+                if manager is source or manager.getRange() is None or manager.getRange() == self._range:
+                    continue
+                manager.setRange(self._range,False)
+                chartManager = self._members[manager][0]
+                if chartManager not in refreshed:
+                    refreshed.append(chartManager)
+            for chartManager in refreshed:
+                chartManager.refreshViews()
+        finally:
+            self._applying = False
+        self.rangeSynchronized.emit(self._range[0],self._range[1])
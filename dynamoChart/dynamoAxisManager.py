@@ -1,12 +1,21 @@
 from PySide2.QtCore import QObject, Signal, Slot, Property, QThread, QPointF, QMutex
 from PySide2.QtCharts import QtCharts
 import numpy as np
+import time
 
-from datetime import datetime
+from .dynamoLimits import DynamoRunningLimits, DynamoWindowLimits
+from .dynamoInstrumentation import DynamoInstrumentation
+from .definitions import AUTOSCALEHEADROOM, AUTOSCALENICETICKS, AUTOSCALESHRINKBAND, AUTOSCALESHRINKDELAY
 
 ## Class DynamoAxisManager
 class DynamoAxisManager(QObject):
 
+    # Signals ----------------------------------------------------------------------- #
+
+    rangeChanged = Signal(float,float)  # Emitted when the manager sets the axis range (e.g. zoom, pan or autoscale)
+
+    # ------------------------------------------------------------------------------- #
+
     ## Class constructor
     # @param parent QObject: The parent object
     # @param inneraxis QAbstractAxis: The axis to manage
@@ -14,12 +23,10 @@ class DynamoAxisManager(QObject):
     # @param inputmax Double: The initial maximum value for the axis
     # @param scalefactor Double: The scale value used to change the axis range when zooming
     # @param verbose Boolean: If True enables a series of print useful for debugging
-    # @param execlog Boolean: If True all the class member functions will print their name when called
+    # @param execlog Boolean: If True the calls of all the class member functions are counted, timed and traced
+    #                         (see stats)
     def __init__(self,parent=None,inneraxis=None,inputmin=0,inputmax=100,scalefactor=2.0,verbose=False,execlog=False):
 
-        if execlog:
-            print('{1}.__init__ called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         QObject.__init__(self,parent)
 
         self._defMax = inputmax
@@ -32,26 +39,32 @@ class DynamoAxisManager(QObject):
         self._pannable = True
         self._registeredSeries = {}  # A dictionary with the following structure:
         #                               - key = registered series name (string)
-        #                               - value = series object (QAbstractSeries) + does the series use the axis as an X axis (boolean)? It's a list
+        #                               - value = series store (DynamoSeriesStore) + does the series use the axis as an X axis (boolean)? It's a list
+        self._seriesLimits = {}  # The cached limits of every registered series along this axis, by series name
+        self._windowedLimits = False  # If True the cached limits follow the points leaving a strip chart window
+        self._windowedSeries = []  # The series whose cached limits always follow a window of their own
+        self._logScale = False  # If True the inner axis is logarithmic: only the positive values are cached
+        self._headroom = AUTOSCALEHEADROOM  # Autoscale growth policy (see setGrowthPolicy)
+        self._niceTicks = AUTOSCALENICETICKS
+        self._shrinkBand = AUTOSCALESHRINKBAND
+        self._shrinkDelay = AUTOSCALESHRINKDELAY
+        self._shrinkSince = None  # When the data entered the smaller range the axis is waiting to shrink to
         self._verbose = verbose
-        self._execLog = execlog
+        self._instrumentation = None  # The DynamoInstrumentation measuring the member functions, None if disabled
+        if execlog:
+            self._instrumentation = DynamoInstrumentation()
+            self._instrumentation.instrument(self,exclude=["stats"])
 
 
     ## Returns the value of firstRound
     def getFirstRound(self):
 
-        if self._execLog:
-            print('{1}.getFirstRound called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._firstRound
 
 
     ## Returns the inner axis
     def getInnerAxis(self):
 
-        if self._execLog:
-            print('{1}.getInnerAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return
 
@@ -61,9 +74,6 @@ class DynamoAxisManager(QObject):
     ## Returns the axis range in the form of a list [min,max]
     def getRange(self):
 
-        if self._execLog:
-            print('{1}.getRange called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return
 
@@ -73,64 +83,98 @@ class DynamoAxisManager(QObject):
     ## Returns the current axis scale factor
     def getScaleFactor(self):
 
-        if self._execLog:
-            print('{1}.getScaleFactor called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return
 
         return self._scaleFactor
 
 
+    ## Returns the autoscale growth policy (see setGrowthPolicy)
+    # @return Dictionary: The "headroom", "niceTicks", "shrinkBand" and "shrinkDelay" values
+    def getGrowthPolicy(self):
+
+        return {"headroom":self._headroom,"niceTicks":self._niceTicks,"shrinkBand":self._shrinkBand,
+                "shrinkDelay":self._shrinkDelay}
+
+
+    ## Returns a snapshot of the instrumentation statistics (see DynamoInstrumentation.stats), an empty dictionary
+    # if the axis manager was not created with execlog
+    # @param trace Boolean: If True the latest calls are returned too
+    def stats(self,trace=False):
+
+        if self._instrumentation is None:
+            return {}
+
+        return self._instrumentation.stats(trace)
+
+
     ## Sets inner axis
     # @param newAxis QAbstractAxis: The new inner axis
     def setInnerAxis(self, newAxis):
 
-        if self._execLog:
-            print('{1}.setInnerAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if not isinstance(newAxis,QtCharts.QAbstractAxis):
             raise TypeError("newAxis parameter has to be a QAbstractAxis")
 
         self._innerAxis = newAxis
+        self._logScale = isinstance(newAxis,QtCharts.QLogValueAxis)
         self.clearAxis()
         self._innerAxis.setVisible(False)
 
 
-    ## Sets the axis range
+    ## Sets the axis range. Minimum and maximum are set with a single call, so the chart is laid out only once
     # @param newRange List: A new set of minimum and maximum for the axis in a list ([min,max])
-    def setRange(self, newRange):
-
-        if self._execLog:
-            print('{1}.setRange called at\t{0}'.format(datetime.now(), type(self).__name__))
+    # @param notify Boolean: If False rangeChanged is not emitted (e.g. for a range coming from a linked axis)
+    def setRange(self, newRange, notify=True):
 
         if self._innerAxis is None or not self.used():
             return
 
-        self._innerAxis.setMin(newRange[0])
-        self._innerAxis.setMax(newRange[1])
+        self._innerAxis.setRange(newRange[0],newRange[1])
+        if notify:
+            self.rangeChanged.emit(self._innerAxis.min(),self._innerAxis.max())
 
 
     ## Sets the scale factor for the axis
     # @param newFactor: The new scale factor to set
     def setScaleFactor(self,newFactor):
 
-        if self._execLog:
-            print('{1}.setScaleFactor called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return
 
         self._scaleFactor = newFactor
 
 
+    ## Sets the policy followed by the axis range while autoscaling. When the data leaves the axis range, the axis
+    # grows past the data by a headroom and, optionally, up to the next tick boundary, so that the following points
+    # fall inside it for a while. The axis shrinks only once the data range is smaller enough than the axis one and
+    # has stayed so for a delay. With the default values a linear axis fits the data exactly, at every autoscale
+    # (a log axis always ends on whole decades)
+    # @param headroom Double: The fraction of the data span left free beyond the data when growing (>= 0)
+    # @param niceTicks Boolean: If True a linear axis ends on multiples of a 1, 2 or 5 tick step
+    # @param shrinkBand Double: The axis shrinks only if the data range is smaller than (1 - shrinkBand) of its span
+    #                           (>= 0 and < 1)
+    # @param shrinkDelay Double: The seconds the data range has to stay that smaller before the axis shrinks (>= 0)
+    def setGrowthPolicy(self,headroom=AUTOSCALEHEADROOM,niceTicks=AUTOSCALENICETICKS,shrinkBand=AUTOSCALESHRINKBAND,
+                        shrinkDelay=AUTOSCALESHRINKDELAY):
+
+        if headroom < 0:
+            raise ValueError("headroom must not be negative")
+        if not 0 <= shrinkBand < 1:
+            raise ValueError("shrinkBand must be in [0,1)")
+        if shrinkDelay < 0:
+            raise ValueError("shrinkDelay must not be negative")
+
+        self._headroom = float(headroom)
+        self._niceTicks = bool(niceTicks)
+        self._shrinkBand = float(shrinkBand)
+        self._shrinkDelay = float(shrinkDelay)
+        self._shrinkSince = None
+
+
     ## Performs a zoom on the innerAxis
     # @param verse Integer: 1 for zoom in and -1 for zoom out
     def zoom(self,verse):
 
-        if self._execLog:
-            print('{1}.zoom called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if verse not in [-1,1]:
             raise ValueError("verse parameter must be either 1 or -1")
         if self._innerAxis is None or not self.used():
@@ -150,9 +194,6 @@ class DynamoAxisManager(QObject):
     # @param nDelta Double: The normalized shift amplitude
     def pan(self,nDelta):
 
-        if self._execLog:
-            print('{1}.pan called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return
         if self.autoscaling:
@@ -166,8 +207,6 @@ class DynamoAxisManager(QObject):
     ## Uses current minimum and maximum of the inner axis as default minimum and maximum
     def fixAxis(self):
 
-        if self._execLog:
-            print('{1}.fixAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
         if self._innerAxis is None:
             return
 
@@ -176,15 +215,16 @@ class DynamoAxisManager(QObject):
 
 
     ## Sets inner axis maximum and minimum to default values
-    def resetAxis(self):
+    # @param notify Boolean: If False rangeChanged is not emitted
+    def resetAxis(self,notify=True):
 
-        if self._execLog:
-            print('{1}.resetAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
         if self._innerAxis is None:
             return
 
-        self._innerAxis.setMax(self._defMax)
-        self._innerAxis.setMin(self._defMin)
+        self._innerAxis.setRange(self._defMin,self._defMax)
+        self._shrinkSince = None
+        if notify and self.used():
+            self.rangeChanged.emit(self._innerAxis.min(),self._innerAxis.max())
         #self._zoomable = True
         #self._pannable = True
         #self._autoScaling = False
@@ -193,9 +233,6 @@ class DynamoAxisManager(QObject):
     ## Tells whether or not the series list is empty
     def used(self):
 
-        if self._execLog:
-            print('{1}.used called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None:
             return False
 
@@ -206,9 +243,6 @@ class DynamoAxisManager(QObject):
     # @param toCheck String: The name of the series to check
     def registered(self, toCheck):
 
-        if self._execLog:
-            print('{1}.registered called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return False
 
@@ -216,31 +250,34 @@ class DynamoAxisManager(QObject):
 
 
     ## Adds a series name to the registered dictionary
-    # @param toAdd QAbstractSeries: The series to add
+    # @param toAdd DynamoSeriesStore: The store of the series to add
     # @param asX Boolean: Tru if the series is using the inner axis as a X axis
-    def addSeries(self,toAdd,asX):
-
-        if self._execLog:
-            print('{1}.addSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
-
-        if self._innerAxis is None or toAdd.name() in self._registeredSeries.keys():
+    # @param name String: The series name, the store one by default (a store shared by several series, e.g. a data
+    #                     registry channel, has its own name)
+    # @param windowed Boolean: If True the oldest points of the store can be removed, whatever the strip chart
+    #                          setting (e.g. a data registry channel with a window), and the cached limits follow them
+    def addSeries(self,toAdd,asX,name=None,windowed=False):
+
+        name = toAdd.name() if name is None else name
+        if self._innerAxis is None or name in self._registeredSeries.keys():
             return
         enteredEmpty = not self.used()
-        self._registeredSeries[toAdd.name()] = [toAdd,asX]
+        self._registeredSeries[name] = [toAdd,asX]
+        if windowed:
+            self._windowedSeries.append(name)
+        self._seriesLimits[name] = self._newLimits(name)
+        self._seriesLimits[name].reset(toAdd.column(asX))
 
         if enteredEmpty:
             self._innerAxis.setVisible(True)
 
 
     ## Adds a series if the axis name specified coincides with the inner axis one
-    # @param toAdd QAbstractSeries: The series to add
+    # @param toAdd DynamoSeriesStore: The store of the series to add
     # @param asX Boolean: Tru if the series is using the inner axis as a X axis
     # @param axisName String: The name of the axis the series uses
     def addIfProper(self,toAdd,asX,axisName):
 
-        if self._execLog:
-            print('{1}.addIfProper called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None:
             return
         elif axisName != self._innerAxis.objectName():
@@ -252,60 +289,121 @@ class DynamoAxisManager(QObject):
     # @param toRemove String: The name of the series to remove
     def removeSeries(self,toRemove):
 
-        if self._execLog:
-            print('{1}.removeSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used() or not self.registered(toRemove):
             return
 
         self._registeredSeries.pop(toRemove,None)
+        self._seriesLimits.pop(toRemove,None)
+        if toRemove in self._windowedSeries:
+            self._windowedSeries.remove(toRemove)
         self._innerAxis.setVisible(self.used())
 
 
     ## Removes all registered series
     def clearAxis(self):
 
-        if self._execLog:
-            print('{1}.clearAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return
 
-        self.resetAxis()
+        self.resetAxis(False)  # The chart is emptied, the linked axes keep their range
         self._registeredSeries = {}
+        self._seriesLimits = {}
+        self._windowedSeries = []
+
+
+    ## Returns a new, empty, limits cache of the kind a series needs
+    # @param seriesName String: The name of the series
+    def _newLimits(self,seriesName):
+
+        if self._windowedLimits or seriesName in self._windowedSeries:
+            return DynamoWindowLimits(self._logScale)
+        return DynamoRunningLimits(self._logScale)
+
+
+    ## Sets whether or not the cached limits have to follow points leaving a strip chart window
+    # @param value Boolean: The value to set
+    def setWindowedLimits(self,value):
+
+        if self._windowedLimits == value:
+            return
+        self._windowedLimits = value
+        for k in self._registeredSeries.keys():
+            self._seriesLimits[k] = self._newLimits(k)
+            self.resetLimits(k)
+
+
+    ## Computes again the cached limits of a registered series from its whole data. When the limits along both the
+    # axes have already been computed (e.g. by a background thread) they are used as they are, unless the cached
+    # limits have to follow a strip chart window. A log axis uses the limits of the positive values
+    # @param seriesName String: The name of the series
+    # @param xLimits List: Optional, the minimum and the maximum of the series x values
+    # @param yLimits List: Optional, the minimum and the maximum of the series y values
+    # @param xPositiveLimits List: Optional, the minimum and the maximum of the positive series x values
+    # @param yPositiveLimits List: Optional, the minimum and the maximum of the positive series y values
+    def resetLimits(self,seriesName,xLimits=None,yLimits=None,xPositiveLimits=None,yPositiveLimits=None):
+
+        if seriesName not in self._seriesLimits:
+            return
+
+        store,asX = self._registeredSeries[seriesName]
+        if self._logScale:
+            xLimits,yLimits = xPositiveLimits,yPositiveLimits
+        limits = xLimits if asX else yLimits
+        if limits is not None and not self._windowedLimits and seriesName not in self._windowedSeries:
+            self._seriesLimits[seriesName].setLimits(limits)
+        else:
+            self._seriesLimits[seriesName].reset(store.column(asX))
+
+
+    ## Updates the cached limits of a registered series with the points just appended to it
+    # @param seriesName String: The name of the series
+    # @param newX Array-like: The x values of the new points
+    # @param newY Array-like: The y values of the new points
+    def updateLimits(self,seriesName,newX,newY):
+
+        if seriesName not in self._seriesLimits:
+            return
+
+        if self._registeredSeries[seriesName][1]:
+            self._seriesLimits[seriesName].update(newX)
+        else:
+            self._seriesLimits[seriesName].update(newY)
+
+
+    ## Updates the cached limits of a registered series after its oldest points have been removed
+    # @param seriesName String: The name of the series
+    # @param count Integer: The number of points removed
+    def trimLimits(self,seriesName,count):
+
+        if seriesName not in self._seriesLimits:
+            return
+
+        self._seriesLimits[seriesName].trim(count)
 
 
     ## Returns the maximum and minimum of a registered series along the proper axis
     # @param seriesName String: The name of the series to query
     def getSeriesLimits(self,seriesName):
 
-        if self._execLog:
-            print('{1}.getSeriesLimits called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used() or not self.registered(seriesName):
             return None
 
-        seriesPoints = self._registeredSeries[seriesName][0].points()
-        if self._registeredSeries[seriesName][1]:
-            toSearch = np.array([p.x() for p in seriesPoints])
-        else:
-            toSearch = np.array([p.y() for p in seriesPoints])
-
+        if not self._seriesLimits[seriesName].valid():
+            self.resetLimits(seriesName)
 
-        return np.min(toSearch),np.max(toSearch)
+        return self._seriesLimits[seriesName].getLimits()
 
 
     ## Change axis range using a certain series limits
     # @param seriesName String: The name of the series to adapt to
     def adaptToSeries(self,seriesName):
 
-        if self._execLog:
-            print('{1}.adaptToSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used() or not self.registered(seriesName):
             return
 
         limits = self.getSeriesLimits(seriesName)
+        if limits is None:
+            return
         self.setRange(limits)
         self._firstRound = False
 
@@ -314,52 +412,135 @@ class DynamoAxisManager(QObject):
     # @param seriesName String: The name of the series to compare
     def autoScaleLemma(self,seriesName):
 
-        if self._execLog:
-            print('{1}.autoScaleLemma called at\t{0}'.format(datetime.now(), type(self).__name__))
+        self.autoScaleSeries([seriesName])
 
-        if self._innerAxis is None or not self.used() or not self.registered(seriesName):
-            return
-        limits = self.getSeriesLimits(seriesName)
-        actualRange = self.getRange()
-        newRange = [min(actualRange[0],limits[0]),max(actualRange[1],limits[1])]
-        self.setRange(newRange)
 
+    ## Performs an autoscaling with respect to a set of series: the range is extended to the limits of all of them
+    # and then set once
+    # @param seriesNames List: The names of the series to compare
+    def autoScaleSeries(self,seriesNames):
 
-    ## Adapt the axis range to the registered series
-    def fitSeries(self):
+        if self._innerAxis is None or not self.used():
+            return
+        dataRange = None
+        for k in seriesNames:
+            limits = self.getSeriesLimits(k) if self.registered(k) else None
+            if limits is None:
+                continue
+            dataRange = limits if dataRange is None else [min(dataRange[0],limits[0]),max(dataRange[1],limits[1])]
+        if dataRange is not None:
+            self._applyPolicy(dataRange,extendOnly=True)
 
-        if self._execLog:
-            print('{1}.fitSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
+
+    ## Adapt the axis range to the registered series, following the growth policy (see setGrowthPolicy)
+    # @param immediate Boolean: If True the axis fits the data at once, without waiting to shrink
+    def fitSeries(self,immediate=False):
 
         newRange = [self.getLowestValue(),self.getHighestValue()]
-        self.setRange(newRange)
+        if None in newRange:
+            return
+        self._applyPolicy(newRange,immediate=immediate)
+
+
+    ## Returns the range an autoscaled axis takes around the data: the data range widened by the headroom on both
+    # sides and, with nice ticks, rounded outwards to the tick step. A log axis is widened in log space and always
+    # rounded outwards to whole decades (powers of the axis base)
+    # @param dataRange List: The minimum and the maximum of the data
+    def _paddedRange(self,dataRange):
+
+        if self._logScale:
+            base = self._innerAxis.base()
+            low,high = np.round(np.log(dataRange)/np.log(base),9)  # Exact powers must not round to the next one
+            span = high - low if high > low else 1.0
+            low = np.floor(low - self._headroom*span)
+            high = max(np.ceil(high + self._headroom*span),low + 1)
+            return [float(base**low),float(base**high)]
+
+        low,high = dataRange
+        span = high - low if high > low else (abs(high) or 1.0)  # A constant series still gets some headroom
+        low -= self._headroom*span
+        high += self._headroom*span
+        if self._niceTicks and high > low and isinstance(self._innerAxis,QtCharts.QValueAxis):
+            step = self._niceStep((high - low)/max(self._innerAxis.tickCount() - 1,1))
+            low = np.floor(low/step)*step
+            high = np.ceil(high/step)*step
+
+        return [float(low),float(high)]
+
+
+    ## Returns the smallest 1, 2 or 5 multiple of a power of ten not smaller than a value
+    # @param value Double: The wanted step (> 0)
+    def _niceStep(self,value):
+
+        magnitude = 10.0**np.floor(np.log10(value))
+        for factor in [1.0,2.0,5.0]:
+            if value <= factor*magnitude:
+                return factor*magnitude
+        return 10.0*magnitude
+
+
+    ## Returns the span of a range along the axis, in log space for a log axis
+    # @param aRange List: The minimum and the maximum of the range
+    def _span(self,aRange):
+
+        if self._logScale:
+            return np.log(aRange[1]/aRange[0])
+        return aRange[1] - aRange[0]
+
+
+    ## Sets the axis range around the data following the growth policy. The sides of the axis the data went beyond
+    # are moved past the data at once, the axis shrinks to the data only if the data range is smaller enough and
+    # has stayed so for the shrink delay. The range is set only when it changes
+    # @param dataRange List: The minimum and the maximum of the data
+    # @param extendOnly Boolean: If True the axis never shrinks
+    # @param immediate Boolean: If True the axis shrinks without waiting for the delay
+    def _applyPolicy(self,dataRange,extendOnly=False,immediate=False):
+
+        current = self.getRange()
+        target = self._paddedRange(dataRange)
+        newRange = [target[0] if dataRange[0] < current[0] else current[0],
+                    target[1] if dataRange[1] > current[1] else current[1]]
+        if extendOnly:
+            self._shrinkSince = None
+        elif target[0] > newRange[0] or target[1] < newRange[1]:
+            if self._span(target) > (1 - self._shrinkBand)*self._span(newRange) and not immediate:
+                self._shrinkSince = None  # The data still fills the axis
+            elif immediate or self._shrinkDelay <= 0:
+                newRange = target
+            elif self._shrinkSince is None:
+                self._shrinkSince = time.monotonic()
+            elif time.monotonic() - self._shrinkSince >= self._shrinkDelay:
+                newRange = target
+        else:
+            self._shrinkSince = None
+        if newRange == target:
+            self._shrinkSince = None
+        if newRange != current:
+            self.setRange(newRange)
 
 
     ## Performs an autoscale with respect to a point
     # @param seriesName String: The name of the series to compare
     def autoScalePoint(self,seriesName):
 
-        if self._execLog:
-            print('{1}.autoScalePoint called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used() or not self.registered(seriesName):
             return None
 
-        self.setRange([self.getLowestValue(),self.getHighestValue()])
+        self.fitSeries()
 
 
     ## Gets the lowest value among all the registered series
     def getLowestValue(self):
 
-        if self._execLog:
-            print('{1}.getLowestValue called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return None
 
         toReturn = None
         for k in self._registeredSeries.keys():
-            tempMin = self.getSeriesLimits(k)[0]
+            limits = self.getSeriesLimits(k)
+            if limits is None:
+                continue
+            tempMin = limits[0]
             if toReturn is None:
                 toReturn = tempMin
             else:
@@ -371,15 +552,15 @@ class DynamoAxisManager(QObject):
     ## Returns the highest value among all the registered series
     def getHighestValue(self):
 
-        if self._execLog:
-            print('{1}.getHighestValue called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None or not self.used():
             return None
 
         toReturn = None
         for k in self._registeredSeries.keys():
-            tempMax = self.getSeriesLimits(k)[1]
+            limits = self.getSeriesLimits(k)
+            if limits is None:
+                continue
+            tempMax = limits[1]
             if toReturn is None:
                 toReturn = tempMax
             else:
@@ -392,9 +573,6 @@ class DynamoAxisManager(QObject):
     # @param title String: The title to set
     def setAxisTitle(self,text):
 
-        if self._execLog:
-            print('{1}.setAxisTitle called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._innerAxis is None:
             return
         self._innerAxis.setTitleText(text)
@@ -403,9 +581,6 @@ class DynamoAxisManager(QObject):
     ## Resets the firstRound value to True
     def prepareForAutoscale(self):
 
-        if self._execLog:
-            print('{1}.prepareForAutoscale called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._firstRound = True
 
 
@@ -413,9 +588,6 @@ class DynamoAxisManager(QObject):
     @property
     def autoscaling(self):
 
-        if self._execLog:
-            print('{1}.autoscaling called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._autoScaling
 
 
@@ -424,9 +596,6 @@ class DynamoAxisManager(QObject):
     @autoscaling.setter
     def autoscaling(self,value):
 
-        if self._execLog:
-            print('{1}.autoscaling called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._autoScaling == value:
             return
         self._pannable = not value
@@ -434,7 +603,7 @@ class DynamoAxisManager(QObject):
 
         if value and not self._autoScaling:
             #self._firstRound = True
-            self.fitSeries()
+            self.fitSeries(immediate=True)
             self.fixAxis()
 
         self._autoScaling = value
@@ -444,9 +613,6 @@ class DynamoAxisManager(QObject):
     @property
     def zoomAllowed(self):
 
-        if self._execLog:
-            print('{1}.zoomAllowed called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._zoomable
 
 
@@ -455,9 +621,6 @@ class DynamoAxisManager(QObject):
     @zoomAllowed.setter
     def zoomAllowed(self, value):
 
-        if self._execLog:
-            print('{1}.zoomAllowed called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._zoomable == value:
             return
         self._zoomable = value
@@ -469,9 +632,6 @@ class DynamoAxisManager(QObject):
     @property
     def panAllowed(self):
 
-        if self._execLog:
-            print('{1}.panAllowed called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._pannable
 
 
@@ -480,9 +640,6 @@ class DynamoAxisManager(QObject):
     @panAllowed.setter
     def panAllowed(self, value):
 
-        if self._execLog:
-            print('{1}.zoomAllowed called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._pannable == value:
             return
         self._pannable = value
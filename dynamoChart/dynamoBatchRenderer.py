@@ -0,0 +1,171 @@
+from PySide2.QtCore import QObject, QUrl, QSizeF, QRectF
+from PySide2.QtGui import QImage, QPainter
+from PySide2.QtWidgets import QApplication, QGraphicsScene
+from PySide2.QtQuick import QQuickView
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
+import time
+
+from .dynamoChartManager import DynamoChartManager
+from .definitions import *
+
+QMLFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),"DynamoRenderView.qml")
+XAXES = ["bottom","top","logBottom","logTop"]  # The names of the DynamoChart axes
+YAXES = ["left","right","logLeft","logRight"]
+AXISPROPERTIES = {"bottom":"xBottom","top":"xTop","logBottom":"xLogBottom","logTop":"xLogTop",
+                  "left":"yLeft","right":"yRight","logLeft":"yLogLeft","logRight":"yLogRight"}  # Manager properties
+
+_application = None  # The QApplication of the current process, created by the first rendered chart
+_view = None  # The QQuickView the charts are loaded into, reused by all the charts of the process. It is never shown
+_manager = None  # The manager of the latest rendered chart, kept alive until the next chart replaces its view
+
+## Prepares the current process for rendering: the platform defaults to offscreen with the software Qt Quick
+# backend, then the QApplication and the view are created. It is the initializer of the renderer workers
+def initRenderer():
+
+    global _application,_view
+
+    if _view is not None:
+        return
+
+    os.environ.setdefault("QT_QPA_PLATFORM","offscreen")
+    os.environ.setdefault("QT_QUICK_BACKEND","software")
+    os.environ.setdefault("QT_QUICK_CONTROLS_STYLE","Material")
+    _application = QApplication.instance() or QApplication([])
+    _view = QQuickView()
+
+
+## Renders a chart to an image file. The chart scene is painted directly into the image, so nothing depends on
+# windows being exposed or on frame timings. It is run by the renderer workers but it can be called in any process
+# without a QApplication of its own
+# @param job Dictionary: The chart to render. It contains:
+#                        - "output": String, the image file to write (the format follows the extension, e.g. png)
+#                        - "series": List, a dictionary for every series with the same features accepted by
+#                          DynamoChartManager.addSeries (plotType included) plus its "x" and "y" values
+#                        - "width", "height": Integer, optional, the image size (RENDERWIDTH x RENDERHEIGHT by default)
+#                        - "title": String, optional, the chart title
+#                        - "labels": Dictionary, optional, the axis titles by axis name (e.g. "bottom", "logLeft")
+#                        - "ranges": Dictionary, optional, the [min,max] range of the axes that must not be
+#                          autoscaled, by axis name. All the other axes are autoscaled on the series
+# @return Dictionary: The "output" file, the "error" message (None on success) and the "setupTime" (series adding
+#                     and data loading), "renderTime" (layout, painting and writing) and "totalTime" in seconds.
+#                     "pid" is the process that rendered the chart and "ranges" the [min,max] range of every
+#                     rendered axis, by axis name
+def renderChart(job):
+
+    global _manager
+
+    start = time.perf_counter()
+    result = {"output":job.get("output"),"error":None,"ranges":{},"setupTime":0.0,"renderTime":0.0,
+              "totalTime":0.0,"pid":os.getpid()}
+    try:
+        initRenderer()
+
+        manager = DynamoChartManager()
+        errors = []
+        manager.errorSignal.connect(errors.append)
+        _view.engine().rootContext().setContextProperty("RenderMng",manager)
+        _view.setSource(QUrl.fromLocalFile(QMLFILE))
+        _manager = manager  # The previous one can go, its chart has been replaced
+        if _view.status() != _view.Ready:
+            raise RuntimeError("; ".join(e.toString() for e in _view.errors()))
+        width = job.get("width",RENDERWIDTH)
+        height = job.get("height",RENDERHEIGHT)
+        root = _view.rootObject()
+        root.setSize(QSizeF(width,height))  # The view is never shown, so it does not size its root item
+        _application.processEvents()  # The plot area, used to decimate the series, follows the new size
+        if job.get("title"):
+            root.findChild(QObject,"renderChart").setProperty("title",job["title"])
+
+        data = {}
+        for series in job["series"]:
+            features = {k:series[k] for k in series.keys() if k not in ["x","y"]}
+            manager.addSeries(features)
+            data[features["name"]] = [series["x"],series["y"]]
+        if errors:
+            raise ValueError("; ".join(errors))
+        ranges = job.get("ranges",{})
+        js = _view.engine().toScriptValue
+        if job.get("labels"):
+            manager.setAxesLabels(js(job["labels"]))
+        manager.replaceSeries(data)
+        # Autoscale is enabled once the data is loaded: enabling it fits the axes to the series, while replaceSeries
+        # alone could only extend the default axes ranges
+        manager.setAutoScale(js({"x":{k:k not in ranges for k in XAXES},"y":{k:k not in ranges for k in YAXES}}))
+        for axisName in ranges.keys():
+            if axisName not in AXISPROPERTIES:
+                raise ValueError("Unknown axis {0}".format(axisName))
+            axis = getattr(manager,AXISPROPERTIES[axisName])
+            if axis is None:
+                raise ValueError("The {0} axis is not used by any series".format(axisName))
+            axis.setProperty("min",ranges[axisName][0])
+            axis.setProperty("max",ranges[axisName][1])
+        if ranges:
+            manager.refreshViews()  # The decimated series follow the explicit ranges
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        rendering = time.perf_counter()
+        result["setupTime"] = rendering - start
+        _application.processEvents()  # The chart lays out its axes and series
+        image = QImage(width,height,QImage.Format_ARGB32)
+        image.fill(0xFFFFFFFF)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        root.findChild(QGraphicsScene).render(painter,QRectF(0,0,width,height),QRectF(0,0,width,height))
+        painter.end()
+        if not image.save(job["output"]):
+            raise OSError("Unable to write {0}".format(job["output"]))
+        for axisName in XAXES + YAXES:
+            axisRange = manager.axisManager(axisName).getRange()
+            if axisRange is not None:
+                result["ranges"][axisName] = [float(axisRange[0]),float(axisRange[1])]
+        result["renderTime"] = time.perf_counter() - rendering
+    except Exception as e:
+        result["error"] = "{0}: {1}".format(type(e).__name__,e)
+    result["totalTime"] = time.perf_counter() - start
+
+    return result
+
+
+## Class DynamoBatchRenderer
+# Renders many charts to image files in parallel. Every worker of the process pool has its own QApplication and view,
+# created once and reused for all the charts it renders (see renderChart). The workers are started with "spawn", so
+# they never inherit the Qt state of the calling process
+class DynamoBatchRenderer(object):
+
+    ## Class constructor
+    # @param workers Integer: The number of worker processes (the number of processors by default)
+    def __init__(self,workers=None):
+
+        self._workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._executor = None
+
+
+    ## Renders a set of charts
+    # @param jobs List: The charts to render (see renderChart)
+    # @param report Callable: If not None, it is called with every result as soon as the chart is rendered
+    # @return List: The result of every chart (see renderChart), in the order of the jobs
+    def render(self,jobs,report=None):
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=max(int(self._workers),1),
+                                                 mp_context=multiprocessing.get_context("spawn"),
+                                                 initializer=initRenderer)
+        futures = {self._executor.submit(renderChart,job):i for i,job in enumerate(jobs)}
+        results = [None]*len(jobs)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if report is not None:
+                report(results[futures[future]])
+
+        return results
+
+
+    ## Stops the worker processes
+    def close(self):
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -1,9 +1,18 @@
-from PySide2.QtCore import QObject, Signal, Slot, Property, QPointF
+from PySide2.QtCore import QObject, Signal, Slot, Property, QPointF, QTimer, QThread, QCoreApplication
 from PySide2.QtCharts import QtCharts
 import numpy as np
-from datetime import datetime
+import time
 
 from .dynamoAxisManager import DynamoAxisManager
+from .dynamoSeriesStore import DynamoSeriesStore
+from .dynamoDecimation import prepareView
+from .dynamoConversion import toPolygon, splitColumns
+from .dynamoPyramid import DynamoPyramid
+from .dynamoWorker import DynamoDoubleBuffer, DynamoPreparationWorker
+from .dynamoInstrumentation import DynamoInstrumentation
+from .dynamoMetrics import DynamoMetrics
+from .dynamoSharedMemory import DynamoSharedReader
+from .dynamoDataRegistry import defaultRegistry
 from .definitions import *
 
 STRIP = True
@@ -20,6 +29,9 @@ class DynamoChartManager(QObject):
     addingSeries = Signal('QVariant')
     errorSignal = Signal(str)
     cleared = Signal()
+    plotWidthChanged = Signal()
+    preparationRequested = Signal(object)
+    metricsChanged = Signal()
 
     # ------------------------------------------------------------------------------- #
 
@@ -28,14 +40,16 @@ class DynamoChartManager(QObject):
     ## Class constructor
     # @param parent QObject: The parent object
     # @param verbose Boolean: If True enables a series of print useful for debugging
-    # @param execlog Boolean: If True all the class member functions will print their name when called
+    # @param execlog Boolean: If True the calls of all the class member functions are counted, timed and traced
+    #                         (see setInstrumentation)
     def __init__(self,parent=None,verbose=False,execlog=False):
 
-        if execlog:
-            print('{1}.__init__ called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         QObject.__init__(self,parent)
         self._seriesDict = {}
+        self._storeDict = {}  # The series stores, by series name. They are the source of truth for the series data
+        self._seriesOptions = {}  # The options ("decimation", "targetPoints" and "plotType") of every series, by name
+        self._seriesAxes = {}  # The x and y axis managers used by every series, by series name
+        self._pyramidDict = {}  # The level of detail index of every series using the "pyramid" decimation, by name
         self._xB = DynamoAxisManager(self,scalefactor=1.28)
         self._yL = DynamoAxisManager(self,scalefactor=1.28)
         self._xT = DynamoAxisManager(self,scalefactor=1.28)
@@ -58,19 +72,89 @@ class DynamoChartManager(QObject):
         self._stripChart = False
         self._stillDrawing = False
         self._interactionEnabled = True
+        self._plotWidth = 0  # The width of the plot area in pixels, 0 when unknown
+        self._culling = False  # If True only the points around the visible x range are sent to the GUI series
+        self._cullingMargin = CULLINGMARGIN
+        self._cullBounds = {}  # The x range sent to the GUI for every culled series, by series name
+        self._preparationThread = None  # When not None, replaced series are prepared by a worker on this thread
+        self._preparationWorker = None
+        self._preparationBuffer = None
+        self._preparing = False  # True while the worker is preparing a job
+        self._nextPreparation = {}  # Series name -> [x chunks,y chunks] waiting for the worker to be free
         self._stripPoints = 0
+        self._stripSpan = 0
+        self._refreshTimer = QTimer(self)  # When active, the incoming data is applied to the chart once per tick
+        self._refreshTimer.timeout.connect(self.flush)
+        self._pendingReplace = {}  # Series name -> [x,y], only the latest replace for each series is kept
+        self._pendingAppend = {}  # Series name -> [list of x chunks,list of y chunks] waiting to be appended
+        self._deferredViews = []  # The LTTB series appended to since their last decimation (see _pushAppended)
+        self._deferTimer = QTimer(self)
+        self._deferTimer.setSingleShot(True)
+        self._deferTimer.setInterval(LTTBINTERVAL)
+        self._deferTimer.timeout.connect(self._pushDeferred)
+        self._sharedReaders = {}  # Series name -> DynamoSharedReader polled on every refresh tick
+        self._registry = None  # The DynamoDataRegistry of the subscribed series, connected at the first subscription
+        self._subscriptions = {}  # Series name -> name of the registry channel the series shows
+        self._pendingChannels = {}  # Subscribed series name -> [added,removed] points of its channel, None if replaced
+        self._metrics = DynamoMetrics()  # It counts the chart updates, the ingested points and the time they take
+        self._metricsValue = {}  # The latest metrics snapshot, published through the metrics property
+        self._metricsTimer = QTimer(self)
+        self._metricsTimer.setInterval(METRICSINTERVAL)
+        self._metricsTimer.timeout.connect(self._publishMetrics)
+        self._metricsTimer.start()
         self._verbose = verbose
-        self._execLog = execlog
+        self._instrumentation = None  # The DynamoInstrumentation measuring the member functions, None if disabled
+        if execlog:
+            self.setInstrumentation(True)
+
+
+    ## Tells whether or not a series exists
+    # @param seriesName String: The series name
+    @Slot(str,result=bool)
+    def hasSeries(self,seriesName):
+
+        return seriesName in self._storeDict
+
+
+    ## Returns a copy of the chart content, to be used (e.g. exported) outside the GUI thread. Only the stored values
+    # are copied, which takes a fraction of the time of reading the GUI series points
+    # @return Dictionary: It contains:
+    #                     - "series": Dictionary, for every series name a dictionary with its "x" and "y" values, its
+    #                       "plotType" and the names of its x and y axis managers ("xAxis" and "yAxis", e.g. "xLogB")
+    #                     - "ranges": Dictionary, the [min,max] range of every axis manager in use, by name
+    def snapshot(self):
+
+        series = {}
+        for k in self._storeDict.keys():
+            series[k] = {"x":self._storeDict[k].x().copy(),
+                         "y":self._storeDict[k].y().copy(),
+                         "plotType":self._seriesOptions[k]["plotType"],
+                         "xAxis":self._seriesAxes[k][0].objectName(),
+                         "yAxis":self._seriesAxes[k][1].objectName()}
+        ranges = {}
+        for manager in [self._xB,self._yL,self._xT,self._yR,self._xLogB,self._yLogL,self._xLogT,self._yLogR]:
+            axisRange = manager.getRange()
+            if axisRange is not None:
+                ranges[manager.objectName()] = [float(axisRange[0]),float(axisRange[1])]
+
+        return {"series":series,"ranges":ranges}
+
+
+    ## Returns the manager of an axis, None if the axis name is unknown
+    # @param axisName String: The name of the axis in the chart ("bottom", "top", "left", "right", "logBottom",
+    #                         "logTop", "logLeft" or "logRight")
+    # @return DynamoAxisManager: The axis manager
+    def axisManager(self,axisName):
+
+        return {"bottom":self._xB,"top":self._xT,"logBottom":self._xLogB,"logTop":self._xLogT,
+                "left":self._yL,"right":self._yR,"logLeft":self._yLogL,"logRight":self._yLogR}.get(axisName)
 
 
     ## Returns the x axis limits for a specific series
     # @param seriesName String: The series to inspect
     def getXLimits(self,seriesName):
 
-        seriesPoints = self._seriesDict[seriesName].points()
-        seriesX = np.array([p.x() for p in seriesPoints])
-
-        return np.min(seriesX),np.max(seriesX)
+        return self._storeDict[seriesName].getLimits(True)
 
 
     ## Manages the autoscaling of a single axis
@@ -78,27 +162,44 @@ class DynamoChartManager(QObject):
     # @param seriesName String: The series to set scale on
     def singleAxisAutoscale(self, manager, seriesName):
 
-        if self._execLog:
-            print('{1}.singleAxisAutoscale called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         manager.autoScaleLemma(seriesName)
 
 
-    ## Performs an autoscaling around a specific series
+    ## Performs an autoscaling around a specific series. Only the axes used by the series are involved
     # @param seriesName String: The series to set scale on
     def seriesWiseAutoscale(self,seriesName):
 
-        if self._execLog:
-            print('{1}.seriesWiseAutoscale called at\t{0}'.format(datetime.now(), type(self).__name__))
+        for manager in self._seriesAxes[seriesName]:
+            if manager.autoscaling:
+                self.singleAxisAutoscale(manager,seriesName)
+                manager.fixAxis()
 
-        for kx in self._assignedX.keys():
-            if self._assignedX[kx].autoscaling:
-                self.singleAxisAutoscale(self._assignedX[kx],seriesName)
-                self._assignedX[kx].fixAxis()
-        for ky in self._assignedY.keys():
-            if self._assignedY[ky].autoscaling:
-                self.singleAxisAutoscale(self._assignedY[ky],seriesName)
-                self._assignedY[ky].fixAxis()
+
+    ## Performs an autoscaling around a set of series whose points have been replaced. Every axis used by the series
+    # is marked as dirty and autoscaled once, on all its series at the same time, with a single range update
+    # @param seriesNames List: The series to set scale on
+    def _batchAutoscale(self,seriesNames):
+
+        dirty = self._dirtyAxes(seriesNames)
+        for manager in dirty.keys():
+            if manager.autoscaling:
+                manager.autoScaleSeries(dirty[manager])
+                manager.fixAxis()
+
+
+    ## Returns the axis managers used by a set of series, with the series using each of them
+    # @param seriesNames List: The series names
+    # @return Dictionary: For every axis manager, the list of the given series that use it
+    def _dirtyAxes(self,seriesNames):
+
+        dirty = {}
+        for k in seriesNames:
+            for manager in self._seriesAxes[k]:
+                if manager not in dirty:
+                    dirty[manager] = []
+                dirty[manager].append(k)
+
+        return dirty
 
 
     ## Performs an autoscale operation on a particular axis when a new point is added or removed
@@ -106,9 +207,6 @@ class DynamoChartManager(QObject):
     # @param seriesName String: The series the point has been added to
     def singleAxisPointScale(self,manager,seriesName):
 
-        if self._execLog:
-            print('{1}.singleAxisPointScale called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         manager.autoScalePoint(seriesName)
 
 
@@ -116,26 +214,447 @@ class DynamoChartManager(QObject):
     # @param seriesName String: The series the point has been added to
     def pointWiseAutoscale(self,seriesName):
 
-        if self._execLog:
-            print('{1}.pointwiseAutoscale called at\t{0}'.format(datetime.now(), type(self).__name__))
+        for manager in self._seriesAxes[seriesName]:
+            if manager.autoscaling:
+                self.singleAxisPointScale(manager,seriesName)
+                manager.fixAxis()
+
+
+    ## Computes again, on its axes, the cached limits of a series from its whole data
+    # @param seriesName String: The series whose data changed
+    # @param xLimits List: Optional, the already computed minimum and maximum of the series x values
+    # @param yLimits List: Optional, the already computed minimum and maximum of the series y values
+    # @param xPositiveLimits List: Optional, the already computed limits of the positive x values (for log axes)
+    # @param yPositiveLimits List: Optional, the already computed limits of the positive y values (for log axes)
+    def _resetSeriesLimits(self,seriesName,xLimits=None,yLimits=None,xPositiveLimits=None,yPositiveLimits=None):
+
+        for manager in self._seriesAxes[seriesName]:
+            manager.resetLimits(seriesName,xLimits,yLimits,xPositiveLimits,yPositiveLimits)
+
+
+    ## Updates, on its axes, the cached limits of a series with the points just appended to it
+    # @param seriesName String: The series the points have been added to
+    # @param newX Array-like: The x values of the new points
+    # @param newY Array-like: The y values of the new points
+    def _updateSeriesLimits(self,seriesName,newX,newY):
+
+        for manager in self._seriesAxes[seriesName]:
+            manager.updateLimits(seriesName,newX,newY)
+
+
+    ## Updates, on its axes, the cached limits of a series after its oldest points have been removed
+    # @param seriesName String: The series the points have been removed from
+    # @param count Integer: The number of removed points
+    def _trimSeriesLimits(self,seriesName,count):
+
+        for manager in self._seriesAxes[seriesName]:
+            manager.trimLimits(seriesName,count)
+
+
+    ## Replaces all the points of a series store
+    # @param seriesName String: The series to replace the points of
+    # @param newX Array-like: The new x values
+    # @param newY Array-like: The new y values
+    def _storeReplace(self,seriesName,newX,newY):
+
+        self._storeDict[seriesName].replace(newX,newY)
+        self._metrics.countPoints(self._storeDict[seriesName].count())
+        self._resetSeriesLimits(seriesName)
+        if seriesName in self._pyramidDict:
+            self._pyramidDict[seriesName].reset(self._storeDict[seriesName].y())
+
+
+    ## Appends one or more points to a series store, then applies the strip chart window
+    # @param seriesName String: The series to append the points to
+    # @param newX Double or array-like: The x values of the new points
+    # @param newY Double or array-like: The y values of the new points
+    # @return List: The number of points added and the number of points removed by the strip chart window
+    def _storeAppend(self,seriesName,newX,newY):
+
+        store = self._storeDict[seriesName]
+        oldCount = store.count()
+        store.append(newX,newY)
+        added = store.count() - oldCount
+        if added == 0:
+            return [0,0]
+        self._metrics.countPoints(added)
+        self._updateSeriesLimits(seriesName,store.x()[-added:],store.y()[-added:])
+        removed = self._applyStrip(seriesName)
+        if seriesName in self._pyramidDict:
+            self._pyramidDict[seriesName].trim(removed)  # Only the buckets of the removed points are dropped
+            self._pyramidDict[seriesName].update(store.y())
+
+        return [added,removed]
+
+
+    ## Sends the data of a series store to the GUI series
+    # @param seriesName String: The series to send
+    # @param appended Integer: If not None (and not above APPENDLIMIT) only this number of newest points is appended
+    #                          to the GUI series, otherwise all the GUI series points are replaced at once
+    def _pushSeries(self,seriesName,appended=None):
+
+        store = self._storeDict[seriesName]
+        start = time.perf_counter()
+        toAppend = False  # True if the points are appended to the GUI series instead of replacing its points
+        if self._culled(seriesName):
+            if appended is not None and self._insideCullBounds(seriesName) and \
+                    store.x()[store.count() - appended] > self._cullBounds[seriesName][1]:
+                return  # The new points are far from the visible range
+            points = self._viewPoints(seriesName)
+        elif self._seriesOptions[seriesName]["decimation"] != NODECIMATION:
+            points = self._viewPoints(seriesName)
+        elif appended is None or appended > APPENDLIMIT:
+            points = self._viewPoints(seriesName) if seriesName in self._subscriptions else store.toPoints()
+        elif appended > 0:
+            points = store.toPoints(store.count() - appended)
+            toAppend = True
+        else:
+            return
+        converted = time.perf_counter()
+        self._metrics.addConversion(converted - start)
 
-        for kx in self._assignedX.keys():
-            if self._assignedX[kx].autoscaling:
-                self.singleAxisPointScale(self._assignedX[kx],seriesName)
-                self._assignedX[kx].fixAxis()
-        for ky in self._assignedY.keys():
-            if self._assignedY[ky].autoscaling:
-                self.singleAxisPointScale(self._assignedY[ky],seriesName)
-                self._assignedY[ky].fixAxis()
+        if toAppend:
+            self._seriesDict[seriesName].append(points)
+        else:
+            self._seriesDict[seriesName].replace(points)
+        self._metrics.addReplace(time.perf_counter() - converted)
+
+
+    ## Returns the display settings of a series (see prepareView), given its options and the current axes ranges
+    # @param seriesName String: The series to display
+    def _viewSettings(self,seriesName):
+
+        xManager = self._seriesAxes[seriesName][0]
+        return {"decimation":self._seriesOptions[seriesName]["decimation"],
+                "targetPoints":self._seriesOptions[seriesName]["targetPoints"],
+                "range":xManager.getRange(),
+                "width":self._plotWidth,
+                "logScale":isinstance(xManager.getInnerAxis(),QtCharts.QLogValueAxis),
+                "culling":self._culling,
+                "margin":self._cullingMargin}
+
+
+    ## Returns the x and y values to display for a series, given its display options and the current axes ranges
+    # @param seriesName String: The series to display
+    # @return List: The x values and the y values to send to the GUI series
+    def _seriesView(self,seriesName):
+
+        store = self._storeDict[seriesName]
+        viewX,viewY,bounds = prepareView(store.x(),store.y(),self._viewSettings(seriesName),
+                                         self._pyramidDict.get(seriesName),store.isSorted())
+        if bounds is not None:
+            self._cullBounds[seriesName] = bounds
+
+        return viewX,viewY
+
+
+    ## Returns the points to display for a series as a QPolygonF. The points of a subscribed series are prepared by
+    # its channel, once for all the series showing the same view of it
+    # @param seriesName String: The series to display
+    def _viewPoints(self,seriesName):
+
+        if seriesName not in self._subscriptions:
+            return toPolygon(*self._seriesView(seriesName))
+
+        channel = self._registry.channel(self._subscriptions[seriesName])
+        points,bounds = channel.view(self._viewSettings(seriesName))
+        if bounds is not None:
+            self._cullBounds[seriesName] = bounds
+
+        return points
+
+
+    ## Tells whether or not the points displayed for a series depend on the axes ranges
+    # @param seriesName String: The series to check
+    def _viewDependent(self,seriesName):
+
+        return self._seriesOptions[seriesName]["decimation"] in [MINMAX,PYRAMID] or self._culled(seriesName)
+
+
+    ## Tells whether or not only the points around the visible x range of a series are sent to the GUI
+    # @param seriesName String: The series to check
+    def _culled(self,seriesName):
+
+        return self._culling and self._seriesOptions[seriesName]["decimation"] in [NODECIMATION,LTTB] and \
+               self._storeDict[seriesName].isSorted()
+
+
+    ## Tells whether or not the range sent to the GUI for a culled series still fits its visible x range: it has to
+    # contain the visible range and not to be much wider than needed (e.g. after zooming in)
+    # @param seriesName String: The series to check
+    def _insideCullBounds(self,seriesName):
+
+        xRange = self._seriesAxes[seriesName][0].getRange()
+        if seriesName not in self._cullBounds or xRange is None:
+            return False
+
+        bounds = self._cullBounds[seriesName]
+        if xRange[0] < bounds[0] or bounds[1] < xRange[1]:
+            return False
+
+        return bounds[1] - bounds[0] <= 2*(1 + 2*self._cullingMargin)*(xRange[1] - xRange[0])
+
+
+    ## Appends one or more points to a series store, autoscales the axes and updates the GUI series
+    # @param seriesName String: The series to append the points to
+    # @param newX Double or array-like: The x values of the new points
+    # @param newY Double or array-like: The y values of the new points
+    def _appendPoints(self,seriesName,newX,newY):
+
+        added,removed = self._storeAppend(seriesName,newX,newY)
+        start = time.perf_counter()
+        self.pointWiseAutoscale(seriesName)
+        self._metrics.addAutoscale(time.perf_counter() - start)
+        if removed > 0:
+            self._pushAppended(seriesName,None)  # The whole strip chart window is sent at once
+        else:
+            self._pushAppended(seriesName,added)
+
+
+    ## Sends to the GUI a series whose points were appended. The LTTB decimation runs on all the points of the series,
+    # so without a refresh rate a LTTB series is not decimated at every append: the appends are gathered for
+    # LTTBINTERVAL milliseconds and the series is decimated and sent once. With a refresh rate this already happens
+    # once per tick
+    # @param seriesName String: The series appended to
+    # @param appended Integer: The number of points appended to the GUI series, None to replace them all (see
+    #                          _pushSeries)
+    def _pushAppended(self,seriesName,appended):
+
+        if self._seriesOptions[seriesName]["decimation"] != LTTB or self._refreshTimer.isActive():
+            self._pushSeries(seriesName,appended)
+            return
+
+        if seriesName not in self._deferredViews:
+            self._deferredViews.append(seriesName)
+        if not self._deferTimer.isActive():
+            self._deferTimer.start()
+
+
+    ## Decimates and sends to the GUI the LTTB series appended to during the last LTTBINTERVAL
+    @Slot()
+    def _pushDeferred(self):
+
+        deferred = self._deferredViews
+        self._deferredViews = []
+        for k in deferred:
+            if k in self._seriesDict:
+                self._pushSeries(k)
+
+
+    ## Sends a set of replaced series to the preparation worker. If the worker is busy they wait for it, the latest
+    # data of every series replacing the older one
+    # @param replaced Dictionary: For every series name, a list with the list of x chunks and the list of y chunks
+    def _requestPreparation(self,replaced):
+
+        if self._preparing:
+            self._nextPreparation.update(replaced)
+            return
+
+        settings = {}
+        for k in replaced.keys():
+            if k in self._seriesDict:
+                settings[k] = self._viewSettings(k)
+        if not settings:
+            return
+        self._preparing = True
+        self.preparationRequested.emit({"data":{k:replaced[k] for k in settings.keys()},"settings":settings})
+
+
+    ## Applies the series prepared by the worker: only the store swap, the autoscale and the GUI series replace are
+    # performed on the GUI thread
+    @Slot()
+    def _consumePrepared(self):
+
+        self._preparing = False
+        results = self._preparationBuffer.take() if self._preparationBuffer is not None else None
+        if results:
+            self._metrics.countUpdate()
+            adopted = [k for k in results.keys() if k in self._storeDict]
+            for k in adopted:
+                prepared = results[k]
+                self._storeDict[k].adopt(prepared["x"],prepared["y"],prepared["sorted"])
+                self._metrics.countPoints(prepared["x"].shape[0])
+                self._metrics.addConversion(prepared["conversionTime"])
+                self._resetSeriesLimits(k,prepared["xLimits"],prepared["yLimits"],prepared["xPositiveLimits"],
+                                        prepared["yPositiveLimits"])
+                if k in self._pyramidDict and prepared["pyramid"] is not None:
+                    self._pyramidDict[k] = prepared["pyramid"]
+            start = time.perf_counter()
+            self._batchAutoscale(adopted)
+            self._metrics.addAutoscale(time.perf_counter() - start)
+            for k in adopted:
+                prepared = results[k]
+                if self._viewSettings(k) == prepared["settings"]:
+                    if prepared["bounds"] is not None:
+                        self._cullBounds[k] = prepared["bounds"]
+                    start = time.perf_counter()
+                    self._seriesDict[k].replace(prepared["points"])
+                    self._metrics.addReplace(time.perf_counter() - start)
+                else:
+                    self._pushSeries(k)  # The axes changed while the worker was preparing the points
+
+        if self._nextPreparation:
+            pending = self._nextPreparation
+            self._nextPreparation = {}
+            self._requestPreparation(pending)
+
+
+    ## Queues one or more points to be appended on the next refresh tick
+    # @param seriesName String: The series to append the points to
+    # @param newX Double or array-like: The x values of the new points
+    # @param newY Double or array-like: The y values of the new points
+    def _queueAppend(self,seriesName,newX,newY):
+
+        if seriesName not in self._pendingAppend:
+            self._pendingAppend[seriesName] = [[],[]]
+        self._pendingAppend[seriesName][0].append(np.ravel(np.asarray(newX,dtype=np.float64)))
+        self._pendingAppend[seriesName][1].append(np.ravel(np.asarray(newY,dtype=np.float64)))
+
+
+    ## Queues the points written to the shared memory channels since the last refresh tick (see
+    # DynamoSharedReader.read). The points overwritten by a producer before being read are reported
+    def _pollShared(self):
+
+        for k in self._sharedReaders.keys():
+            reader = self._sharedReaders[k]
+            lost = reader.lost()
+            newX,newY = reader.read()
+            if reader.lost() > lost:
+                self.errorSignal.emit("{0} points of series {1} were overwritten before being read".format(
+                    reader.lost() - lost,k))
+            if newX.shape[0] > 0:
+                self._queueAppend(k,newX,newY)
+
+
+    ## Returns the data registry of the subscribed series, connecting it at the first call
+    def _dataRegistry(self):
+
+        if self._registry is None:
+            self.setDataRegistry(defaultRegistry())
+
+        return self._registry
+
+
+    ## Makes a series use another store, registering it again on its axes
+    # @param seriesName String: The series
+    # @param store DynamoSeriesStore: The store of the series data
+    # @param windowed Boolean: If True the oldest points of the store can be removed (a windowed channel)
+    def _useStore(self,seriesName,store,windowed=False):
+
+        self._storeDict[seriesName] = store
+        for manager,asX in zip(self._seriesAxes[seriesName],[True,False]):
+            manager.removeSeries(seriesName)
+            manager.addSeries(store,asX,seriesName,windowed)
+
+
+    ## Sends to their channels the data of the subscribed series: the channels notify all their subscribers
+    # @param dataDict Dictionary: The series names as keys and their points as values
+    # @param replace Boolean: If True the channel points are replaced, otherwise the points are appended
+    # @return Dictionary: The points of the series that are not subscribed
+    def _forwardToChannels(self,dataDict,replace):
+
+        if not self._subscriptions:
+            return dataDict
+
+        forwarded = {self._subscriptions[k]:dataDict[k] for k in dataDict.keys() if k in self._subscriptions}
+        if forwarded and replace:
+            self._registry.replaceChannels(forwarded)
+        elif forwarded:
+            self._registry.appendChannels(forwarded)
+
+        return {k:dataDict[k] for k in dataDict.keys() if k not in self._subscriptions}
+
+
+    ## Queues the subscribed series of an updated channel, which are sent to the GUI on the next refresh tick or at
+    # once if the manager has no refresh rate
+    # @param channelName String: The updated channel
+    # @param change List: The number of points added and removed, None if the channel points have been replaced
+    @Slot(str,object)
+    def _channelUpdated(self,channelName,change):
+
+        names = [k for k in self._subscriptions.keys() if self._subscriptions[k] == channelName]
+        if not names:
+            return
+
+        for k in names:
+            if change is None or self._pendingChannels.get(k,[0,0]) is None:
+                self._pendingChannels[k] = None  # The channel points have been replaced
+            else:
+                pending = self._pendingChannels.get(k,[0,0])
+                self._pendingChannels[k] = [pending[0] + change[0],pending[1] + change[1]]
+        if not self._refreshTimer.isActive():
+            self.flush()
+
+
+    ## Unsubscribes the series of a removed channel
+    # @param channelName String: The removed channel
+    @Slot(str)
+    def _channelRemoved(self,channelName):
+
+        for k in [k for k in self._subscriptions.keys() if self._subscriptions[k] == channelName]:
+            self.unsubscribeSeries(k)
+
+
+    ## Updates, on its axes, the cached limits of a subscribed series after its channel changed. The limits of a
+    # replaced channel are computed once for all its subscribers, the ones of a channel appended to follow the
+    # points added and the ones removed by its window, as a strip chart does
+    # @param seriesName String: The subscribed series
+    # @param change List: The number of points added to the channel and removed by its window, None if the points
+    #                     have been replaced
+    def _syncChannelLimits(self,seriesName,change):
+
+        channel = self._registry.channel(self._subscriptions[seriesName])
+        if change is None:
+            self._resetSeriesLimits(seriesName,*channel.limits())
+            return
+
+        store = channel.store()
+        kept = min(change[0],store.count())  # The window can remove some of the newest points too
+        self._trimSeriesLimits(seriesName,change[1] - (change[0] - kept))
+        self._updateSeriesLimits(seriesName,store.x()[store.count() - kept:],store.y()[store.count() - kept:])
+
+
+    ## Autoscales, once, every axis used by the series changed during a refresh tick. The axes that received new
+    # points are fitted to all their series, the other ones are extended to the replaced series
+    # @param replacedNames List: The names of the series whose points have been replaced
+    # @param appendedNames List: The names of the series that received new points
+    def _frameAutoscale(self,replacedNames,appendedNames):
+
+        replacedAxes = self._dirtyAxes(replacedNames)
+        appendedAxes = self._dirtyAxes(appendedNames)
+        for manager in set(replacedAxes.keys()) | set(appendedAxes.keys()):
+            if not manager.autoscaling:
+                continue
+            if manager in appendedAxes:
+                manager.fitSeries()
+            else:
+                manager.autoScaleSeries(replacedAxes[manager])
+            manager.fixAxis()
+
+
+    ## Removes from a series store the points that left the strip chart window
+    # @param seriesName String: The series to trim
+    # @return Integer: The number of removed points
+    def _applyStrip(self,seriesName):
+
+        if not self._stripChart:
+            return 0
+
+        removed = 0
+        if self._stripPoints > 0:
+            removed += self._storeDict[seriesName].trimToCount(self._stripPoints)
+        if self._stripSpan > 0:
+            removed += self._storeDict[seriesName].trimToSpan(self._stripSpan)
+        if removed > 0:
+            self._trimSeriesLimits(seriesName,removed)
+
+        return removed
 
 
     ## Returns the axis managed by the provided manager
     # @param manager DynamoAxisManager: The wanted manager
     def _getManagedAxis(self,manager):
 
-        if self._execLog:
-            print('{1}._getManagedAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return manager.getInnerAxis()
 
 
@@ -145,9 +664,6 @@ class DynamoChartManager(QObject):
     # @param isX Boolean: If True the axis is an X axis, if False is an Y one
     def _setManagedAxis(self,manager, managed, isX):
 
-        if self._execLog:
-            print('{1}._setManagedAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if managed == manager.getInnerAxis():
             return
         if manager.getInnerAxis() is not None:
@@ -172,14 +688,23 @@ class DynamoChartManager(QObject):
     @Slot()
     def clear(self):
 
-        if self._execLog:
-            print('{1}.clear called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         for k in self._assignedX.keys():
             self._assignedX[k].clearAxis()
         for k in self._assignedY.keys():
             self._assignedY[k].clearAxis()
         self._seriesDict = {}
+        self._storeDict = {}
+        self._seriesOptions = {}
+        self._seriesAxes = {}
+        self._pyramidDict = {}
+        self._cullBounds = {}
+        self._pendingReplace = {}
+        self._pendingAppend = {}
+        self._nextPreparation = {}
+        self._subscriptions = {}
+        self._pendingChannels = {}
+        for k in list(self._sharedReaders.keys()):
+            self.detachSharedSeries(k)
         self.cleared.emit()
 
 
@@ -187,9 +712,15 @@ class DynamoChartManager(QObject):
     @Slot()
     def emptySeries(self):
 
-        if self._execLog:
-            print('{1}.emptySeries called at\t{0}'.format(datetime.now(), type(self).__name__))
+        self._pendingReplace = {}
+        self._pendingAppend = {}
+        for k in list(self._subscriptions.keys()):
+            self._unsubscribe(k,False)  # The channel keeps its points for the other subscribers
         for k in self._seriesDict.keys():
+            self._storeDict[k].clear()
+            self._resetSeriesLimits(k)
+            if k in self._pyramidDict:
+                self._pyramidDict[k].reset(self._storeDict[k].y())
             self._seriesDict[k].removePoints(0,self._seriesDict[k].count())
 
 
@@ -198,8 +729,6 @@ class DynamoChartManager(QObject):
     @Slot('QVariant')
     def fixAxes(self,qAxesSet):
 
-        if self._execLog:
-            print('{1}.fixAxes called at\t{0}'.format(datetime.now(), type(self).__name__))
         axesSet = qAxesSet.toVariant()
                                                                                                                                                                                                                                                                                                                                         
         for a in axesSet["x"]:
@@ -212,9 +741,6 @@ class DynamoChartManager(QObject):
     @Slot()
     def fixAllAxes(self):
 
-        if self._execLog:
-            print('{1}.fixAllAxes called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         for k in self._assignedX.keys():
             self._assignedX[k].fixAxis()
         for k in self._assignedY.keys():
@@ -225,13 +751,11 @@ class DynamoChartManager(QObject):
     @Slot()
     def resetAllAxis(self):
 
-        if self._execLog:
-            print('{1}.resetAllAxis called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         for k in self._assignedX.keys():
             self._assignedX[k].resetAxis()
         for k in self._assignedY.keys():
             self._assignedY[k].resetAxis()
+        self.refreshViews()
 
 
     ## Sends the info needed to add a series to the managed QML object
@@ -239,12 +763,12 @@ class DynamoChartManager(QObject):
     @Slot(dict)
     def addSeries(self,seriesFeatures):
 
-        if self._execLog:
-            print('{1}.addSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if seriesFeatures["type"] not in ALLOWED.keys():
             self.errorSignal.emit("Wrong series type")
             return
+        if seriesFeatures.get("decimation",NODECIMATION) not in DECIMATIONS:
+            self.errorSignal.emit("Wrong decimation mode")
+            return
         seriesFeatures["type"] = ALLOWED[seriesFeatures["type"]]  # The series type, in qml is a number and, since for
         #                                                           clarity sake the "type" value in the input
         #                                                           dictionary is a string that report a human readable
@@ -259,40 +783,45 @@ class DynamoChartManager(QObject):
     @Slot('QVariant')
     def registerSeries(self,qSeriesFeatures):
         
-        if self._execLog:
-            print('{1}.registerSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         seriesFeatures = qSeriesFeatures.toVariant()
 
-        self._seriesDict[seriesFeatures["series"].name()] = seriesFeatures["series"]
+        seriesName = seriesFeatures["series"].name()
+        store = DynamoSeriesStore(seriesName)
+        self._seriesDict[seriesName] = seriesFeatures["series"]
+        self._storeDict[seriesName] = store
+        self._seriesOptions[seriesName] = {"decimation":seriesFeatures.get("decimation",NODECIMATION),
+                                           "targetPoints":seriesFeatures.get("targetPoints",LTTBPOINTS),
+                                           "plotType":seriesFeatures["plotType"]}
+        if self._seriesOptions[seriesName]["decimation"] == PYRAMID:
+            self._pyramidDict[seriesName] = DynamoPyramid()
         if seriesFeatures["bottom"]:
             if seriesFeatures["plotType"] == "loglog" or seriesFeatures["plotType"] == "loglin":
-                self._xLogB.addSeries(seriesFeatures["series"],True)
+                xManager = self._xLogB
             else:
-                self._xB.addSeries(seriesFeatures["series"],True)
+                xManager = self._xB
         else:
             if seriesFeatures["plotType"] == "loglog" or seriesFeatures["plotType"] == "loglin":
-                self._xLogT.addSeries(seriesFeatures["series"],True)
+                xManager = self._xLogT
             else:
-                self._xT.addSeries(seriesFeatures["series"],True)
+                xManager = self._xT
         if seriesFeatures["left"]:
             if seriesFeatures["plotType"] == "loglog" or seriesFeatures["plotType"] == "linlog":
-                self._yLogL.addSeries(seriesFeatures["series"],False)
+                yManager = self._yLogL
             else:
-                self._yL.addSeries(seriesFeatures["series"],False)
+                yManager = self._yL
         else:
             if seriesFeatures["plotType"] == "loglog" or seriesFeatures["plotType"] == "linlog":
-                self._yLogR.addSeries(seriesFeatures["series"],False)
+                yManager = self._yLogR
             else:
-                self._yR.addSeries(seriesFeatures["series"],False)
+                yManager = self._yR
+        xManager.addSeries(store,True)
+        yManager.addSeries(store,False)
+        self._seriesAxes[seriesName] = [xManager,yManager]
 
 
     @Slot('QVariant')
     def zoom(self,qZoomDict):
         
-        if self._execLog:
-            print('{1}.zoom called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         zoomDict = qZoomDict.toVariant()
         for k in self._assignedX.keys():
             if self._assignedX[k].zoomAllowed:
@@ -300,6 +829,7 @@ class DynamoChartManager(QObject):
         for k in self._assignedY.keys():
             if self._assignedY[k].zoomAllowed:
                 self._assignedY[k].zoom(zoomDict["verse"])
+        self.refreshViews()
 
 
     ## Performs a pan on the x direction
@@ -307,14 +837,13 @@ class DynamoChartManager(QObject):
     @Slot('QVariant')
     def panX(self,qPanXDict):
 
-        if self._execLog:
-            print('{1}.panX called at\t{0}'.format(datetime.now(), type(self).__name__))
         panXDict = qPanXDict.toVariant()
         for k in self._assignedX.keys():
             if self._verbose:
                 print("Is it allowed on {0}? {1}".format(k,self._assignedX[k].panAllowed))
             if self._assignedX[k].panAllowed:
                 self._assignedX[k].pan(panXDict["normDelta"])
+        self.refreshViews()
 
 
     ## Performs a pan on the y direction
@@ -322,8 +851,6 @@ class DynamoChartManager(QObject):
     @Slot('QVariant')
     def panY(self, qPanYDict):
 
-        if self._execLog:
-            print('{1}.panY called at\t{0}'.format(datetime.now(), type(self).__name__))
         panYDict = qPanYDict.toVariant()
         for k in self._assignedY.keys():
             if self._assignedY[k].panAllowed:
@@ -332,27 +859,38 @@ class DynamoChartManager(QObject):
 
     ## Replaces all series points with new ones
     # @param inputDict Dictionary: A dictionary containing the series names as keys and a list with x values list and an y values one
+    #                             (or an interleaved numpy array of n rows (x,y))
     @Slot(dict)
     def replaceSeries(self,inputDict):
 
-        if self._execLog:
-            print('{1}.replaceSeries called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         if self._verbose:
             print("To replace: {0}".format(inputDict))
 
+        inputDict = self._forwardToChannels(inputDict,True)
+        if not inputDict:
+            return
+        columns = {k:splitColumns(inputDict[k]) for k in inputDict.keys()}
+        if self._refreshTimer.isActive():
+            for k in columns.keys():
+                self._pendingReplace[k] = columns[k]
+                self._pendingAppend.pop(k,None)  # The replace makes the points still waiting useless
+            return
+        if self._preparationThread is not None:
+            self._requestPreparation({k:[[columns[k][0]],[columns[k][1]]] for k in columns.keys()})
+            return
+
         if self._stillDrawing:
+            self._metrics.countDropped()
             return
         self._stillDrawing = True
-        for k in inputDict.keys():
-            points = []
-            newX = inputDict[k][0]
-            newY = inputDict[k][1]
-            for i in range(len(newX)):
-                point = QPointF(newX[i], newY[i])
-                points.append(point)
-            self._seriesDict[k].replace(points)
-            self.seriesWiseAutoscale(k)
+        self._metrics.countUpdate()
+        for k in columns.keys():
+            self._storeReplace(k,columns[k][0],columns[k][1])
+        start = time.perf_counter()
+        self._batchAutoscale(list(columns.keys()))
+        self._metrics.addAutoscale(time.perf_counter() - start)
+        for k in columns.keys():
+            self._pushSeries(k)
         self._stillDrawing = False
 
 
@@ -361,15 +899,293 @@ class DynamoChartManager(QObject):
     @Slot(dict)
     def addPoint(self,newPointsDict):
 
-        if self._execLog:
-            print('{1}.addPoint called at\t{0}'.format(datetime.now(), type(self).__name__))
+        newPointsDict = self._forwardToChannels(newPointsDict,False)
+        if not newPointsDict:
+            return
+        if self._refreshTimer.isActive():
+            for k in newPointsDict.keys():
+                self._queueAppend(k,*newPointsDict[k])
+            return
+
+        self._metrics.countUpdate()
+        for k in newPointsDict.keys():
+            self._appendPoints(k,*newPointsDict[k])
+
 
+    ## Adds a batch of points to one or more series. Every series is appended to at once and autoscaled only once
+    # per batch
+    # @param newPointsDict Dictionary: The keys are the series names and the values are lists with the x values and
+    #                                  the y values (lists or numpy arrays) of the new points
+    @Slot(dict)
+    def addPoints(self,newPointsDict):
+
+        newPointsDict = self._forwardToChannels(newPointsDict,False)
+        if not newPointsDict:
+            return
+        if self._refreshTimer.isActive():
+            for k in newPointsDict.keys():
+                self._queueAppend(k,newPointsDict[k][0],newPointsDict[k][1])
+            return
+
+        self._metrics.countUpdate()
         for k in newPointsDict.keys():
-            self._seriesDict[k].append(*newPointsDict[k])
-            if self._stripChart:
-                if self._seriesDict[k].count() > self._stripPoints:
-                    self._seriesDict[k].remove(0)
-            self.pointWiseAutoscale(k)
+            self._appendPoints(k,newPointsDict[k][0],newPointsDict[k][1])
+
+
+    ## Sets how many times per second the incoming data is applied to the chart.
+    # With a positive rate replaceSeries, addPoint and addPoints only queue their data: on every tick the latest
+    # replace of each series and all the queued points are applied, and the axes are autoscaled once.
+    # A rate of 0 applies every call immediately (default), except that the series decimated with LTTB are decimated
+    # again at most once every LTTBINTERVAL milliseconds (see _pushAppended)
+    # @param rate Double: The refresh rate in Hz
+    @Slot(float)
+    def setRefreshRate(self,rate):
+
+        if rate > 0:
+            self._refreshTimer.start(max(int(round(1000.0/rate)),1))
+        else:
+            self._refreshTimer.stop()
+            self.flush()
+
+
+    ## Feeds a series from a shared memory channel written by another process (see DynamoSharedProducer). The channel
+    # is polled on every refresh tick and its new points are appended to the series; if the manager has no refresh
+    # rate, SHAREDPOLLRATE is set. The points still in the channel ring buffer are appended on the first tick
+    # @param seriesName String: The series to feed
+    # @param shmName String: The name of the shared memory block of the channel
+    @Slot(str,str)
+    def attachSharedSeries(self,seriesName,shmName):
+
+        if seriesName not in self._seriesDict:
+            self.errorSignal.emit("Unknown series {0}".format(seriesName))
+            return
+        try:
+            reader = DynamoSharedReader(shmName)
+        except (OSError,ValueError) as e:
+            self.errorSignal.emit("Unable to attach to {0}: {1}".format(shmName,e))
+            return
+
+        self.detachSharedSeries(seriesName)
+        self.unsubscribeSeries(seriesName)
+        self._sharedReaders[seriesName] = reader
+        if not self._refreshTimer.isActive():
+            self.setRefreshRate(SHAREDPOLLRATE)
+
+
+    ## Stops feeding a series from its shared memory channel
+    # @param seriesName String: The series fed by the channel
+    @Slot(str)
+    def detachSharedSeries(self,seriesName):
+
+        reader = self._sharedReaders.pop(seriesName,None)
+        if reader is not None:
+            reader.close()
+
+
+    ## Sets the data registry whose channels the series are subscribed to (see subscribeSeries). The process-wide
+    # registry (see defaultRegistry) is used if none is set. The series subscribed to the previous registry are
+    # unsubscribed
+    # @param registry DynamoDataRegistry: The registry
+    def setDataRegistry(self,registry):
+
+        if registry is self._registry:
+            return
+        if self._registry is not None:
+            for k in list(self._subscriptions.keys()):
+                self.unsubscribeSeries(k)
+            self._registry.channelUpdated.disconnect(self._channelUpdated)
+            self._registry.channelRemoved.disconnect(self._channelRemoved)
+        self._registry = registry
+        self._registry.channelUpdated.connect(self._channelUpdated)
+        self._registry.channelRemoved.connect(self._channelRemoved)
+
+
+    ## Makes a series show a channel of the data registry. The channel data is not copied: it is stored once for all
+    # the charts showing it, and every distinct view of it (decimation, plot width and axis range) is prepared once
+    # per update. The series keeps its own decimation, axes and autoscale. The points later given to the series
+    # (e.g. with addPoints) are sent to the channel; the channel window replaces the strip chart one
+    # @param seriesName String: The series
+    # @param channelName String: The registry channel (see DynamoDataRegistry.createChannel)
+    @Slot(str,str)
+    def subscribeSeries(self,seriesName,channelName):
+
+        if seriesName not in self._storeDict:
+            self.errorSignal.emit("Unknown series {0}".format(seriesName))
+            return
+        channel = self._dataRegistry().channel(channelName)
+        if channel is None:
+            self.errorSignal.emit("Unknown channel {0}".format(channelName))
+            return
+
+        self.detachSharedSeries(seriesName)
+        self._pendingReplace.pop(seriesName,None)
+        self._pendingAppend.pop(seriesName,None)
+        self._nextPreparation.pop(seriesName,None)
+        self._pyramidDict.pop(seriesName,None)  # The channel has its own
+        self._subscriptions[seriesName] = channelName
+        self._useStore(seriesName,channel.store(),channel.windowed())
+        self._channelUpdated(channelName,None)
+
+
+    ## Makes a subscribed series keep a copy of its channel data and stop following the channel
+    # @param seriesName String: The subscribed series
+    @Slot(str)
+    def unsubscribeSeries(self,seriesName):
+
+        self._unsubscribe(seriesName,True)
+
+
+    ## Makes a subscribed series stop following its channel
+    # @param seriesName String: The subscribed series
+    # @param keepData Boolean: If True the series keeps a copy of the channel data, otherwise it is left empty
+    def _unsubscribe(self,seriesName,keepData):
+
+        if self._subscriptions.pop(seriesName,None) is None:
+            return
+
+        self._pendingChannels.pop(seriesName,None)
+        store = DynamoSeriesStore(seriesName)
+        if keepData:
+            store.append(self._storeDict[seriesName].x(),self._storeDict[seriesName].y())
+        self._useStore(seriesName,store)
+        if self._seriesOptions[seriesName]["decimation"] == PYRAMID:
+            self._pyramidDict[seriesName] = DynamoPyramid()
+            self._pyramidDict[seriesName].reset(store.y())
+
+
+    ## Sets whether or not the replaced series are prepared on a background thread. The worker validates and converts
+    # the new values, computes their limits and the decimated points to display; the GUI thread only swaps the
+    # prepared data in, autoscales the axes and replaces the GUI series points
+    # @param value Boolean: True to prepare the replaced series on a background thread
+    @Slot(bool)
+    def setBackgroundPreparation(self,value):
+
+        if value and self._preparationThread is None:
+            self._preparationBuffer = DynamoDoubleBuffer()
+            self._preparationWorker = DynamoPreparationWorker(self._preparationBuffer)
+            self._preparationThread = QThread()
+            self._preparationWorker.moveToThread(self._preparationThread)
+            self.preparationRequested.connect(self._preparationWorker.prepare)
+            self._preparationWorker.prepared.connect(self._consumePrepared)
+            self._preparationWorker.failed.connect(self.errorSignal)
+            if QCoreApplication.instance() is not None:
+                QCoreApplication.instance().aboutToQuit.connect(self._stopPreparation)
+            self._preparationThread.start()
+        elif not value and self._preparationThread is not None:
+            self._stopPreparation()
+
+
+    ## Stops the preparation thread, the series waiting for the worker are replaced on the GUI thread
+    @Slot()
+    def _stopPreparation(self):
+
+        if self._preparationThread is None:
+            return
+
+        pending = self._nextPreparation
+        self._nextPreparation = {}
+        self.preparationRequested.disconnect(self._preparationWorker.prepare)
+        self._preparationThread.quit()
+        self._preparationThread.wait()
+        self._consumePrepared()  # A job finished while stopping is still applied
+        self._preparationThread = None
+        self._preparationWorker = None
+        self._preparationBuffer = None
+        pending = {k:pending[k] for k in pending.keys() if k in self._storeDict}
+        for k in pending.keys():
+            self._storeReplace(k,np.concatenate([np.ravel(np.asarray(c,dtype=np.float64)) for c in pending[k][0]]),
+                               np.concatenate([np.ravel(np.asarray(c,dtype=np.float64)) for c in pending[k][1]]))
+        self._batchAutoscale(list(pending.keys()))
+        for k in pending.keys():
+            self._pushSeries(k)
+
+
+    ## Applies to the chart all the data queued since the last refresh tick
+    @Slot()
+    def flush(self):
+
+        self._pollShared()
+        if not self._pendingReplace and not self._pendingAppend and not self._pendingChannels:
+            return
+        replaced = self._pendingReplace
+        appended = self._pendingAppend
+        channels = self._pendingChannels
+        self._pendingReplace = {}
+        self._pendingAppend = {}
+        self._pendingChannels = {}
+
+        if self._preparationThread is not None and replaced:
+            # The replaced series, with the points appended after the replace, are prepared by the worker
+            toPrepare = {}
+            for k in replaced.keys():
+                toPrepare[k] = [[replaced[k][0]] + appended.get(k,[[],[]])[0],
+                                [replaced[k][1]] + appended.get(k,[[],[]])[1]]
+                appended.pop(k,None)
+            self._requestPreparation(toPrepare)
+            replaced = {}
+
+        toPush = {}  # Series name -> number of newest points to append to the GUI series, None to replace them all
+        for k in replaced.keys():
+            self._storeReplace(k,replaced[k][0],replaced[k][1])
+            toPush[k] = None
+        for k in appended.keys():
+            if len(appended[k][0]) == 1:  # A single chunk is stored as it is, without joining it first
+                added,removed = self._storeAppend(k,appended[k][0][0],appended[k][1][0])
+            else:
+                added,removed = self._storeAppend(k,np.concatenate(appended[k][0]),np.concatenate(appended[k][1]))
+            if removed > 0 or k in toPush:
+                toPush[k] = None
+            else:
+                toPush[k] = added
+        for k in channels.keys():  # The channels already hold the new points
+            self._syncChannelLimits(k,channels[k])
+            if channels[k] is None or channels[k][1] > 0:
+                toPush[k] = None  # The whole view changes
+            else:
+                toPush[k] = channels[k][0]
+
+        if not toPush:
+            return  # Everything has been sent to the preparation worker
+        self._metrics.countUpdate()
+        start = time.perf_counter()
+        self._frameAutoscale(list(replaced.keys()) + [k for k in channels.keys() if channels[k] is None],
+                             list(appended.keys()) + [k for k in channels.keys() if channels[k] is not None])
+        self._metrics.addAutoscale(time.perf_counter() - start)
+        for k in toPush.keys():
+            if k in replaced or (k in channels and channels[k] is None):
+                self._pushSeries(k)  # A replaced series is sent at once
+            else:
+                self._pushAppended(k,toPush[k])
+
+
+    ## Sends again to the GUI the series whose displayed points depend on the axes ranges (e.g. the decimated ones).
+    # It has to be called after the axes ranges changed
+    @Slot()
+    def refreshViews(self):
+
+        for k in self._seriesOptions.keys():
+            if self._culled(k):
+                if not self._insideCullBounds(k):  # The view moved past the margin
+                    self._pushSeries(k)
+            elif self._viewDependent(k):
+                self._pushSeries(k)
+
+
+    ## Sets whether or not only the points around the visible x range are sent to the GUI series.
+    # Culled series are sliced again only when the visible range moves past the margin
+    # @param qCullingSet QJSValue: The settings dictionary. It contains:
+    #                              - "enabled": Boolean, True to enable the viewport culling
+    #                              - "margin": Double, optional, the fraction of the visible x span sent on each side
+    #                                of the visible range
+    @Slot('QVariant')
+    def setViewportCulling(self,qCullingSet):
+
+        cullingSet = qCullingSet.toVariant()
+        self._culling = cullingSet["enabled"]
+        self._cullingMargin = cullingSet.get("margin",CULLINGMARGIN)
+        self._cullBounds = {}
+        for k in self._seriesDict.keys():
+            self._pushSeries(k)
 
 
     ## Sets the autoscale values
@@ -377,9 +1193,6 @@ class DynamoChartManager(QObject):
     @Slot('QVariant')
     def setAutoScale(self,qAutoscaleValDict):
 
-        if self._execLog:
-            print('{1}.setAutoScale called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         autoScaleValDict = qAutoscaleValDict.toVariant()
         if self._verbose:
             print("Auto Got: {0}".format(autoScaleValDict))
@@ -387,6 +1200,29 @@ class DynamoChartManager(QObject):
             self._assignedX[k].autoscaling = autoScaleValDict["x"][k]
         for k in autoScaleValDict["y"].keys():
             self._assignedY[k].autoscaling = autoScaleValDict["y"][k]
+        self.refreshViews()
+
+
+    ## Sets the autoscale growth policy of a selected set of axes (see DynamoAxisManager.setGrowthPolicy): with a
+    # headroom, nice ticks and a shrink hysteresis the autoscaled axes change range, and the chart is laid out
+    # again, only every so often instead of at every new point
+    # @param qPolicyDict QJSValue: Contains, for the x and the y axes, the policy of every axis to change by axis
+    #                              name (e.g. {"x":{"bottom":{"headroom":0.1,"niceTicks":true}},"y":{}}). The
+    #                              policy keys ("headroom", "niceTicks", "shrinkBand", "shrinkDelay") are optional,
+    #                              the missing ones keep their current value
+    @Slot('QVariant')
+    def setAutoscalePolicy(self,qPolicyDict):
+
+        policyDict = qPolicyDict.toVariant()
+        for assigned,policies in [(self._assignedX,policyDict.get("x",{})),(self._assignedY,policyDict.get("y",{}))]:
+            for k in policies.keys():
+                if k not in assigned:
+                    self.errorSignal.emit("Unknown axis {0}".format(k))
+                    continue
+                try:
+                    assigned[k].setGrowthPolicy(**dict(assigned[k].getGrowthPolicy(),**policies[k]))
+                except (TypeError,ValueError) as e:
+                    self.errorSignal.emit("Wrong autoscale policy for {0}: {1}".format(k,e))
 
 
     ## Sets the label for a selected set of axis
@@ -394,9 +1230,6 @@ class DynamoChartManager(QObject):
     @Slot('QVariant')
     def setAxesLabels(self,qAxesDict):
 
-        if self._execLog:
-            print('{1}.setAxesLabels called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         axesDict = qAxesDict.toVariant()
 
         for k in axesDict.keys():
@@ -442,14 +1275,69 @@ class DynamoChartManager(QObject):
                 print("y axis {1} is {0} now".format(self._assignedY[k].panAllowed,k))
 
 
-    ## Sets whether or not the chart has to behave as a strip chart and the number of points for the chart
-    # @param qStripSet QJSValue: The settings dictionary
+    ## Sets whether or not the chart has to behave as a strip chart and the size of its window
+    # @param qStripSet QJSValue: The settings dictionary. It contains:
+    #                            - "doStrip": Boolean, True to enable the strip chart behaviour
+    #                            - "points": Integer, the number of newest points to keep (0 for no limit)
+    #                            - "span": Double, optional, the x span (e.g. seconds) to keep behind the newest point
+    #                              (0 for no limit). It requires the x values to be sorted
     @Slot('QVariant')
     def setStripChart(self,qStripSet):
 
         stripSet = qStripSet.toVariant()
         self._stripChart = stripSet["doStrip"]
-        self._stripPoints = stripSet["points"]
+        self._stripPoints = stripSet.get("points",0)
+        self._stripSpan = stripSet.get("span",0)
+        for kx in self._assignedX.keys():
+            self._assignedX[kx].setWindowedLimits(self._stripChart)
+        for ky in self._assignedY.keys():
+            self._assignedY[ky].setWindowedLimits(self._stripChart)
+
+
+    ## Enables or disables the instrumentation of the manager and of its axis managers: the calls of every member
+    # function are counted and timed, and the latest ones are traced (see stats). When disabled nothing is measured
+    # and the member functions run unwrapped
+    # @param value Boolean: True to enable the instrumentation
+    @Slot(bool)
+    def setInstrumentation(self,value):
+
+        if value and self._instrumentation is None:
+            self._instrumentation = DynamoInstrumentation()
+            self._instrumentation.instrument(self,exclude=["setInstrumentation","stats","resetStats"])
+            for manager in [self._xB,self._yL,self._xT,self._yR,self._xLogB,self._yLogL,self._xLogT,self._yLogR]:
+                self._instrumentation.instrument(manager,"{0}.{1}".format(type(manager).__name__,manager.objectName()))
+        elif not value and self._instrumentation is not None:
+            self._instrumentation.release()
+            self._instrumentation = None
+
+
+    ## Returns a snapshot of the instrumentation statistics (see DynamoInstrumentation.stats), an empty dictionary
+    # if the instrumentation is disabled
+    # @param trace Boolean: If True the latest calls are returned too
+    @Slot(result='QVariant')
+    @Slot(bool,result='QVariant')
+    def stats(self,trace=False):
+
+        if self._instrumentation is None:
+            return {}
+
+        return self._instrumentation.stats(trace)
+
+
+    ## Sets all the instrumentation counters to zero and empties the trace
+    @Slot()
+    def resetStats(self):
+
+        if self._instrumentation is not None:
+            self._instrumentation.reset()
+
+
+    ## Publishes the metrics of the last interval through the metrics property
+    @Slot()
+    def _publishMetrics(self):
+
+        self._metricsValue = self._metrics.snapshot()
+        self.metricsChanged.emit()
 
     # ------------------------------------------------------------------------------- #
 
@@ -458,89 +1346,72 @@ class DynamoChartManager(QObject):
     ## Returns the self._axisAssigned value
     def axisAssigned(self):
 
-        if self._execLog:
-            print('{1}.axisAssigned called at\t{0}'.format(datetime.now(), type(self).__name__))
         return self._axisAssigned
 
 
     ## Returns the current value for self._interactionEnabled
     def interactionEnabled(self):
 
-        if self._execLog:
-            print('{1}.interactionEnabled called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._interactionEnabled
 
 
+    ## Returns the plot area width in pixels
+    def plotWidth(self):
+
+        return self._plotWidth
+
+
+    ## Returns the latest metrics (see DynamoMetrics.snapshot). They are updated every METRICSINTERVAL milliseconds
+    def metrics(self):
+
+        return self._metricsValue
+
+
     ## Returns the axis managed by _xB
     def xBottom(self):
 
-        if self._execLog:
-            print('{1}.xBottom called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._xB.getInnerAxis()
 
 
     ## Returns the axis managed by _yL
     def yLeft(self):
 
-        if self._execLog:
-            print('{1}.yLeft called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._yL.getInnerAxis()
 
 
     ## Returns the axis managed by _xT
     def xTop(self):
 
-        if self._execLog:
-            print('{1}.xTop called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._xT.getInnerAxis()
 
 
     ## Returns the axis managed by _yR
     def yRight(self):
 
-        if self._execLog:
-            print('{1}.yRight called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._yR.getInnerAxis()
 
 
     ## Returns the axis managed by _xLogB
     def xLogBottom(self):
 
-        if self._execLog:
-            print('{1}.xLogBottom called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._xLogB.getInnerAxis()
 
 
     ## Returns the axis managed by _yLogL
     def yLogLeft(self):
 
-        if self._execLog:
-            print('{1}.yLogLeft called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._yLogL.getInnerAxis()
 
 
     ## Returns the axis managed by _xLogT
     def xLogTop(self):
 
-        if self._execLog:
-            print('{1}.xLogTop called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._xLogT.getInnerAxis()
 
 
     ## Returns the axis managed by _yLogR
     def yLogRight(self):
 
-        if self._execLog:
-            print('{1}.yLogRight called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         return self._yLogR.getInnerAxis()
 
 
@@ -548,8 +1419,6 @@ class DynamoChartManager(QObject):
     # @param value Boolean: The value to assign
     def setAxisAssigned(self,value):
 
-        if self._execLog:
-            print('{1}.setAxisAssigned called at\t{0}'.format(datetime.now(), type(self).__name__))
         if self._verbose:
             print("axisAssigned: {0}; value: {1}".format(self._axisAssigned,value))
         if value == self._axisAssigned:
@@ -562,20 +1431,26 @@ class DynamoChartManager(QObject):
     # @param value Boolean: The value to assign
     def setInteractionEnabled(self, value):
 
-        if self._execLog:
-            print('{1}.setInteractionEnabled called at\t{0}'.format(datetime.now(), type(self).__name__))
         if value == self._interactionEnabled:
             return
         self._interactionEnabled = value
 
 
+    ## Sets the plot area width in pixels and, when it changes, sends again the decimated series
+    # @param value Double: The plot area width
+    def setPlotWidth(self,value):
+
+        if int(value) == int(self._plotWidth):
+            return
+        self._plotWidth = value
+        self.plotWidthChanged.emit()
+        self.refreshViews()
+
+
     ## Sets the axis managed by _xB
     # @param x ValueAxis: The axis to manage
     def setXBottom(self,x):
 
-        if self._execLog:
-            print('{1}.setXBottom called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._xB,x,True)
 
 
@@ -583,9 +1458,6 @@ class DynamoChartManager(QObject):
     # @param y ValueAxis: The axis to manage
     def setYLeft(self, y):
 
-        if self._execLog:
-            print('{1}.setYLeft called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._yL,y,False)
 
 
@@ -593,9 +1465,6 @@ class DynamoChartManager(QObject):
     # @param x ValueAxis: The axis to manage
     def setXTop(self,x):
 
-        if self._execLog:
-            print('{1}.setXTop called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._xT,x,True)
 
 
@@ -603,9 +1472,6 @@ class DynamoChartManager(QObject):
     # @param y ValueAxis: The axis to manage
     def setYRight(self, y):
 
-        if self._execLog:
-            print('{1}.setYRight called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._yR,y,False)
 
 
@@ -613,9 +1479,6 @@ class DynamoChartManager(QObject):
     # @param x LogValueAxis: The axis to manage
     def setXLogBottom(self,x):
 
-        if self._execLog:
-            print('{1}.setXLogBottom called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._xLogB,x,True)
 
 
@@ -623,9 +1486,6 @@ class DynamoChartManager(QObject):
     # @param y LogValueAxis: The axis to manage
     def setYLogLeft(self, y):
 
-        if self._execLog:
-            print('{1}.setYLogLeft called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._yLogL,y,False)
 
 
@@ -633,9 +1493,6 @@ class DynamoChartManager(QObject):
     # @param x LogValueAxis: The axis to manage
     def setXLogTop(self,x):
 
-        if self._execLog:
-            print('{1}.setXLogTop called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._xLogT,x,True)
 
 
@@ -643,9 +1500,6 @@ class DynamoChartManager(QObject):
     # @param y LogValueAxis: The axis to manage
     def setYLogRight(self, y):
 
-        if self._execLog:
-            print('{1}.setYLogRight called at\t{0}'.format(datetime.now(), type(self).__name__))
-
         self._setManagedAxis(self._yLogR,y,False)
 
     # ------------------------------------------------------------------------------- #
@@ -661,4 +1515,6 @@ class DynamoChartManager(QObject):
     yLogRight = Property(QtCharts.QLogValueAxis, fget=yLogRight, fset=setYLogRight, notify=axisChanged)
     axisAssigned = Property(bool,fget=axisAssigned, fset=setAxisAssigned, notify=axisAssignedChanged)
     interactionEnabled = Property(bool,fget=interactionEnabled, fset=setInteractionEnabled, notify=interactionEnableChanged)
+    plotWidth = Property(float,fget=plotWidth, fset=setPlotWidth, notify=plotWidthChanged)
+    metrics = Property('QVariant',fget=metrics, notify=metricsChanged)
     # ------------------------------------------------------------------------------- #
\ No newline at end of file
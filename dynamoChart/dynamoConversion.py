@@ -0,0 +1,78 @@
+from PySide2.QtCore import QPointF
+from PySide2.QtGui import QPolygonF
+import numpy as np
+
+try:
+    from shiboken2 import VoidPtr
+except ImportError:
+    VoidPtr = None
+
+
+## Returns a writable numpy view on the memory of a QPolygonF, as an array of n rows (x,y)
+# @param polygon QPolygonF: The polygon to view, already resized
+# @param count Integer: The number of points of the polygon
+def _polygonView(polygon,count):
+
+    return np.frombuffer(VoidPtr(polygon.data(),count*16,True),dtype=np.float64).reshape(count,2)
+
+
+## Tells whether or not QPolygonF memory can be written through numpy: it needs shiboken2 buffers and a QPointF made
+# of two doubles
+def _checkPolygonBuffer():
+
+    if VoidPtr is None:
+        return False
+    try:
+        polygon = QPolygonF()
+        polygon.resize(2)
+        view = _polygonView(polygon,2)
+        view[:] = [[1.0,2.0],[3.0,4.0]]
+        return polygon.at(1).x() == 3.0 and polygon.at(1).y() == 4.0
+    except Exception:
+        return False
+
+
+POLYGONBUFFER = _checkPolygonBuffer()
+
+
+## Converts x and y values to a list of QPointF, ready to be sent to a GUI series
+# @param x Array-like: The x values
+# @param y Array-like: The y values
+def toPointList(x,y):
+
+    return [QPointF(px,py) for px,py in zip(np.asarray(x,dtype=np.float64).tolist(),np.asarray(y,dtype=np.float64).tolist())]
+
+
+## Converts x and y values to a QPolygonF, ready to be sent to a GUI series. The values are copied straight into the
+# polygon memory, without creating a QPointF per point; if that is not possible a list of QPointF is returned
+# @param x Array-like: The x values
+# @param y Array-like: The y values
+def toPolygon(x,y):
+
+    x = np.ravel(np.asarray(x))
+    y = np.ravel(np.asarray(y))
+    if not POLYGONBUFFER or x.shape[0] != y.shape[0] or x.dtype.kind not in "biuf" or y.dtype.kind not in "biuf":
+        return toPointList(x,y)
+
+    count = x.shape[0]
+    polygon = QPolygonF()
+    if count == 0:
+        return polygon
+    polygon.resize(count)
+    view = _polygonView(polygon,count)
+    view[:,0] = x
+    view[:,1] = y
+
+    return polygon
+
+
+## Splits the points given to replaceSeries in their x and y values. The points can be a list with the x values and
+# the y values, a (2,n) array or an interleaved (n,2) array. A (2,2) array is read as a list of x and y values
+# @param points Array-like: The points
+# @return List: The x values and the y values
+def splitColumns(points):
+
+    if isinstance(points,np.ndarray) and points.ndim == 2 and points.shape[0] != 2 and points.shape[1] == 2:
+        return points[:,0],points[:,1]
+
+    return points[0],points[1]
@@ -0,0 +1,247 @@
+from PySide2.QtCore import QObject, Signal, Slot
+
+from .dynamoSeriesStore import DynamoSeriesStore
+from .dynamoDecimation import prepareView, viewKey
+from .dynamoConversion import toPolygon, splitColumns
+from .dynamoPyramid import DynamoPyramid
+from .dynamoLimits import valueLimits
+from .definitions import *
+
+_defaultRegistry = None  # The process-wide registry returned by defaultRegistry
+
+## Returns the process-wide data registry, created at the first call. It has to be used from the GUI thread
+def defaultRegistry():
+
+    global _defaultRegistry
+
+    if _defaultRegistry is None:
+        _defaultRegistry = DynamoDataRegistry()
+
+    return _defaultRegistry
+
+
+## Class DynamoChannel
+# A named series stored once by a DynamoDataRegistry and shared by all the series subscribed to it. Everything derived
+# from the data (limits, level of detail index, points to display) is computed once per data version and reused by
+# all the subscribers
+class DynamoChannel(object):
+
+    ## Class constructor
+    # @param name String: The channel name
+    # @param points Integer: The number of newest points to keep (0 for no limit)
+    # @param span Double: The x span to keep behind the newest point (0 for no limit). It requires sorted x values
+    def __init__(self,name,points=0,span=0):
+
+        self._store = DynamoSeriesStore(name)
+        self._points = points
+        self._span = span
+        self._version = 0  # Incremented at every data change, it invalidates the cached limits and views
+        self._limits = None  # The cached limits (see limits), None when not computed for the current version
+        self._pyramid = None  # The level of detail index, built at the first request
+        self._views = {}  # View key (see viewKey) -> [QPolygonF,culling bounds], for the current version
+
+
+    ## Returns the store of the channel data. It is shared with the subscribers: they must not modify it
+    def store(self):
+
+        return self._store
+
+
+    ## Tells whether or not the channel removes its oldest points (it has a points or a span window)
+    def windowed(self):
+
+        return self._points > 0 or self._span > 0
+
+
+    ## Returns the version of the channel data
+    def version(self):
+
+        return self._version
+
+
+    ## Replaces the channel points
+    # @param newX Array-like: The new x values
+    # @param newY Array-like: The new y values
+    def replace(self,newX,newY):
+
+        self._store.replace(newX,newY)
+        self._applyWindow()
+        self._changed()
+        if self._pyramid is not None:
+            self._pyramid.reset(self._store.y())
+
+
+    ## Appends points to the channel, then applies its window
+    # @param newX Double or array-like: The x values of the new points
+    # @param newY Double or array-like: The y values of the new points
+    # @return List: The number of points added and the number of points removed by the window
+    def append(self,newX,newY):
+
+        oldCount = self._store.count()
+        self._store.append(newX,newY)
+        added = self._store.count() - oldCount
+        if added == 0:
+            return [0,0]
+        removed = self._applyWindow()
+        self._changed()
+        if self._pyramid is not None:
+            self._pyramid.trim(removed)
+            self._pyramid.update(self._store.y())
+
+        return [added,removed]
+
+
+    ## Removes the points that left the channel window
+    # @return Integer: The number of removed points
+    def _applyWindow(self):
+
+        removed = 0
+        if self._points > 0:
+            removed += self._store.trimToCount(self._points)
+        if self._span > 0:
+            removed += self._store.trimToSpan(self._span)
+
+        return removed
+
+
+    ## Drops everything derived from the previous data
+    def _changed(self):
+
+        self._version += 1
+        self._limits = None
+        self._views = {}
+
+
+    ## Returns the limits of the channel data, computed once per version
+    # @return List: The limits of the x values, of the y values, of the positive x values and of the positive y values
+    #               (see valueLimits)
+    def limits(self):
+
+        if self._limits is None:
+            self._limits = [valueLimits(self._store.x()),valueLimits(self._store.y()),
+                            valueLimits(self._store.x(),True),valueLimits(self._store.y(),True)]
+
+        return self._limits
+
+
+    ## Returns the level of detail index of the channel, built at the first call and then kept up to date
+    def pyramid(self):
+
+        if self._pyramid is None:
+            self._pyramid = DynamoPyramid()
+            self._pyramid.reset(self._store.y())
+
+        return self._pyramid
+
+
+    ## Returns the points to display for a set of display settings. They are prepared once per distinct view (see
+    # viewKey) and data version, whatever the number of subscribers asking for them
+    # @param settings Dictionary: The display settings (see prepareView)
+    # @return List: The QPolygonF to send to the GUI series and the x range kept by the culling (None if not culled)
+    def view(self,settings):
+
+        key = viewKey(settings,self._store.isSorted())
+        if key not in self._views:
+            pyramid = self.pyramid() if settings["decimation"] == PYRAMID else None
+            viewX,viewY,bounds = prepareView(self._store.x(),self._store.y(),settings,pyramid,self._store.isSorted())
+            if len(self._views) >= REGISTRYVIEWS:
+                del self._views[next(iter(self._views))]  # The oldest view, e.g. of a range panned away from
+            self._views[key] = [toPolygon(viewX,viewY),bounds]
+
+        return self._views[key]
+
+
+## Class DynamoDataRegistry
+# Named channels of data stored once and shown by any number of charts. A DynamoChartManager series subscribed to a
+# channel (see DynamoChartManager.subscribeSeries) displays the channel data with its own decimation and axes: the
+# data is stored, its limits computed and every distinct view prepared once for all the subscribers.
+# The channels are updated through the registry, which then notifies the subscribers
+class DynamoDataRegistry(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    channelUpdated = Signal(str,object)  # Channel name, [added,removed] points or None if the points were replaced
+    channelRemoved = Signal(str)
+    errorSignal = Signal(str)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param parent QObject: The parent object
+    def __init__(self,parent=None):
+
+        QObject.__init__(self,parent)
+        self._channels = {}  # Channel name -> DynamoChannel
+
+
+    ## Returns a channel, None if it does not exist
+    # @param name String: The channel name
+    def channel(self,name):
+
+        return self._channels.get(name)
+
+
+    ## Tells whether or not a channel exists
+    # @param name String: The channel name
+    @Slot(str,result=bool)
+    def hasChannel(self,name):
+
+        return name in self._channels
+
+
+    ## Returns the channel names
+    def channels(self):
+
+        return list(self._channels.keys())
+
+
+    ## Creates a channel. Nothing is done if it already exists
+    # @param name String: The channel name
+    # @param points Integer: The number of newest points to keep (0 for no limit)
+    # @param span Double: The x span to keep behind the newest point (0 for no limit). It requires sorted x values
+    @Slot(str,int,float)
+    def createChannel(self,name,points=0,span=0):
+
+        if name not in self._channels:
+            self._channels[name] = DynamoChannel(name,points,span)
+
+
+    ## Removes a channel. Its subscribers keep a copy of its data
+    # @param name String: The channel name
+    @Slot(str)
+    def removeChannel(self,name):
+
+        if name not in self._channels:
+            return
+        self.channelRemoved.emit(name)
+        del self._channels[name]
+
+
+    ## Replaces the points of one or more channels
+    # @param inputDict Dictionary: The channel names as keys and a list with the x values and the y values (or an
+    #                              interleaved numpy array of n rows (x,y)) as values
+    @Slot(dict)
+    def replaceChannels(self,inputDict):
+
+        for k in inputDict.keys():
+            if k not in self._channels:
+                self.errorSignal.emit("Unknown channel {0}".format(k))
+                continue
+            newX,newY = splitColumns(inputDict[k])
+            self._channels[k].replace(newX,newY)
+            self.channelUpdated.emit(k,None)
+
+
+    ## Appends points to one or more channels
+    # @param newPointsDict Dictionary: The channel names as keys and a list with the x values and the y values of the
+    #                                  new points (doubles, lists or numpy arrays) as values
+    @Slot(dict)
+    def appendChannels(self,newPointsDict):
+
+        for k in newPointsDict.keys():
+            if k not in self._channels:
+                self.errorSignal.emit("Unknown channel {0}".format(k))
+                continue
+            added,removed = self._channels[k].append(newPointsDict[k][0],newPointsDict[k][1])
+            if added > 0:
+                self.channelUpdated.emit(k,[added,removed])
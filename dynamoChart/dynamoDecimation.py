@@ -0,0 +1,175 @@
+import numpy as np
+
+from .definitions import NODECIMATION, MINMAX, LTTB, PYRAMID
+
+## Returns the indexes delimiting the points inside a x range, plus one point on each side so that the lines leaving
+# the range are drawn too. The x values have to be sorted; they are searched with a binary search
+# @param x Numpy array: The x values
+# @param xMin Double: The lower limit of the range
+# @param xMax Double: The upper limit of the range
+# @return List: The index of the first point and the index following the last point
+def visibleSlice(x,xMin,xMax):
+
+    first = max(int(np.searchsorted(x,xMin,side='left')) - 1,0)
+    last = min(int(np.searchsorted(x,xMax,side='right')) + 1,x.shape[0])
+
+    return first,last
+
+
+## Reduces a line to the points needed to draw it on a certain number of pixel columns.
+# For every pixel column the first, the last, the lowest and the highest point are kept, so the drawn line looks the
+# same as the one drawn with all the points. The x values have to be sorted
+# @param x Numpy array: The x values
+# @param y Numpy array: The y values
+# @param xMin Double: The x value at the left border of the plot area
+# @param xMax Double: The x value at the right border of the plot area
+# @param width Integer: The plot area width in pixels
+# @param logScale Boolean: True if the x axis is logarithmic
+# @return List: The decimated x and y values
+def minMaxDecimate(x,y,xMin,xMax,width,logScale=False):
+
+    width = int(width)
+    if width <= 0 or x.shape[0] <= 4*width or not xMax > xMin:
+        return x,y
+
+    first,last = visibleSlice(x,xMin,xMax)
+    x = x[first:last]
+    y = y[first:last]
+    if x.shape[0] <= 4*width:
+        return x,y
+
+    if logScale:
+        if not xMin > 0:
+            return x,y
+        with np.errstate(divide='ignore',invalid='ignore'):
+            position = (np.log10(x) - np.log10(xMin))/(np.log10(xMax) - np.log10(xMin))
+        position[~np.isfinite(position)] = -1
+    else:
+        position = (x - xMin)/(xMax - xMin)
+    columns = np.clip(np.floor(position*width),-1,width).astype(np.int64)
+
+    starts = np.concatenate(([0],np.flatnonzero(np.diff(columns)) + 1))
+    ends = np.concatenate((starts[1:],[x.shape[0]])) - 1
+    segments = np.repeat(np.arange(starts.shape[0]),ends - starts + 1)
+    lowest = np.fmin.reduceat(y,starts)
+    highest = np.fmax.reduceat(y,starts)
+    minCandidates = np.flatnonzero(y == lowest[segments])
+    maxCandidates = np.flatnonzero(y == highest[segments])
+    minIndexes = minCandidates[np.unique(segments[minCandidates],return_index=True)[1]]
+    maxIndexes = maxCandidates[np.unique(segments[maxCandidates],return_index=True)[1]]
+
+    keep = np.unique(np.concatenate((starts,ends,minIndexes,maxIndexes)))
+    return x[keep],y[keep]
+
+
+## Reduces a series to a certain number of points using the Largest-Triangle-Three-Buckets algorithm.
+# The first and the last points are kept, the others are split in buckets of equal size and, from every bucket, the
+# point forming the largest triangle with the point kept from the previous bucket and the average of the next bucket
+# is kept. The areas of a bucket are computed at once, so the python loop runs once per kept point. Every call
+# works on all the points given (see DynamoChartManager._pushAppended for how often a growing series is decimated)
+# @param x Numpy array: The x values
+# @param y Numpy array: The y values
+# @param target Integer: The number of points to keep
+# @return List: The decimated x and y values
+def lttbDecimate(x,y,target):
+
+    count = x.shape[0]
+    target = int(target)
+    if target < 3 or count <= target:
+        return x,y
+
+    edges = np.floor(np.arange(target - 1)*((count - 2)/(target - 2))).astype(np.int64) + 1
+    edges[-1] = count - 1
+    lengths = np.diff(edges)
+    averageX = np.add.reduceat(x[:count - 1],edges[:-1])/lengths
+    averageY = np.add.reduceat(y[:count - 1],edges[:-1])/lengths
+    nextX = np.append(averageX[1:],x[count - 1])
+    nextY = np.append(averageY[1:],y[count - 1])
+
+    keep = np.empty(target,dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = count - 1
+    previous = 0
+    for i in range(target - 2):
+        start = edges[i]
+        stop = edges[i + 1]
+        ax = x[previous]
+        ay = y[previous]
+        areas = np.abs((ax - nextX[i])*(y[start:stop] - ay) - (ax - x[start:stop])*(nextY[i] - ay))
+        previous = start + int(np.argmax(areas))
+        keep[i + 1] = previous
+
+    return x[keep],y[keep]
+
+
+## Returns the points to display for a series, given its display settings. It only works on its inputs, so it can be
+# used outside the GUI thread
+# @param x Numpy array: All the x values of the series
+# @param y Numpy array: All the y values of the series
+# @param settings Dictionary: The display settings. It contains:
+#                             - "decimation": String, the decimation mode of the series (one of DECIMATIONS)
+#                             - "targetPoints": Integer, the number of points kept by the LTTB decimation
+#                             - "range": List, the x axis range ([min,max]) or None if the axis is not used
+#                             - "width": Double, the plot area width in pixels
+#                             - "logScale": Boolean, True if the x axis is logarithmic
+#                             - "culling": Boolean, True if the viewport culling is enabled
+#                             - "margin": Double, the fraction of the visible x span kept on each side by the culling
+# @param pyramid DynamoPyramid: The level of detail index of the series (needed by the "pyramid" decimation only)
+# @param isSorted Boolean: True if the x values are sorted
+# @return List: The x values and the y values to display, and the x range kept by the culling (None if not culled)
+def prepareView(x,y,settings,pyramid=None,isSorted=True):
+
+    decimation = settings["decimation"]
+    xRange = settings["range"]
+    if xRange is None or not isSorted:
+        if decimation == LTTB:
+            return lttbDecimate(x,y,settings["targetPoints"]) + (None,)
+        return x,y,None
+
+    if settings["culling"] and decimation in [NODECIMATION,LTTB]:
+        span = xRange[1] - xRange[0]
+        if settings["logScale"] and xRange[0] > 0:
+            span = np.log10(xRange[1]/xRange[0])
+            bounds = [xRange[0]/10**(settings["margin"]*span),xRange[1]*10**(settings["margin"]*span)]
+        else:
+            bounds = [xRange[0] - settings["margin"]*span,xRange[1] + settings["margin"]*span]
+        first,last = visibleSlice(x,bounds[0],bounds[1])
+        if decimation == LTTB:
+            return lttbDecimate(x[first:last],y[first:last],settings["targetPoints"]) + (bounds,)
+        return x[first:last],y[first:last],bounds
+
+    if decimation == MINMAX:
+        return minMaxDecimate(x,y,xRange[0],xRange[1],settings["width"],settings["logScale"]) + (None,)
+    if decimation == LTTB:
+        return lttbDecimate(x,y,settings["targetPoints"]) + (None,)
+    if decimation == PYRAMID and pyramid is not None:
+        return pyramid.query(x,y,xRange[0],xRange[1],settings["width"]) + (None,)
+
+    return x,y,None
+
+
+## Returns a key identifying the points prepareView returns for a series: two settings with the same key give the
+# same view of the same data, whatever their other values (e.g. the axis range of a series decimated with LTTB)
+# @param settings Dictionary: The display settings (see prepareView)
+# @param isSorted Boolean: True if the x values are sorted
+# @return Tuple: The view key
+def viewKey(settings,isSorted=True):
+
+    decimation = settings["decimation"]
+    xRange = settings["range"]
+    if xRange is None or not isSorted:
+        if decimation == LTTB:
+            return LTTB,settings["targetPoints"]
+        return NODECIMATION,
+
+    if settings["culling"] and decimation in [NODECIMATION,LTTB]:
+        return decimation,settings["targetPoints"] if decimation == LTTB else None,tuple(xRange),settings["margin"],\
+               settings["logScale"]
+    if decimation == MINMAX:
+        return MINMAX,tuple(xRange),settings["width"],settings["logScale"]
+    if decimation == LTTB:
+        return LTTB,settings["targetPoints"]
+    if decimation == PYRAMID:
+        return PYRAMID,tuple(xRange),settings["width"]
+
+    return NODECIMATION,
@@ -0,0 +1,168 @@
+from PySide2.QtCore import QObject, Signal, Slot, QThread, QCoreApplication
+import numpy as np
+import json
+
+from .dynamoPlayback import writeRecording
+from .definitions import *
+
+## Returns the metadata of a chart snapshot (see DynamoChartManager.snapshot): everything but the series values
+# @param snapshot Dictionary: The chart snapshot
+def _snapshotMeta(snapshot):
+
+    return {"series":[{"name":k,
+                       "plotType":snapshot["series"][k]["plotType"],
+                       "xAxis":snapshot["series"][k]["xAxis"],
+                       "yAxis":snapshot["series"][k]["yAxis"]} for k in snapshot["series"].keys()],
+            "ranges":snapshot["ranges"]}
+
+
+## Writes a chart snapshot to a numpy archive. The values of the i-th series are stored as "x_i" and "y_i", the
+# metadata (series names in the same order, plot types, axes and axis ranges) as a JSON string under "meta", so the
+# archive is loaded without pickle
+# @param path String: The file to write
+# @param snapshot Dictionary: The chart snapshot (see DynamoChartManager.snapshot)
+# @param compressed Boolean: If True the archive is compressed
+def writeNpz(path,snapshot,compressed=True):
+
+    arrays = {"meta":np.array(json.dumps(_snapshotMeta(snapshot)))}
+    for i,k in enumerate(snapshot["series"].keys()):
+        arrays["x_{0}".format(i)] = snapshot["series"][k]["x"]
+        arrays["y_{0}".format(i)] = snapshot["series"][k]["y"]
+    with open(path,"wb") as npzFile:  # A file object, so that numpy does not append .npz to the path
+        if compressed:
+            np.savez_compressed(npzFile,**arrays)
+        else:
+            np.savez(npzFile,**arrays)
+
+
+## Writes a chart snapshot to a recording file (see writeRecording), whose columns can be memory mapped with
+# DynamoRecording. The metadata (plot types, axes and axis ranges) is stored as the recording "extra" information
+# @param path String: The file to write
+# @param snapshot Dictionary: The chart snapshot (see DynamoChartManager.snapshot)
+# @param dtype String: The type of the stored values (one of RECORDINGDTYPES)
+def writeRaw(path,snapshot,dtype="float64"):
+
+    writeRecording(path,{k:[snapshot["series"][k]["x"],snapshot["series"][k]["y"]] for k in snapshot["series"].keys()},
+                   dtype,_snapshotMeta(snapshot))
+
+
+## Class DynamoExportWorker
+# Writes the chart snapshots to disk. It has to be moved to a QThread
+class DynamoExportWorker(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    written = Signal(str)
+    failed = Signal(str)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Writes a snapshot
+    # @param job Dictionary: It contains the "path", the "format" (one of EXPORTFORMATS) and the "snapshot"
+    @Slot(object)
+    def write(self,job):
+
+        try:
+            if job["format"] == EXPORTNPZ:
+                writeNpz(job["path"],job["snapshot"])
+            else:
+                writeRaw(job["path"],job["snapshot"])
+        except (OSError,ValueError) as e:
+            self.failed.emit("Unable to export to {0}: {1}".format(job["path"],e))
+            return
+        self.written.emit(job["path"])
+
+
+    ## Stops the thread of the worker, once the snapshots requested before have been written
+    @Slot()
+    def stop(self):
+
+        self.thread().quit()
+
+
+## Class DynamoExporter
+# Exports the series of a DynamoChartManager to disk without blocking the GUI. The GUI thread only takes a snapshot
+# of the chart (a copy of the stored values, see DynamoChartManager.snapshot), the files are written by a worker on
+# a background thread. The exports are written in the order they are requested
+class DynamoExporter(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    exportRequested = Signal(object)
+    stopRequested = Signal()
+    exported = Signal(str)
+    errorSignal = Signal(str)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param manager DynamoChartManager: The manager whose series are exported
+    # @param parent QObject: The parent object
+    def __init__(self,manager,parent=None):
+
+        QObject.__init__(self,parent)
+        self._manager = manager
+        self._pending = 0  # Exports requested and not written yet
+        self._worker = DynamoExportWorker()
+        self._thread = QThread()
+        self._worker.moveToThread(self._thread)
+        self.exportRequested.connect(self._worker.write)
+        self.stopRequested.connect(self._worker.stop)
+        self._worker.written.connect(self._written)
+        self._worker.failed.connect(self._failed)
+        if QCoreApplication.instance() is not None:
+            QCoreApplication.instance().aboutToQuit.connect(self.close)
+        self._thread.start()
+
+
+    ## Tells whether or not some exports are still being written
+    def busy(self):
+
+        return self._pending > 0
+
+
+    ## Exports all the series
+    # @param path String: The file to write
+    # @param fmt String: The file format (one of EXPORTFORMATS)
+    @Slot(str,str)
+    def export(self,path,fmt):
+
+        if fmt not in EXPORTFORMATS:
+            self.errorSignal.emit("Wrong export format")
+            return
+        if self._thread is None:
+            self.errorSignal.emit("The exporter has been closed")
+            return
+
+        self._pending += 1
+        self.exportRequested.emit({"path":path,"format":fmt,"snapshot":self._manager.snapshot()})
+
+
+    ## Waits for the pending exports and stops the background thread
+    @Slot()
+    def close(self):
+
+        if self._thread is None:
+            return
+
+        self.stopRequested.emit()  # Queued after the pending exports
+        self._thread.wait()
+        self._thread = None
+
+
+    ## Reports a written export
+    # @param path String: The written file
+    @Slot(str)
+    def _written(self,path):
+
+        self._pending -= 1
+        self.exported.emit(path)
+
+
+    ## Reports a failed export
+    # @param message String: The error message
+    @Slot(str)
+    def _failed(self,message):
+
+        self._pending -= 1
+        self.errorSignal.emit(message)
@@ -0,0 +1,142 @@
+from collections import deque
+import inspect
+import time
+
+import numpy as np
+
+from .definitions import TIMINGSAMPLES, TRACESIZE
+
+## Returns the names of the methods defined by the python classes of an object (the Qt base classes are skipped)
+# @param target Object: The object to inspect
+def _methodNames(target):
+
+    names = []
+    for cls in type(target).__mro__:
+        if cls is object or cls.__module__.startswith("PySide2") or cls.__module__.startswith("Shiboken"):
+            continue
+        for name,value in cls.__dict__.items():
+            if inspect.isfunction(value) and not name.startswith("__") and name not in names:
+                names.append(name)
+
+    return names
+
+
+## Class DynamoInstrumentation
+# Collects, for the methods of one or more objects, the number of calls, the cumulative, maximum and percentile
+# durations and, optionally, a trace of the latest calls.
+# The methods are wrapped only when an object is instrumented: the wrappers are set as instance attributes, which
+# shadow the class methods for python calls, signal connections and QML calls alike. Once released the instance
+# attributes are deleted, so objects that are not instrumented pay nothing
+class DynamoInstrumentation(object):
+
+    ## Class constructor
+    # @param samples Integer: The number of the latest durations kept for every method to compute the percentiles
+    # @param traceSize Integer: The number of the latest calls kept in the trace, 0 disables the trace
+    def __init__(self,samples=TIMINGSAMPLES,traceSize=TRACESIZE):
+
+        self._samples = max(int(samples),1)
+        self._trace = deque(maxlen=int(traceSize)) if traceSize > 0 else None
+        self._origin = time.perf_counter()  # The trace times are relative to this instant
+        self._counters = {}  # Method label -> [calls,cumulative time,maximum time,latest durations]
+        self._instrumented = []  # Couples (object,wrapped method names)
+
+
+    ## Wraps the methods of an object
+    # @param target Object: The object to instrument
+    # @param label String: The prefix of the methods labels in the statistics (the class name by default)
+    # @param exclude List: The names of the methods not to wrap
+    def instrument(self,target,label=None,exclude=()):
+
+        if label is None:
+            label = type(target).__name__
+
+        wrapped = []
+        for name in _methodNames(target):
+            if name in exclude or name in target.__dict__:
+                continue
+            setattr(target,name,self._wrap(getattr(target,name),"{0}.{1}".format(label,name)))
+            wrapped.append(name)
+        self._instrumented.append((target,wrapped))
+
+
+    ## Removes the wrappers from all the instrumented objects. The collected statistics are kept
+    def release(self):
+
+        for target,wrapped in self._instrumented:
+            for name in wrapped:
+                try:
+                    delattr(target,name)
+                except AttributeError:
+                    pass
+        self._instrumented = []
+
+
+    ## Returns a method that calls another one measuring its duration
+    # @param method Callable: The bound method to measure
+    # @param key String: The label of the method in the statistics
+    def _wrap(self,method,key):
+
+        counter = self._counters.setdefault(key,[0,0.0,0.0,deque(maxlen=self._samples)])
+        durations = counter[3]
+        trace = self._trace
+        clock = time.perf_counter
+        origin = self._origin
+
+        def timed(*args,**kwargs):
+            start = clock()
+            try:
+                return method(*args,**kwargs)
+            finally:
+                elapsed = clock() - start
+                counter[0] += 1
+                counter[1] += elapsed
+                if elapsed > counter[2]:
+                    counter[2] = elapsed
+                durations.append(elapsed)
+                if trace is not None:
+                    trace.append((start - origin,key,elapsed))
+
+        timed.__name__ = method.__name__
+        timed.__doc__ = method.__doc__
+        return timed
+
+
+    ## Sets all the counters to zero and empties the trace
+    def reset(self):
+
+        for counter in self._counters.values():
+            counter[0] = 0
+            counter[1] = 0.0
+            counter[2] = 0.0
+            counter[3].clear()
+        if self._trace is not None:
+            self._trace.clear()
+
+
+    ## Returns a snapshot of the collected statistics
+    # @param trace Boolean: If True the latest calls are returned too
+    # @return Dictionary: It contains:
+    #                     - "methods": Dictionary, for every called method label a dictionary with "calls",
+    #                       "total", "mean", "max", "p50", "p90" and "p99" (times in seconds)
+    #                     - "trace": List, the latest calls as lists [start time,method label,duration] (only if
+    #                       trace is True)
+    def stats(self,trace=False):
+
+        methods = {}
+        for key,counter in self._counters.items():
+            if counter[0] == 0:
+                continue
+            p50,p90,p99 = np.percentile(np.array(counter[3],dtype=np.float64),[50,90,99]).tolist()
+            methods[key] = {"calls":counter[0],
+                            "total":counter[1],
+                            "mean":counter[1]/counter[0],
+                            "max":counter[2],
+                            "p50":p50,
+                            "p90":p90,
+                            "p99":p99}
+
+        snapshot = {"methods":methods}
+        if trace:
+            snapshot["trace"] = [list(call) for call in self._trace] if self._trace is not None else []
+
+        return snapshot
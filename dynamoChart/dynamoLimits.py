@@ -0,0 +1,190 @@
+from collections import deque
+
+import numpy as np
+
+## Returns the minimum and the maximum of a set of values
+# @param values Array-like: The values
+# @param positiveOnly Boolean: If True only the positive values are considered, as on a log axis
+# @return Tuple: (min,max), None if there are no values to consider
+def valueLimits(values,positiveOnly=False):
+
+    values = np.ravel(np.asarray(values,dtype=np.float64))
+    if positiveOnly:
+        values = values[values > 0]
+    if values.shape[0] == 0:
+        return None
+
+    return np.min(values),np.max(values)
+
+
+## Class DynamoRunningLimits
+# Keeps the minimum and the maximum of a growing set of values. Appending is O(1) per point,
+# removing values invalidates the limits, which then have to be reset from the whole data
+class DynamoRunningLimits(object):
+
+    ## Class constructor
+    # @param positiveOnly Boolean: If True the non positive values are ignored (limits for a log axis)
+    def __init__(self,positiveOnly=False):
+
+        self._min = None
+        self._max = None
+        self._valid = True
+        self._positiveOnly = positiveOnly
+
+
+    ## Tells whether or not the cached limits can be used
+    def valid(self):
+
+        return self._valid
+
+
+    ## Drops the cached limits and computes them again from a set of values
+    # @param values Array-like: All the values currently in the data
+    def reset(self,values):
+
+        self._min = None
+        self._max = None
+        self._valid = True
+        self.update(values)
+
+
+    ## Sets the limits computed elsewhere for the whole data
+    # @param limits List: The minimum and the maximum of the data, None if there are no values
+    def setLimits(self,limits):
+
+        self._valid = True
+        if limits is None:
+            self._min = None
+            self._max = None
+        else:
+            self._min = limits[0]
+            self._max = limits[1]
+
+
+    ## Updates the limits with new values
+    # @param values Array-like: The values just added to the data
+    def update(self,values):
+
+        if not self._valid:
+            return
+        limits = valueLimits(values,self._positiveOnly)
+        if limits is None:
+            return
+
+        newMin,newMax = limits
+        if self._min is None:
+            self._min = newMin
+            self._max = newMax
+        else:
+            self._min = min(self._min,newMin)
+            self._max = max(self._max,newMax)
+
+
+    ## Notifies the removal of the oldest values
+    # @param count Integer: The number of values removed from the beginning of the data
+    def trim(self,count):
+
+        if count > 0:
+            self._valid = False
+
+
+    ## Returns the limits as a tuple (min,max), None if there are no values
+    def getLimits(self):
+
+        if not self._valid or self._min is None:
+            return None
+
+        return self._min,self._max
+
+
+## Class DynamoWindowLimits
+# Keeps the minimum and the maximum of a sliding window of values using two monotonic deques.
+# Both appending and removing the oldest values are amortized O(1) per point
+class DynamoWindowLimits(object):
+
+    ## Class constructor
+    # @param positiveOnly Boolean: If True the non positive values are ignored (limits for a log axis)
+    def __init__(self,positiveOnly=False):
+
+        self._minQueue = deque()  # Couples (index,value) with increasing values, the front is the window minimum
+        self._maxQueue = deque()  # Couples (index,value) with decreasing values, the front is the window maximum
+        self._start = 0  # Absolute index of the oldest value in the window
+        self._end = 0  # Absolute index the next appended value will get
+        self._positiveOnly = positiveOnly
+
+
+    ## Tells whether or not the cached limits can be used
+    def valid(self):
+
+        return True
+
+
+    ## Drops the window and fills it again with a set of values
+    # @param values Array-like: All the values currently in the data
+    def reset(self,values):
+
+        self._minQueue.clear()
+        self._maxQueue.clear()
+        self._start = 0
+        self._end = 0
+        self.update(values)
+
+
+    ## Appends new values to the window
+    # @param values Array-like: The values just added to the data
+    def update(self,values):
+
+        values = np.ravel(np.asarray(values,dtype=np.float64))
+        toAdd = values.shape[0]
+        if toAdd == 0:
+            return
+
+        indexes = np.arange(self._end,self._end + toAdd)
+        self._end += toAdd
+        maxValues = values
+        minValues = values
+        if self._positiveOnly:  # The ignored values still take their index, but can never be a limit
+            ignored = values <= 0
+            maxValues = np.where(ignored,-np.inf,values)
+            minValues = np.where(ignored,np.inf,values)
+
+        # Only the values that are strictly greater (smaller) than all the following ones in the batch can ever be
+        # the window maximum (minimum), and every queued value not greater (smaller) than the batch maximum
+        # (minimum) is dominated by it
+        laterMax = np.maximum.accumulate(maxValues[::-1])[::-1]
+        keepMax = np.ones(toAdd,dtype=bool)
+        keepMax[:-1] = maxValues[:-1] > laterMax[1:]
+        if self._positiveOnly:
+            keepMax &= ~ignored
+        while self._maxQueue and self._maxQueue[-1][1] <= laterMax[0]:
+            self._maxQueue.pop()
+        self._maxQueue.extend(zip(indexes[keepMax].tolist(),values[keepMax].tolist()))
+
+        laterMin = np.minimum.accumulate(minValues[::-1])[::-1]
+        keepMin = np.ones(toAdd,dtype=bool)
+        keepMin[:-1] = minValues[:-1] < laterMin[1:]
+        if self._positiveOnly:
+            keepMin &= ~ignored
+        while self._minQueue and self._minQueue[-1][1] >= laterMin[0]:
+            self._minQueue.pop()
+        self._minQueue.extend(zip(indexes[keepMin].tolist(),values[keepMin].tolist()))
+
+
+    ## Removes the oldest values from the window
+    # @param count Integer: The number of values removed from the beginning of the data
+    def trim(self,count):
+
+        self._start = min(self._start + max(int(count),0),self._end)
+        while self._maxQueue and self._maxQueue[0][0] < self._start:
+            self._maxQueue.popleft()
+        while self._minQueue and self._minQueue[0][0] < self._start:
+            self._minQueue.popleft()
+
+
+    ## Returns the limits as a tuple (min,max), None if the window is empty
+    def getLimits(self):
+
+        if not self._minQueue:
+            return None
+
+        return self._minQueue[0][1],self._maxQueue[0][1]
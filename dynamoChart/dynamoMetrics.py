@@ -0,0 +1,89 @@
+import time
+
+## Class DynamoMetrics
+# Counts what the chart manager does with the incoming data: the chart updates, the points ingested, the time spent
+# converting the points for the GUI, autoscaling the axes and sending the points to the GUI series, and the replaces
+# dropped because the chart was still drawing. The counters are turned into rates and averages once per interval
+class DynamoMetrics(object):
+
+    ## Class constructor
+    def __init__(self):
+
+        self._lastSnapshot = time.perf_counter()
+        self._dropped = 0  # Total number of dropped replaces, it is never reset
+        self._resetCounters()
+
+
+    ## Sets the counters of the current interval to zero
+    def _resetCounters(self):
+
+        self._updates = 0
+        self._points = 0
+        self._conversion = 0.0
+        self._autoscale = 0.0
+        self._replace = 0.0
+
+
+    ## Counts a chart update (a replace, an append or a refresh tick applied to the chart)
+    def countUpdate(self):
+
+        self._updates += 1
+
+
+    ## Counts the points entered in the series stores
+    # @param count Integer: The number of points
+    def countPoints(self,count):
+
+        self._points += count
+
+
+    ## Counts a replace dropped because the chart was still drawing
+    def countDropped(self):
+
+        self._dropped += 1
+
+
+    ## Adds the time spent converting the points for the GUI
+    # @param seconds Double: The time spent
+    def addConversion(self,seconds):
+
+        self._conversion += seconds
+
+
+    ## Adds the time spent autoscaling the axes
+    # @param seconds Double: The time spent
+    def addAutoscale(self,seconds):
+
+        self._autoscale += seconds
+
+
+    ## Adds the time spent sending the points to the GUI series
+    # @param seconds Double: The time spent
+    def addReplace(self,seconds):
+
+        self._replace += seconds
+
+
+    ## Returns the metrics of the interval since the last snapshot and starts a new interval
+    # @return Dictionary: It contains:
+    #                     - "updatesPerSecond": Double, the chart updates per second
+    #                     - "pointsPerSecond": Double, the points ingested per second
+    #                     - "conversionTime": Double, the milliseconds per update spent converting the points
+    #                     - "autoscaleTime": Double, the milliseconds per update spent autoscaling the axes
+    #                     - "replaceTime": Double, the milliseconds per update spent sending the points to the GUI
+    #                     - "droppedReplaces": Integer, the replaces dropped since the manager creation
+    def snapshot(self):
+
+        now = time.perf_counter()
+        elapsed = max(now - self._lastSnapshot,1e-9)
+        updates = max(self._updates,1)
+        metrics = {"updatesPerSecond":self._updates/elapsed,
+                   "pointsPerSecond":self._points/elapsed,
+                   "conversionTime":1000*self._conversion/updates,
+                   "autoscaleTime":1000*self._autoscale/updates,
+                   "replaceTime":1000*self._replace/updates,
+                   "droppedReplaces":self._dropped}
+        self._lastSnapshot = now
+        self._resetCounters()
+
+        return metrics
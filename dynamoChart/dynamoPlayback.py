@@ -0,0 +1,374 @@
+from PySide2.QtCore import QObject, Signal, Slot, QTimer
+import numpy as np
+import json
+import struct
+import time
+
+from .definitions import *
+
+HEADERFORMAT = "<II"  # Version and length of the JSON metadata, after the magic bytes
+DATAALIGNMENT = 16  # The columns start at a multiple of this number of bytes
+
+## Writes a recording file. The file starts with RECORDINGMAGIC, the format version and the length of a JSON
+# metadata block, followed by the metadata and by the x and y columns of every series, stored as raw values
+# @param path String: The file to write
+# @param seriesDict Dictionary: For every series name, a list with the x values and the y values
+# @param dtype String: The type of the stored values (one of RECORDINGDTYPES)
+# @param extra Dictionary: Additional information stored in the metadata under the "extra" key
+def writeRecording(path,seriesDict,dtype="float64",extra=None):
+
+    if dtype not in RECORDINGDTYPES:
+        raise ValueError("Unknown recording type {0}, it must be one of {1}".format(dtype,RECORDINGDTYPES))
+
+    itemSize = np.dtype(dtype).itemsize
+    columns = []
+    series = []
+    offset = 0
+    for name in seriesDict.keys():
+        x = np.ravel(np.asarray(seriesDict[name][0],dtype=dtype))
+        y = np.ravel(np.asarray(seriesDict[name][1],dtype=dtype))
+        if x.shape[0] != y.shape[0]:
+            raise ValueError("Wrong data for series {0}: x and y must have the same number of values".format(name))
+        series.append({"name":name,"count":x.shape[0],"offset":offset})
+        columns.append((x,y))
+        offset += 2*x.shape[0]*itemSize
+
+    meta = json.dumps({"dtype":dtype,"series":series,"extra":extra if extra is not None else {}}).encode("utf-8")
+    headerSize = len(RECORDINGMAGIC) + struct.calcsize(HEADERFORMAT) + len(meta)
+    padding = -headerSize % DATAALIGNMENT
+    with open(path,"wb") as recordingFile:
+        recordingFile.write(RECORDINGMAGIC)
+        recordingFile.write(struct.pack(HEADERFORMAT,RECORDINGVERSION,len(meta)))
+        recordingFile.write(meta)
+        recordingFile.write(b"\0"*padding)
+        for x,y in columns:
+            recordingFile.write(x.tobytes())
+            recordingFile.write(y.tobytes())
+
+
+## Class DynamoRecording
+# Read-only access to a recording file (see writeRecording). The columns are memory mapped: only the pages of the
+# values actually read are loaded, so files larger than the memory can be used
+class DynamoRecording(object):
+
+    ## Class constructor
+    # @param path String: The recording file
+    def __init__(self,path):
+
+        self._path = path
+        with open(path,"rb") as recordingFile:
+            magic = recordingFile.read(len(RECORDINGMAGIC))
+            if magic != RECORDINGMAGIC:
+                raise ValueError("{0} is not a recording file".format(path))
+            version,metaLength = struct.unpack(HEADERFORMAT,recordingFile.read(struct.calcsize(HEADERFORMAT)))
+            if version > RECORDINGVERSION:
+                raise ValueError("Unsupported recording version {0}".format(version))
+            meta = json.loads(recordingFile.read(metaLength).decode("utf-8"))
+
+        headerSize = len(RECORDINGMAGIC) + struct.calcsize(HEADERFORMAT) + metaLength
+        self._dataStart = headerSize + (-headerSize % DATAALIGNMENT)
+        self._dtype = np.dtype(meta["dtype"])
+        self._extra = meta.get("extra",{})
+        self._columns = {}  # Series name -> [x memmap,y memmap]
+        self._names = []
+        for series in meta["series"]:
+            count = series["count"]
+            self._names.append(series["name"])
+            if count == 0:
+                empty = np.empty(0,dtype=self._dtype)
+                self._columns[series["name"]] = [empty,empty]
+                continue
+            offset = self._dataStart + series["offset"]
+            self._columns[series["name"]] = [np.memmap(path,dtype=self._dtype,mode="r",offset=offset,shape=(count,)),
+                                             np.memmap(path,dtype=self._dtype,mode="r",
+                                                       offset=offset + count*self._dtype.itemsize,shape=(count,))]
+
+
+    ## Returns the names of the recorded series
+    def names(self):
+
+        return list(self._names)
+
+
+    ## Returns the type of the recorded values
+    def dtype(self):
+
+        return self._dtype
+
+
+    ## Returns the additional information stored with the recording
+    def extra(self):
+
+        return self._extra
+
+
+    ## Returns the number of points of a series
+    # @param name String: The series name
+    def count(self,name):
+
+        return self._columns[name][0].shape[0]
+
+
+    ## Returns the memory mapped x values of a series (nothing is read until the values are used)
+    # @param name String: The series name
+    def x(self,name):
+
+        return self._columns[name][0]
+
+
+    ## Returns the memory mapped y values of a series (nothing is read until the values are used)
+    # @param name String: The series name
+    def y(self,name):
+
+        return self._columns[name][1]
+
+
+    ## Returns the lowest and the highest x values of all the series, None if there are no points. The x values
+    # have to be sorted, so only the first and the last value of every series are read
+    def xRange(self):
+
+        starts = [self._columns[k][0][0] for k in self._names if self.count(k) > 0]
+        ends = [self._columns[k][0][-1] for k in self._names if self.count(k) > 0]
+        if not starts:
+            return None
+
+        return [float(min(starts)),float(max(ends))]
+
+
+    ## Returns the index of the first point of a series whose x is not lower than a value. The x values have to be
+    # sorted, they are searched with a binary search which only reads a few pages of the file
+    # @param name String: The series name
+    # @param value Double: The x value to search
+    def indexOf(self,name,value):
+
+        return int(np.searchsorted(self._columns[name][0],value,side="left"))
+
+
+    ## Returns the index of the first point of a series whose x is greater than a value (see indexOf)
+    # @param name String: The series name
+    # @param value Double: The x value to search
+    def indexAfter(self,name,value):
+
+        return int(np.searchsorted(self._columns[name][0],value,side="right"))
+
+
+    ## Reads a chunk of a series as float64 arrays
+    # @param name String: The series name
+    # @param start Integer: The index of the first point to read
+    # @param stop Integer: The index following the last point to read
+    # @return List: The x values and the y values
+    def chunk(self,name,start,stop):
+
+        return [np.array(self._columns[name][0][start:stop],dtype=np.float64),
+                np.array(self._columns[name][1][start:stop],dtype=np.float64)]
+
+
+## Class DynamoFilePlayer
+# Plays a recording into a DynamoChartManager. The recording x values are read as time: on every tick the playback
+# position moves forward by the elapsed time multiplied by the playback speed, and the points reached are sent to
+# the manager. In "append" mode they are appended to the series with addPoints, in "window" mode every series is
+# replaced with the points of the window of x values ending at the playback position, which is the only part
+# of the file the chart (and its decimation) has to handle.
+# The series have to be added to the manager, with the same names of the recording, before playing. The x values
+# of every series have to be sorted
+class DynamoFilePlayer(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    positionChanged = Signal(float)
+    finished = Signal()
+    errorSignal = Signal(str)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param recording DynamoRecording: The recording to play
+    # @param manager DynamoChartManager: The manager the points are sent to
+    # @param parent QObject: The parent object
+    # @param rate Double: The number of playback ticks per second
+    def __init__(self,recording,manager,parent=None,rate=PLAYBACKRATE):
+
+        QObject.__init__(self,parent)
+        self._recording = recording
+        self._manager = manager
+        self._mode = PLAYBACKAPPEND
+        self._speed = 1.0  # Recording x units played per second
+        self._loop = False
+        self._range = recording.xRange()
+        self._window = 0  # The x span replaced in "window" mode (see setWindow)
+        if self._range is not None:
+            self._window = PLAYBACKSPAN*(self._range[1] - self._range[0])
+        self._sent = {}  # Series name -> [start,end] indexes of the window sent last ("window" mode)
+        self._position = self._range[0] if self._range is not None else 0.0
+        self._cursors = {}  # Series name -> index of the first point not sent yet ("append" mode)
+        self._lastTick = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000/max(rate,1)))
+        self._timer.timeout.connect(self._tick)
+        self._resetCursors()
+
+
+    ## Returns the current playback position (a recording x value)
+    def position(self):
+
+        return self._position
+
+
+    ## Tells whether or not the recording is playing
+    def playing(self):
+
+        return self._timer.isActive()
+
+
+    ## Sets the index of the first point to send, for every series, at the current position
+    def _resetCursors(self):
+
+        for name in self._recording.names():
+            self._cursors[name] = self._recording.indexOf(name,self._position)
+
+
+    ## Sends the points between the last sent one and the current position ("append" mode) or the window ending at
+    # the current position ("window" mode). A window is sent only if its points changed since the last time
+    # @param force Boolean: If True the windows are sent even if their points did not change
+    def _feed(self,force=False):
+
+        toSend = {}
+        for name in self._recording.names():
+            end = self._recording.indexAfter(name,self._position)
+            if self._mode == PLAYBACKWINDOW:
+                start = 0
+                if self._window > 0:
+                    start = self._recording.indexAfter(name,self._position - self._window)
+                if force or self._sent.get(name) != [start,end]:
+                    toSend[name] = self._recording.chunk(name,start,end)
+                    self._sent[name] = [start,end]
+            elif end > self._cursors[name]:
+                toSend[name] = self._recording.chunk(name,self._cursors[name],end)
+            self._cursors[name] = end
+
+        if not toSend:
+            return
+        if self._mode == PLAYBACKWINDOW:
+            self._manager.replaceSeries(toSend)
+        else:
+            self._manager.addPoints(toSend)
+
+
+    ## Empties the series, so that the playback can start again from the current position
+    def _restart(self):
+
+        self._resetCursors()
+        if self._mode == PLAYBACKAPPEND:
+            empty = np.empty(0,dtype=np.float64)
+            self._manager.replaceSeries({name:[empty,empty] for name in self._recording.names()})
+        else:
+            self._feed(True)
+
+
+    ## Moves the playback position forward and sends the points reached
+    @Slot()
+    def _tick(self):
+
+        if self._range is None:
+            self.stop()
+            return
+
+        now = time.perf_counter()
+        self._position += (now - self._lastTick)*self._speed
+        self._lastTick = now
+        if self._position >= self._range[1]:
+            self._position = self._range[1]
+            self._feed()
+            self.positionChanged.emit(self._position)
+            if self._loop:
+                self._position = self._range[0]
+                self._restart()
+            else:
+                self._timer.stop()
+                self.finished.emit()
+            return
+
+        self._feed()
+        self.positionChanged.emit(self._position)
+
+
+    ## Starts or resumes the playback
+    @Slot()
+    def play(self):
+
+        if self._range is None or self._timer.isActive():
+            return
+        if self._position >= self._range[1]:
+            self._position = self._range[0]
+            self._restart()
+        self._lastTick = time.perf_counter()
+        self._timer.start()
+
+
+    ## Pauses the playback
+    @Slot()
+    def pause(self):
+
+        self._timer.stop()
+
+
+    ## Stops the playback and goes back to the beginning of the recording
+    @Slot()
+    def stop(self):
+
+        self._timer.stop()
+        if self._range is not None:
+            self.seek(self._range[0])
+
+
+    ## Moves the playback position. In "append" mode the series are emptied and filled again from the new position,
+    # in "window" mode the window ending at the new position is sent at once
+    # @param position Double: The new position (a recording x value)
+    @Slot(float)
+    def seek(self,position):
+
+        if self._range is None:
+            return
+        self._position = min(max(position,self._range[0]),self._range[1])
+        self._restart()
+        self.positionChanged.emit(self._position)
+
+
+    ## Sets the playback speed
+    # @param speed Double: The recording x units played per second (e.g. 2 plays a recording in seconds twice as fast)
+    @Slot(float)
+    def setSpeed(self,speed):
+
+        self._speed = max(speed,0.0)
+
+
+    ## Sets whether or not the playback starts again from the beginning when the end is reached
+    # @param value Boolean: True to loop
+    @Slot(bool)
+    def setLoop(self,value):
+
+        self._loop = value
+
+
+    ## Sets the playback mode
+    # @param mode String: One of PLAYBACKMODES
+    @Slot(str)
+    def setMode(self,mode):
+
+        if mode not in PLAYBACKMODES:
+            self.errorSignal.emit("Wrong playback mode")
+            return
+        self._mode = mode
+        self._restart()
+
+
+    ## Sets the x span sent in "window" mode (PLAYBACKSPAN of the recording x range by default). Only the points
+    # inside the window are read from the recording at every tick. With a span of 0 all the played points are sent
+    # instead: every tick then costs O(played points), which grows with the playback time
+    # @param span Double: The span of x values ending at the playback position, 0 for all the played points
+    @Slot(float)
+    def setWindow(self,span):
+
+        self._window = max(span,0.0)
+        if self._mode == PLAYBACKWINDOW:
+            self._feed(True)
@@ -0,0 +1,168 @@
+import numpy as np
+
+## Class DynamoPyramid
+# Multi-resolution (level of detail) index of a series. Level k splits the points in buckets of 2**k points and keeps,
+# for every complete bucket, the indexes of its lowest and highest point. Every level is built from the previous one,
+# so appending points only computes the new buckets. A view of any x range is then made slicing the level whose
+# buckets are about one pixel wide, in a time proportional to the number of visible buckets.
+# The buckets are numbered from the first point ever indexed, so removing the oldest points (e.g. a strip chart trim)
+# only drops the leading buckets that lost any point: the buckets left keep their indexes and nothing is rebuilt
+class DynamoPyramid(object):
+
+    ## Class constructor
+    def __init__(self):
+
+        self._minIndexes = []  # For every level (starting from level 1), the index of the lowest point of each bucket
+        self._maxIndexes = []  # For every level (starting from level 1), the index of the highest point of each bucket
+        self._bases = []  # For every level (starting from level 1), the number of the bucket stored first
+        self._firsts = []  # For every level (starting from level 1), the position of the first bucket not trimmed
+        self._sizes = []  # For every level (starting from level 1), the position after the last complete bucket
+        self._offset = 0  # The number of points removed from the start of the series (the index of its first point)
+        self._count = 0  # The index after the last point indexed (the removed points are counted too)
+
+
+    ## Returns the number of levels above the raw points
+    def levels(self):
+
+        return len(self._sizes)
+
+
+    ## Drops the index and builds it again
+    # @param y Numpy array: All the y values of the series
+    def reset(self,y):
+
+        self._minIndexes = []
+        self._maxIndexes = []
+        self._bases = []
+        self._firsts = []
+        self._sizes = []
+        self._offset = 0
+        self._count = 0
+        self.update(y)
+
+
+    ## Drops the buckets that contained any of the points removed from the start of the series. It takes a time
+    # proportional to the number of levels: the arrays are compacted when new buckets need their space (see _store)
+    # @param removed Integer: The number of oldest points removed since the last update
+    def trim(self,removed):
+
+        self._offset += removed
+        for level in range(len(self._sizes)):
+            firstBucket = -(-self._offset >> (level + 1))  # The first bucket with all its points still in the series
+            self._firsts[level] = min(max(firstBucket - self._bases[level],self._firsts[level]),self._sizes[level])
+
+        while self._sizes and self._firsts[-1] == self._sizes[-1]:  # Drops the levels left without buckets
+            for levelList in [self._minIndexes,self._maxIndexes,self._bases,self._firsts,self._sizes]:
+                levelList.pop()
+
+
+    ## Adds to the index the buckets completed by the points appended since the last update
+    # @param y Numpy array: All the y values of the series (the already indexed ones have to be unchanged, the removed
+    #                       ones have to be reported to trim first)
+    def update(self,y):
+
+        self._count = self._offset + y.shape[0]
+        belowFirst = self._offset  # The first unit (point or bucket) of the level below and the one after its last
+        belowEnd = self._count
+        level = 0
+        while belowEnd//2 > (belowFirst + 1)//2:
+            first = (belowFirst + 1)//2  # The first bucket of this level made of units still in the series
+            complete = belowEnd//2
+            if level == len(self._sizes):
+                self._minIndexes.append(np.empty(max(complete - first,16),dtype=np.int64))
+                self._maxIndexes.append(np.empty(max(complete - first,16),dtype=np.int64))
+                self._bases.append(first)
+                self._firsts.append(0)
+                self._sizes.append(0)
+            elif self._bases[level] + self._sizes[level] < first:  # All the buckets of this level were trimmed
+                self._bases[level] = first
+                self._firsts[level] = 0
+                self._sizes[level] = 0
+
+            done = self._bases[level] + self._sizes[level]
+            if complete > done:
+                if level == 0:
+                    firstMin = np.arange(2*done,2*complete,2,dtype=np.int64)
+                    secondMin = firstMin + 1
+                    firstMax = firstMin
+                    secondMax = secondMin
+                else:
+                    below = 2*done - self._bases[level - 1]
+                    toBuild = 2*(complete - done)
+                    firstMin = self._minIndexes[level - 1][below:below + toBuild:2]
+                    secondMin = self._minIndexes[level - 1][below + 1:below + toBuild:2]
+                    firstMax = self._maxIndexes[level - 1][below:below + toBuild:2]
+                    secondMax = self._maxIndexes[level - 1][below + 1:below + toBuild:2]
+                offset = self._offset
+                self._store(level,np.where(y[firstMin - offset] <= y[secondMin - offset],firstMin,secondMin),
+                            np.where(y[firstMax - offset] >= y[secondMax - offset],firstMax,secondMax))
+
+            belowFirst = self._bases[level] + self._firsts[level]
+            belowEnd = self._bases[level] + self._sizes[level]
+            level += 1
+
+
+    ## Appends new buckets to a level, dropping its trimmed buckets and growing its arrays when there is no room left
+    # @param level Integer: The level (0 for buckets of 2 points)
+    # @param newMin Numpy array: The indexes of the lowest points of the new buckets
+    # @param newMax Numpy array: The indexes of the highest points of the new buckets
+    def _store(self,level,newMin,newMax):
+
+        size = self._sizes[level]
+        needed = size + newMin.shape[0]
+        if needed > self._minIndexes[level].shape[0]:
+            first = self._firsts[level]
+            kept = size - first
+            capacity = self._minIndexes[level].shape[0]
+            while capacity < kept + newMin.shape[0]:
+                capacity *= 2
+            compactMin = np.empty(capacity,dtype=np.int64)
+            compactMax = np.empty(capacity,dtype=np.int64)
+            compactMin[:kept] = self._minIndexes[level][first:size]
+            compactMax[:kept] = self._maxIndexes[level][first:size]
+            self._minIndexes[level] = compactMin
+            self._maxIndexes[level] = compactMax
+            self._bases[level] += first
+            self._firsts[level] = 0
+            size = kept
+            needed = size + newMin.shape[0]
+        self._minIndexes[level][size:needed] = newMin
+        self._maxIndexes[level][size:needed] = newMax
+        self._sizes[level] = needed
+
+
+    ## Returns the points to draw a x range on a certain number of pixel columns. The x values have to be sorted
+    # @param x Numpy array: All the x values of the series
+    # @param y Numpy array: All the y values of the series
+    # @param xMin Double: The x value at the left border of the plot area
+    # @param xMax Double: The x value at the right border of the plot area
+    # @param width Integer: The plot area width in pixels
+    # @return List: The x and y values to draw
+    def query(self,x,y,xMin,xMax,width):
+
+        width = int(width)
+        first = max(int(np.searchsorted(x,xMin,side='left')) - 1,0)
+        last = min(int(np.searchsorted(x,xMax,side='right')) + 1,self._count - self._offset)
+        span = last - first
+        if width <= 0 or span <= 4*width:
+            return x[first:last],y[first:last]
+
+        # The chosen level has between width and 2*width buckets in the visible range
+        level = min(int(np.log2(span/width)),len(self._sizes))
+        base = self._bases[level - 1]
+        firstBucket = max(((first + self._offset) >> level) - base,self._firsts[level - 1])
+        lastBucket = max(min(((last - 1 + self._offset) >> level) + 1 - base,self._sizes[level - 1]),firstBucket)
+        toKeep = [self._minIndexes[level - 1][firstBucket:lastBucket] - self._offset,
+                  self._maxIndexes[level - 1][firstBucket:lastBucket] - self._offset,
+                  np.array([first,last - 1],dtype=np.int64)]
+        headEnd = min(max(((base + firstBucket) << level) - self._offset,first),last)
+        if first < headEnd:  # The oldest points are in a bucket that was trimmed
+            toKeep.append(np.array([first + np.argmin(y[first:headEnd]),first + np.argmax(y[first:headEnd])],
+                                   dtype=np.int64))
+        tailStart = max(((base + lastBucket) << level) - self._offset,headEnd)
+        if tailStart < last:  # The newest points do not fill a complete bucket yet
+            toKeep.append(np.array([tailStart + np.argmin(y[tailStart:last]),tailStart + np.argmax(y[tailStart:last])],
+                                   dtype=np.int64))
+
+        keep = np.unique(np.concatenate(toKeep))
+        return x[keep],y[keep]
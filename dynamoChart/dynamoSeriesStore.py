@@ -0,0 +1,207 @@
+import numpy as np
+
+from .definitions import STORECAPACITY
+from .dynamoConversion import toPolygon
+
+## Class DynamoSeriesStore
+# Columnar copy of the points of a series. It is the data source of truth for the chart manager:
+# the GUI series is only written and never read back.
+# The valid points are stored between two offsets, so removing the oldest points (e.g. in a strip chart) just moves
+# the first offset; the points are moved back to the beginning of the buffer only when the buffer end is reached
+class DynamoSeriesStore(object):
+
+    ## Class constructor
+    # @param name String: The name of the stored series
+    # @param capacity Integer: The number of points the store can hold before growing
+    def __init__(self,name,capacity=STORECAPACITY):
+
+        self._name = name
+        self._x = np.empty(max(int(capacity),1),dtype=np.float64)
+        self._y = np.empty(max(int(capacity),1),dtype=np.float64)
+        self._start = 0  # Index of the oldest stored point in the buffers
+        self._end = 0  # Index following the newest stored point in the buffers
+        self._sorted = True  # True while the x values are in non decreasing order
+
+
+    ## Returns the name of the stored series
+    def name(self):
+
+        return self._name
+
+
+    ## Returns the number of stored points
+    def count(self):
+
+        return self._end - self._start
+
+
+    ## Returns the number of points the store can hold before growing
+    def capacity(self):
+
+        return self._x.shape[0]
+
+
+    ## Returns the stored x values (it is a view on the store, not a copy)
+    def x(self):
+
+        return self._x[self._start:self._end]
+
+
+    ## Returns the stored y values (it is a view on the store, not a copy)
+    def y(self):
+
+        return self._y[self._start:self._end]
+
+
+    ## Tells whether or not the x values are sorted in non decreasing order
+    def isSorted(self):
+
+        return self._sorted
+
+
+    ## Returns the x or the y values
+    # @param asX Boolean: If True the x values are returned, otherwise the y ones
+    def column(self,asX):
+
+        if asX:
+            return self.x()
+        return self.y()
+
+
+    ## Makes room for a certain number of points after the newest one
+    # The stored points are moved to the beginning of the buffers if they fill less than half of them, otherwise
+    # the capacity is doubled until everything fits
+    # @param toAdd Integer: The number of points that are going to be appended
+    def _reserve(self,toAdd):
+
+        if self._end + toAdd <= self._x.shape[0]:
+            return
+
+        size = self._end - self._start
+        needed = size + toAdd
+        newCapacity = self._x.shape[0]
+        while newCapacity < 2*needed:
+            newCapacity *= 2
+        if newCapacity == self._x.shape[0]:
+            newX = self._x
+            newY = self._y
+        else:
+            newX = np.empty(newCapacity,dtype=np.float64)
+            newY = np.empty(newCapacity,dtype=np.float64)
+        newX[:size] = self._x[self._start:self._end]
+        newY[:size] = self._y[self._start:self._end]
+        self._x = newX
+        self._y = newY
+        self._start = 0
+        self._end = size
+
+
+    ## Appends one or more points
+    # @param newX Double or array-like: The x values to append
+    # @param newY Double or array-like: The y values to append
+    def append(self,newX,newY):
+
+        newX = np.ravel(np.asarray(newX,dtype=np.float64))
+        newY = np.ravel(np.asarray(newY,dtype=np.float64))
+        if newX.shape[0] != newY.shape[0]:
+            raise ValueError("x and y must have the same number of values")
+
+        toAdd = newX.shape[0]
+        if toAdd == 0:
+            return
+        if self._sorted:
+            self._sorted = bool(np.all(newX[1:] >= newX[:-1])) and (self._end == self._start or
+                                                                   newX[0] >= self._x[self._end - 1])
+        self._reserve(toAdd)
+        self._x[self._end:self._end + toAdd] = newX
+        self._y[self._end:self._end + toAdd] = newY
+        self._end += toAdd
+
+
+    ## Replaces all the stored points
+    # @param newX Array-like: The new x values
+    # @param newY Array-like: The new y values
+    def replace(self,newX,newY):
+
+        self.clear()
+        self.append(newX,newY)
+
+
+    ## Replaces all the stored points taking ownership of two arrays, without copying them. The arrays must not be
+    # used by anyone else afterwards
+    # @param newX Numpy array: The new x values, contiguous float64
+    # @param newY Numpy array: The new y values, contiguous float64
+    # @param isSorted Boolean: True if the new x values are sorted in non decreasing order
+    def adopt(self,newX,newY,isSorted):
+
+        if newX.shape[0] == 0:
+            self.clear()
+            return
+
+        self._x = newX
+        self._y = newY
+        self._start = 0
+        self._end = newX.shape[0]
+        self._sorted = isSorted
+
+
+    ## Removes the oldest points
+    # @param count Integer: The number of points to remove from the beginning of the store
+    def removeFirst(self,count):
+
+        count = min(max(int(count),0),self.count())
+        self._start += count
+        if self._start == self._end:
+            self.clear()
+
+
+    ## Keeps only the newest points
+    # @param points Integer: The maximum number of points to keep
+    # @return Integer: The number of removed points
+    def trimToCount(self,points):
+
+        toRemove = max(self.count() - int(points),0)
+        self.removeFirst(toRemove)
+
+        return toRemove
+
+
+    ## Keeps only the points whose x is not older than a certain span from the newest one. The x values have to be
+    # sorted, the first point to keep is found by binary search
+    # @param span Double: The x span to keep
+    # @return Integer: The number of removed points
+    def trimToSpan(self,span):
+
+        if self.count() == 0:
+            return 0
+
+        toRemove = int(np.searchsorted(self.x(),self._x[self._end - 1] - span,side='left'))
+        self.removeFirst(toRemove)
+
+        return toRemove
+
+
+    ## Removes all the stored points
+    def clear(self):
+
+        self._start = 0
+        self._end = 0
+        self._sorted = True
+
+
+    ## Returns the minimum and the maximum of the x or y values, None if the store is empty
+    # @param asX Boolean: If True the x limits are returned, otherwise the y ones
+    def getLimits(self,asX):
+
+        if self._end == self._start:
+            return None
+
+        toSearch = self.column(asX)
+        return np.min(toSearch),np.max(toSearch)
+
+
+    ## Returns the stored points as a QPolygonF, ready to be sent to a GUI series
+    # @param start Integer: The index of the first point to convert
+    def toPoints(self,start=0):
+
+        return toPolygon(self.x()[start:],self.y()[start:])
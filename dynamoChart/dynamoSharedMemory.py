@@ -0,0 +1,198 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+from .definitions import SHAREDCAPACITY
+
+SHAREDMAGIC = 0x44594E414D4F5348  # It marks the shared memory blocks created by DynamoSharedProducer
+HEADERSIZE = 4  # Number of int64 values in the header: magic, capacity, write count, target count
+MAGICINDEX = 0
+CAPACITYINDEX = 1
+COUNTINDEX = 2
+TARGETINDEX = 3  # The write count the producer is writing up to: the points below it minus the capacity are overwritten
+
+## Attaches to an existing shared memory block without letting this process unlink it at exit
+# @param shmName String: The name of the shared memory block
+def _attach(shmName):
+
+    try:
+        return shared_memory.SharedMemory(name=shmName,track=False)
+    except TypeError:  # Before python 3.13 every attached block is registered to the resource tracker
+        block = shared_memory.SharedMemory(name=shmName)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(block._name,"shared_memory")
+        except Exception:
+            pass
+        return block
+
+
+## Returns the header and the x and y columns of a shared memory channel
+# @param block SharedMemory: The shared memory block
+# @param capacity Integer: The number of points of the ring buffer
+def _views(block,capacity):
+
+    header = np.ndarray((HEADERSIZE,),dtype=np.int64,buffer=block.buf)
+    x = np.ndarray((capacity,),dtype=np.float64,buffer=block.buf,offset=8*HEADERSIZE)
+    y = np.ndarray((capacity,),dtype=np.float64,buffer=block.buf,offset=8*(HEADERSIZE + capacity))
+
+    return header,x,y
+
+
+## Class DynamoSharedProducer
+# Producer side of a shared memory channel: a ring buffer of x and y values that a producer process fills and a
+# DynamoChartManager in another process reads on its refresh tick. The block starts with a header holding a magic
+# number, the ring buffer capacity and the total number of points ever written; the write count is updated only
+# after the points have been written, so the reader never sees points that are not complete. Before writing, the
+# producer publishes the count it is writing up to (the target count), so the reader can tell which of the points it
+# copied may have been overwritten meanwhile
+class DynamoSharedProducer(object):
+
+    ## Class constructor
+    # @param shmName String: The name of the shared memory block (the reader attaches to it by name)
+    # @param capacity Integer: The number of points held by the ring buffer
+    # @param create Boolean: If True a new block is created, otherwise an existing one is opened
+    def __init__(self,shmName,capacity=SHAREDCAPACITY,create=True):
+
+        if create:
+            capacity = max(int(capacity),1)
+            self._block = shared_memory.SharedMemory(name=shmName,create=True,size=8*(HEADERSIZE + 2*capacity))
+            self._header,self._x,self._y = _views(self._block,capacity)
+            self._header[:] = 0
+            self._header[MAGICINDEX] = SHAREDMAGIC
+            self._header[CAPACITYINDEX] = capacity
+        else:
+            self._block = _attach(shmName)
+            header = np.ndarray((HEADERSIZE,),dtype=np.int64,buffer=self._block.buf)
+            if header[MAGICINDEX] != SHAREDMAGIC:
+                self._block.close()
+                raise ValueError("{0} is not a shared memory channel".format(shmName))
+            capacity = int(header[CAPACITYINDEX])
+            self._header,self._x,self._y = _views(self._block,capacity)
+        self._capacity = capacity
+        self._count = int(self._header[COUNTINDEX])
+
+
+    ## Returns the name of the shared memory block
+    def name(self):
+
+        return self._block.name
+
+
+    ## Returns the number of points held by the ring buffer
+    def capacity(self):
+
+        return self._capacity
+
+
+    ## Writes a block of points. If it is larger than the ring buffer only its newest points are kept
+    # @param newX Double or array-like: The x values
+    # @param newY Double or array-like: The y values
+    def write(self,newX,newY):
+
+        newX = np.ravel(np.asarray(newX,dtype=np.float64))
+        newY = np.ravel(np.asarray(newY,dtype=np.float64))
+        if newX.shape[0] != newY.shape[0]:
+            raise ValueError("x and y must have the same number of values")
+
+        toWrite = newX.shape[0]
+        if toWrite == 0:
+            return
+        skipped = max(toWrite - self._capacity,0)
+        newX = newX[skipped:]
+        newY = newY[skipped:]
+        self._header[TARGETINDEX] = self._count + toWrite  # Published first: these slots are about to change
+        start = (self._count + skipped) % self._capacity
+        first = min(newX.shape[0],self._capacity - start)
+        self._x[start:start + first] = newX[:first]
+        self._y[start:start + first] = newY[:first]
+        self._x[:newX.shape[0] - first] = newX[first:]
+        self._y[:newX.shape[0] - first] = newY[first:]
+
+        self._count += toWrite
+        self._header[COUNTINDEX] = self._count  # Published last: the points are complete when the reader sees them
+
+
+    ## Detaches from the shared memory block
+    def close(self):
+
+        self._header = None
+        self._x = None
+        self._y = None
+        self._block.close()
+
+
+    ## Destroys the shared memory block. It has to be called once, by the process that created it, after closing
+    def unlink(self):
+
+        self._block.unlink()
+
+
+## Class DynamoSharedReader
+# Reader side of a shared memory channel (see DynamoSharedProducer). Every read returns a copy of the points written
+# since the previous one. The producer may overwrite the oldest of them while they are copied: they are checked
+# against the producer target count once copied, and the overwritten ones are dropped. The points the producer
+# overwrote before being read, or while being copied, are lost and counted
+class DynamoSharedReader(object):
+
+    ## Class constructor
+    # @param shmName String: The name of the shared memory block
+    def __init__(self,shmName):
+
+        self._block = _attach(shmName)
+        header = np.ndarray((HEADERSIZE,),dtype=np.int64,buffer=self._block.buf)
+        if header[MAGICINDEX] != SHAREDMAGIC:
+            self._block.close()
+            raise ValueError("{0} is not a shared memory channel".format(shmName))
+        self._capacity = int(header[CAPACITYINDEX])
+        self._header,self._x,self._y = _views(self._block,self._capacity)
+        self._read = max(int(self._header[COUNTINDEX]) - self._capacity,0)  # The points still in the buffer are read
+        self._lost = 0
+
+
+    ## Returns the number of points lost because the producer overwrote them before they were read
+    def lost(self):
+
+        return self._lost
+
+
+    ## Returns the points written since the previous read
+    # @return List: The x values and the y values, copied from the shared memory
+    def read(self):
+
+        count = int(self._header[COUNTINDEX])
+        if count - self._read > self._capacity:
+            self._lost += count - self._read - self._capacity
+            self._read = count - self._capacity
+        first = self._read
+        toRead = count - first
+        start = first % self._capacity
+        self._read = count
+        if start + toRead <= self._capacity:
+            newX = self._x[start:start + toRead].copy()
+            newY = self._y[start:start + toRead].copy()
+        else:
+            wrapped = start + toRead - self._capacity
+            newX = np.concatenate((self._x[start:],self._x[:wrapped]))
+            newY = np.concatenate((self._y[start:],self._y[:wrapped]))
+
+        # The slots the producer wrote, or started writing, while the points were copied are not reliable
+        target = max(int(self._header[TARGETINDEX]),int(self._header[COUNTINDEX]))
+        overwritten = min(max(target - self._capacity - first,0),toRead)
+        if overwritten > 0:
+            self._lost += overwritten
+            newX = newX[overwritten:]
+            newY = newY[overwritten:]
+
+        return [newX,newY]
+
+
+    ## Detaches from the shared memory block
+    def close(self):
+
+        self._header = None
+        self._x = None
+        self._y = None
+        try:
+            self._block.close()
+        except BufferError:
+            pass
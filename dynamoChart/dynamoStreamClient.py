@@ -0,0 +1,98 @@
+import json
+import os
+import socket
+import struct
+import tempfile
+
+import numpy as np
+
+from .definitions import STREAMHEADER, STREAMADDSERIES, STREAMAPPEND, STREAMREPLACE, STREAMSYNC, STREAMACK
+
+## Class DynamoStreamClient
+# Reference client of DynamoStreamServer. It only needs the python standard library and numpy (no Qt), and it
+# shows the whole protocol: every call sends one frame (see the streaming protocol in definitions). The sends block
+# while the server is behind, and sync waits until everything sent has been applied to the chart
+class DynamoStreamClient(object):
+
+    ## Class constructor
+    # @param localName String: The local server name or the full path of its socket (unix systems only)
+    # @param host String: The server host, used when localName is None
+    # @param port Integer: The server TCP port, used when localName is None
+    def __init__(self,localName=None,host="127.0.0.1",port=None):
+
+        if localName is not None:
+            path = localName if os.path.isabs(localName) else os.path.join(tempfile.gettempdir(),localName)
+            self._socket = socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
+            self._socket.connect(path)
+        else:
+            self._socket = socket.create_connection((host,port))
+            self._socket.setsockopt(socket.IPPROTO_TCP,socket.TCP_NODELAY,1)
+
+
+    ## Sends a frame
+    # @param operation Integer: The frame operation
+    # @param name String: The series name
+    # @param count Integer: The number of points (or of bytes of the features for STREAMADDSERIES)
+    # @param payload List: The bytes-like objects following the name
+    def _send(self,operation,name,count,payload=()):
+
+        encodedName = name.encode("utf-8")
+        self._socket.sendall(struct.pack(STREAMHEADER,operation,len(encodedName),count) + encodedName)
+        for part in payload:
+            self._socket.sendall(part)
+
+
+    ## Sends the x and y values of a set of points
+    # @param operation Integer: STREAMAPPEND or STREAMREPLACE
+    # @param name String: The series name
+    # @param newX Array-like: The x values
+    # @param newY Array-like: The y values
+    def _sendPoints(self,operation,name,newX,newY):
+
+        newX = np.ascontiguousarray(np.ravel(newX),dtype="<f8")
+        newY = np.ascontiguousarray(np.ravel(newY),dtype="<f8")
+        if newX.shape[0] != newY.shape[0]:
+            raise ValueError("x and y must have the same number of values")
+        self._send(operation,name,newX.shape[0],[memoryview(newX).cast("B"),memoryview(newY).cast("B")])
+
+
+    ## Adds a series to the chart
+    # @param features Dictionary: The series features (see DynamoChartManager.addSeries), "name" included
+    def addSeries(self,features):
+
+        features = dict(features)
+        name = features.pop("name")
+        encoded = json.dumps(features).encode("utf-8")
+        self._send(STREAMADDSERIES,name,len(encoded),[encoded])
+
+
+    ## Appends points to a series
+    # @param name String: The series name
+    # @param newX Double or array-like: The x values
+    # @param newY Double or array-like: The y values
+    def append(self,name,newX,newY):
+
+        self._sendPoints(STREAMAPPEND,name,newX,newY)
+
+
+    ## Replaces all the points of a series
+    # @param name String: The series name
+    # @param newX Array-like: The x values
+    # @param newY Array-like: The y values
+    def replace(self,name,newX,newY):
+
+        self._sendPoints(STREAMREPLACE,name,newX,newY)
+
+
+    ## Waits until the server has applied everything sent so far
+    def sync(self):
+
+        self._send(STREAMSYNC,"",0)
+        if self._socket.recv(len(STREAMACK)) != STREAMACK:
+            raise ConnectionError("The server closed the connection")
+
+
+    ## Closes the connection
+    def close(self):
+
+        self._socket.close()
@@ -0,0 +1,229 @@
+from PySide2.QtCore import QObject, Signal, Slot
+from PySide2.QtNetwork import QLocalServer, QTcpServer, QHostAddress
+from functools import partial
+import numpy as np
+import json
+import struct
+
+from .definitions import *
+
+## Class DynamoStreamServer
+# Ingestion server for producers living in other processes (see DynamoStreamClient for the reference client). It
+# listens on a local socket (QLocalServer) and/or on a TCP port and applies the frames it receives (see the
+# streaming protocol in definitions) to a DynamoChartManager.
+# Every connection has its own buffer: all the complete frames received are applied at once, the appends to the
+# same series being joined in a single addPoints call. The frames are applied on the GUI thread as they are read,
+# so a producer faster than the chart fills the socket buffers and waits on its sends
+class DynamoStreamServer(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    errorSignal = Signal(str)
+    clientConnected = Signal()
+    clientDisconnected = Signal()
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param manager DynamoChartManager: The manager the frames are applied to
+    # @param parent QObject: The parent object
+    def __init__(self,manager,parent=None):
+
+        QObject.__init__(self,parent)
+        self._manager = manager
+        self._localServer = None
+        self._tcpServer = None
+        self._buffers = {}  # Connected socket -> bytes received and not applied yet
+        self._headerSize = struct.calcsize(STREAMHEADER)
+
+
+    ## Starts listening on a local socket
+    # @param name String: The server name (on unix systems the socket is created in the temporary directory,
+    #                     unless the name is a full path)
+    # @return Boolean: True if the server is listening
+    def listenLocal(self,name):
+
+        if self._localServer is None:
+            self._localServer = QLocalServer(self)
+            self._localServer.newConnection.connect(self._acceptLocal)
+        QLocalServer.removeServer(name)  # A server that crashed may have left its socket file
+        if not self._localServer.listen(name):
+            self.errorSignal.emit("Unable to listen on {0}: {1}".format(name,self._localServer.errorString()))
+            return False
+
+        return True
+
+
+    ## Starts listening on a TCP port
+    # @param port Integer: The port, 0 to let the system choose one (see tcpPort)
+    # @param host String: The address to listen on, the loopback one by default
+    # @return Boolean: True if the server is listening
+    def listenTcp(self,port,host="127.0.0.1"):
+
+        if self._tcpServer is None:
+            self._tcpServer = QTcpServer(self)
+            self._tcpServer.newConnection.connect(self._acceptTcp)
+        if not self._tcpServer.listen(QHostAddress(host),port):
+            self.errorSignal.emit("Unable to listen on {0}:{1}: {2}".format(host,port,self._tcpServer.errorString()))
+            return False
+
+        return True
+
+
+    ## Returns the full name of the local socket, an empty string if not listening
+    def localName(self):
+
+        if self._localServer is None:
+            return ""
+        return self._localServer.fullServerName()
+
+
+    ## Returns the TCP port the server listens on, 0 if not listening
+    def tcpPort(self):
+
+        if self._tcpServer is None:
+            return 0
+        return self._tcpServer.serverPort()
+
+
+    ## Stops listening and closes all the connections
+    @Slot()
+    def close(self):
+
+        if self._localServer is not None:
+            self._localServer.close()
+        if self._tcpServer is not None:
+            self._tcpServer.close()
+        for socket in list(self._buffers.keys()):
+            socket.abort()
+        self._buffers = {}
+
+
+    ## Accepts the pending local connections
+    @Slot()
+    def _acceptLocal(self):
+
+        while self._localServer.hasPendingConnections():
+            self._addConnection(self._localServer.nextPendingConnection())
+
+
+    ## Accepts the pending TCP connections
+    @Slot()
+    def _acceptTcp(self):
+
+        while self._tcpServer.hasPendingConnections():
+            self._addConnection(self._tcpServer.nextPendingConnection())
+
+
+    ## Starts serving a new connection
+    # @param socket QLocalSocket or QTcpSocket: The connected socket
+    def _addConnection(self,socket):
+
+        socket.setReadBufferSize(STREAMBUFFERSIZE)
+        self._buffers[socket] = bytearray()
+        socket.readyRead.connect(partial(self._read,socket))
+        socket.disconnected.connect(partial(self._drop,socket))
+        self.clientConnected.emit()
+
+
+    ## Forgets a closed connection
+    # @param socket QLocalSocket or QTcpSocket: The disconnected socket
+    def _drop(self,socket):
+
+        if self._buffers.pop(socket,None) is not None:
+            socket.deleteLater()
+            self.clientDisconnected.emit()
+
+
+    ## Reads the data available on a connection and applies all the complete frames
+    # @param socket QLocalSocket or QTcpSocket: The socket with data to read
+    def _read(self,socket):
+
+        if socket not in self._buffers:
+            return
+        buffer = self._buffers[socket]
+        buffer.extend(socket.readAll().data())
+        while len(buffer) < STREAMBUFFERSIZE and socket.waitForReadyRead(0):  # What the system already received
+            buffer.extend(socket.readAll().data())
+
+        appends = {}  # Series name -> [x chunks,y chunks], joined until a frame of another kind is found
+        start = 0
+        while len(buffer) - start >= self._headerSize:
+            operation,nameLength,count = struct.unpack_from(STREAMHEADER,buffer,start)
+            if operation in [STREAMAPPEND,STREAMREPLACE]:
+                payloadSize = 16*count
+            elif operation == STREAMADDSERIES:
+                payloadSize = count
+            elif operation == STREAMSYNC:
+                payloadSize = 0
+            else:
+                self.errorSignal.emit("Unknown stream operation {0}, closing the connection".format(operation))
+                self._drop(socket)
+                socket.abort()
+                return
+            frameEnd = start + self._headerSize + nameLength + payloadSize
+            if len(buffer) < frameEnd:
+                break  # The frame is not complete yet
+
+            nameStart = start + self._headerSize
+            payloadStart = nameStart + nameLength
+            name = bytes(buffer[nameStart:payloadStart]).decode("utf-8",errors="replace")
+            if operation == STREAMAPPEND:
+                if name not in appends:
+                    appends[name] = [[],[]]
+                appends[name][0].append(np.frombuffer(buffer,dtype="<f8",count=count,offset=payloadStart).copy())
+                appends[name][1].append(np.frombuffer(buffer,dtype="<f8",count=count,
+                                                      offset=payloadStart + 8*count).copy())
+            else:
+                self._applyAppends(appends)
+                appends = {}
+                if operation == STREAMREPLACE:
+                    self._apply(self._manager.replaceSeries,
+                                {name:[np.frombuffer(buffer,dtype="<f8",count=count,offset=payloadStart).copy(),
+                                       np.frombuffer(buffer,dtype="<f8",count=count,
+                                                     offset=payloadStart + 8*count).copy()]})
+                elif operation == STREAMADDSERIES:
+                    try:
+                        features = json.loads(bytes(buffer[payloadStart:frameEnd]).decode("utf-8"))
+                    except ValueError as e:
+                        self.errorSignal.emit("Wrong series features for {0}: {1}".format(name,e))
+                    else:
+                        if not isinstance(features,dict) or not isinstance(features.get("type"),str) or \
+                                not isinstance(features.get("plotType"),str):
+                            self.errorSignal.emit("Wrong series features for {0}: a dictionary with \"type\" and "
+                                                  "\"plotType\" strings is required".format(name))
+                        else:
+                            features["name"] = name
+                            self._manager.addSeries(features)
+                else:
+                    socket.write(STREAMACK)
+            start = frameEnd
+
+        self._applyAppends(appends)
+        del buffer[:start]
+
+
+    ## Appends to the series the points received
+    # @param appends Dictionary: For every series name, a list with the list of x chunks and the list of y chunks
+    def _applyAppends(self,appends):
+
+        if not appends:
+            return
+
+        self._apply(self._manager.addPoints,
+                    {k:[np.concatenate(appends[k][0]) if len(appends[k][0]) > 1 else appends[k][0][0],
+                        np.concatenate(appends[k][1]) if len(appends[k][1]) > 1 else appends[k][1][0]]
+                     for k in appends.keys()})
+
+
+    ## Calls a manager function with the data of one or more series. The unknown series are reported and skipped
+    # (with a refresh rate the manager would only find them on its next tick)
+    # @param function Callable: The manager function (e.g. addPoints)
+    # @param data Dictionary: For every series name, a list with the x values and the y values
+    def _apply(self,function,data):
+
+        for name in [k for k in data.keys() if not self._manager.hasSeries(k)]:
+            self.errorSignal.emit("Unknown series {0}".format(name))
+            del data[name]
+        if data:
+            function(data)
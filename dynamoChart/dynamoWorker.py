@@ -0,0 +1,112 @@
+from PySide2.QtCore import QObject, Signal, Slot, QMutex
+import numpy as np
+import time
+
+from .dynamoDecimation import prepareView
+from .dynamoPyramid import DynamoPyramid
+from .dynamoConversion import toPolygon
+from .dynamoLimits import valueLimits
+from .definitions import PYRAMID
+
+## Class DynamoDoubleBuffer
+# Hands the results of the preparation worker over to the GUI thread. The worker fills the back buffer and then swaps
+# it with the front one, the GUI thread takes the front buffer. Only the swap and the take are protected by the mutex,
+# so neither side waits for the other while working on its buffer. A result not taken yet is replaced by a newer one
+class DynamoDoubleBuffer(object):
+
+    ## Class constructor
+    def __init__(self):
+
+        self._mutex = QMutex()
+        self._front = None
+        self._back = None
+
+
+    ## Publishes a new result (worker side)
+    # @param item Object: The result to publish
+    def write(self,item):
+
+        self._back = item
+        self._mutex.lock()
+        self._front,self._back = self._back,self._front
+        self._mutex.unlock()
+        self._back = None
+
+
+    ## Takes the latest published result, None if there is nothing new (GUI side)
+    def take(self):
+
+        self._mutex.lock()
+        item = self._front
+        self._front = None
+        self._mutex.unlock()
+
+        return item
+
+
+## Class DynamoPreparationWorker
+# Prepares the data of replaced series outside the GUI thread: the input values are validated and converted to
+# float64 arrays, their limits (all the values and the positive ones, for the log axes) are computed and the points to display are decimated and converted to a QPolygonF.
+# It has to be moved to a QThread
+class DynamoPreparationWorker(QObject):
+
+    # Signals ----------------------------------------------------------------------- #
+
+    prepared = Signal()
+    failed = Signal(str)
+
+    # ------------------------------------------------------------------------------- #
+
+    ## Class constructor
+    # @param buffer DynamoDoubleBuffer: The buffer the results are written to
+    # @param parent QObject: The parent object
+    def __init__(self,buffer,parent=None):
+
+        QObject.__init__(self,parent)
+        self._buffer = buffer
+
+
+    ## Prepares a set of replaced series
+    # @param job Dictionary: It contains:
+    #                        - "data": Dictionary, for every series name a list with the list of x chunks and the list
+    #                          of y chunks that, concatenated, make the new series values
+    #                        - "settings": Dictionary, for every series name its display settings (see prepareView)
+    @Slot(object)
+    def prepare(self,job):
+
+        results = {}
+        for k in job["data"].keys():
+            try:
+                newX = np.concatenate([np.ravel(np.array(c,dtype=np.float64)) for c in job["data"][k][0]])
+                newY = np.concatenate([np.ravel(np.array(c,dtype=np.float64)) for c in job["data"][k][1]])
+            except (TypeError,ValueError) as e:
+                self.failed.emit("Wrong data for series {0}: {1}".format(k,e))
+                continue
+            if newX.shape[0] != newY.shape[0]:
+                self.failed.emit("Wrong data for series {0}: x and y must have the same number of values".format(k))
+                continue
+
+            settings = job["settings"][k]
+            start = time.perf_counter()
+            isSorted = bool(np.all(newX[1:] >= newX[:-1]))
+            pyramid = None
+            if settings["decimation"] == PYRAMID:
+                pyramid = DynamoPyramid()
+                pyramid.reset(newY)
+            viewX,viewY,bounds = prepareView(newX,newY,settings,pyramid,isSorted)
+            points = toPolygon(viewX,viewY)
+            results[k] = {"x":newX,
+                          "y":newY,
+                          "sorted":isSorted,
+                          "xLimits":valueLimits(newX),
+                          "yLimits":valueLimits(newY),
+                          "xPositiveLimits":valueLimits(newX,True),
+                          "yPositiveLimits":valueLimits(newY,True),
+                          "pyramid":pyramid,
+                          "settings":settings,
+                          "bounds":bounds,
+                          "points":points,
+                          "conversionTime":time.perf_counter() - start}
+
+        self._buffer.write(results)
+        self.prepared.emit()
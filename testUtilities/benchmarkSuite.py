@@ -0,0 +1,244 @@
+import os
+import time
+import platform
+
+import numpy as np
+import PySide2
+from PySide2.QtCore import QCoreApplication
+from PySide2.QtQml import QQmlApplicationEngine
+
+from dynamoChart.dynamoChartManager import DynamoChartManager
+
+QMLFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),"dynamoBenchmark.qml")
+XNAMES = ["bottom","top","logBottom","logTop"]
+YNAMES = ["left","right","logLeft","logRight"]
+CASES = ["replaceSeries","addPoint","addPointStrip","seriesWiseAutoscale","zoom","pan","clear"]
+
+## Class BenchmarkSuite
+# Drives a DynamoChartManager connected to a real DynamoChart (so real QLineSeries/QScatterSeries and the eight axis
+# managers) and measures its hot paths. Only the manager call is timed: the events queued by the call (e.g. the
+# chart repaint, when rendering is enabled) are processed after the measure
+class BenchmarkSuite(object):
+
+    ## Class constructor
+    # @param sizes List: The numbers of points per series to measure
+    # @param seriesCounts List: The numbers of series to measure
+    # @param repeat Integer: How many times every measure is repeated
+    # @param calls Integer: The number of addPoint calls timed for every repetition
+    # @param maxTotal Integer: The configurations with more points than this (all series together) are skipped
+    # @param types List: The series types to measure ("line" and/or "scatter")
+    # @param render Boolean: If True the chart window is shown and rendered between the measures
+    def __init__(self,sizes,seriesCounts,repeat=5,calls=100,maxTotal=2000000,types=("line","scatter"),render=False):
+
+        self._sizes = sizes
+        self._seriesCounts = seriesCounts
+        self._repeat = max(int(repeat),1)
+        self._calls = max(int(calls),1)
+        self._maxTotal = maxTotal
+        self._types = list(types)
+        self._render = render
+        self._manager = None
+        self._engine = None
+
+
+    ## Creates a new manager and the QML chart it drives
+    def _newChart(self):
+
+        self._dropChart()
+        self._manager = DynamoChartManager()
+        self._engine = QQmlApplicationEngine()
+        self._engine.rootContext().setContextProperty("ChartMng",self._manager)
+        self._engine.rootContext().setContextProperty("BenchmarkRender",self._render)
+        self._engine.load(QMLFILE)
+        if not self._engine.rootObjects():
+            raise RuntimeError("Unable to load {0}".format(QMLFILE))
+        self._process()
+
+
+    ## Destroys the current chart and its manager
+    def _dropChart(self):
+
+        if self._engine is not None:
+            for root in self._engine.rootObjects():
+                root.deleteLater()
+            self._engine.deleteLater()
+            self._process()
+        self._engine = None
+        self._manager = None
+
+
+    ## Processes the pending events (e.g. the chart repaint)
+    def _process(self):
+
+        QCoreApplication.processEvents()
+        QCoreApplication.sendPostedEvents(None,0)
+
+
+    ## Converts a dictionary to the QJSValue the manager slots expect from QML
+    # @param value Dictionary: The value to convert
+    def _js(self,value):
+
+        return self._engine.toScriptValue(value)
+
+
+    ## Adds a set of series to the current chart, with autoscale enabled on every axis
+    # @param count Integer: The number of series
+    # @param seriesType String: The series type ("line" or "scatter")
+    # @return List: The names of the new series
+    def _addSeries(self,count,seriesType):
+
+        names = ["s{0}".format(i) for i in range(count)]
+        for name in names:
+            self._manager.addSeries({"type":seriesType,"name":name,"color":"#FF0000","plotType":"linlin",
+                                     "bottom":True,"left":True,"points":False,"markerSize":0})
+        self._manager.setAutoScale(self._js({"x":{k:True for k in XNAMES},"y":{k:True for k in YNAMES}}))
+
+        return names
+
+
+    ## Returns the data used to fill a set of series: a sine with a different phase for every series
+    # @param names List: The names of the series
+    # @param points Integer: The number of points of every series
+    def _data(self,names,points):
+
+        x = np.arange(points,dtype=np.float64)
+        return {name:[x,np.sin(x*2*np.pi/max(points,2) + i)] for i,name in enumerate(names)}
+
+
+    ## Allows zooming and panning on every axis (it disables their autoscale, which would keep them still)
+    def _allowNavigation(self):
+
+        allowed = self._js({"x":{k:True for k in XNAMES},"y":{k:True for k in YNAMES}})
+        self._manager.setZoomAllowed(allowed)
+        self._manager.setPanAllowed(allowed)
+
+
+    ## Checks that a function moves the bottom axis, so that a case cannot time a call that does nothing
+    # @param function Callable: The function to check
+    def _checkMoves(self,function):
+
+        axis = self._manager.axisManager("bottom")
+        before = axis.getRange()
+        function()
+        if axis.getRange() == before:
+            raise RuntimeError("The bottom axis did not move: the case would time a call doing nothing")
+
+
+    ## Times a function
+    # @param function Callable: The function to time
+    # @param setup Callable: A function called, untimed, before every repetition
+    # @param divisor Integer: The number of operations performed by a call of the function
+    # @return Dictionary: The minimum, median, mean and maximum time of one operation, in seconds
+    def _time(self,function,setup=None,divisor=1):
+
+        durations = []
+        for i in range(self._repeat):
+            if setup is not None:
+                setup()
+                self._process()
+            start = time.perf_counter()
+            function()
+            durations.append((time.perf_counter() - start)/divisor)
+            self._process()
+        durations = np.array(durations)
+
+        return {"min":float(np.min(durations)),
+                "median":float(np.median(durations)),
+                "mean":float(np.mean(durations)),
+                "max":float(np.max(durations))}
+
+
+    ## Measures one case in one configuration
+    # @param case String: The case (one of CASES)
+    # @param points Integer: The number of points per series
+    # @param count Integer: The number of series
+    # @param seriesType String: The series type
+    # @return Dictionary: The timings
+    def _measure(self,case,points,count,seriesType):
+
+        self._newChart()
+        names = self._addSeries(count,seriesType)
+        data = self._data(names,points)
+        manager = self._manager
+        if case != "replaceSeries" and case != "clear":
+            manager.replaceSeries(data)
+            self._process()
+
+        if case == "replaceSeries":
+            return self._time(lambda: manager.replaceSeries(data))
+
+        if case in ["addPoint","addPointStrip"]:
+            if case == "addPointStrip":
+                manager.setStripChart(self._js({"doStrip":True,"points":points}))
+            nextX = [float(points)]
+
+            def addPoints():
+                for i in range(self._calls):
+                    manager.addPoint({name:[nextX[0],np.sin(nextX[0])] for name in names})
+                    nextX[0] += 1
+
+            return self._time(addPoints,divisor=self._calls)
+
+        if case == "seriesWiseAutoscale":
+            return self._time(lambda: [manager.seriesWiseAutoscale(name) for name in names])
+
+        if case == "zoom":
+            self._allowNavigation()
+            zoomIn = self._js({"verse":1})
+            zoomOut = self._js({"verse":-1})
+            self._checkMoves(lambda: manager.zoom(zoomIn))
+            manager.zoom(zoomOut)
+            return self._time(lambda: (manager.zoom(zoomIn),manager.zoom(zoomOut)),divisor=2)
+
+        if case == "pan":
+            self._allowNavigation()
+            manager.zoom(self._js({"verse":1}))
+            forward = self._js({"normDelta":0.1})
+            backward = self._js({"normDelta":-0.1})
+            self._checkMoves(lambda: manager.panX(forward))
+            manager.panX(backward)
+            return self._time(lambda: (manager.panX(forward),manager.panX(backward)),divisor=2)
+
+        if case == "clear":
+            filled = [False]
+
+            def fill():
+                if filled[0]:
+                    self._addSeries(count,seriesType)  # The series have been removed by the previous clear
+                manager.replaceSeries(data)
+                filled[0] = True
+
+            return self._time(manager.clear,setup=fill)
+
+        raise ValueError("Unknown benchmark case {0}".format(case))
+
+
+    ## Runs the benchmarks
+    # @param cases List: The cases to run (see CASES)
+    # @param report Callable: If not None, it is called with every result as soon as it is measured
+    # @return Dictionary: The environment description ("environment") and the list of results ("results")
+    def run(self,cases=CASES,report=None):
+
+        results = []
+        for case in cases:
+            for seriesType in (self._types if case in ["replaceSeries","addPoint","addPointStrip"] else ["line"]):
+                for count in self._seriesCounts:
+                    for points in self._sizes:
+                        if points*count > self._maxTotal:
+                            continue
+                        result = {"case":case,"type":seriesType,"series":count,"points":points,
+                                  "repeat":self._repeat}
+                        result.update(self._measure(case,points,count,seriesType))
+                        results.append(result)
+                        if report is not None:
+                            report(result)
+        self._dropChart()
+
+        return {"environment":{"python":platform.python_version(),
+                               "pyside2":PySide2.__version__,
+                               "numpy":np.__version__,
+                               "platform":platform.platform(),
+                               "qpa":os.environ.get("QT_QPA_PLATFORM",""),
+                               "render":self._render,
+                               "time":time.strftime("%Y-%m-%dT%H:%M:%S")},
+                "results":results}
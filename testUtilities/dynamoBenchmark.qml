@@ -0,0 +1,22 @@
+import QtQuick 2.10
+import QtQuick.Window 2.12
+import "../dynamoChart"
+
+Window {
+
+    id: benchmarkWindow
+    width: 900
+    height: 400
+    visible: BenchmarkRender
+    // ChartMng = chart manager under benchmark
+    // BenchmarkRender = if true the window is shown, so the chart is rendered between the measures
+
+    DynamoChart{
+        id: benchmarkChart
+        anchors.fill: parent
+        manager: ChartMng
+        Component.onCompleted: function(){
+            benchmarkChart.managerAssociation();
+        }
+    }
+}
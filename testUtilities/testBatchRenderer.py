@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dynamoChart.dynamoBatchRenderer import renderChart
+
+## Returns the description of a series for renderChart
+# @param name String: The series name
+# @param plotType String: The plot type
+# @param x Numpy array: The x values
+# @param y Numpy array: The y values
+def seriesJob(name,plotType,x,y):
+
+    return {"type":"line","name":name,"color":"#FF0000","plotType":plotType,"bottom":True,"left":True,
+            "points":False,"markerSize":0,"x":x,"y":y}
+
+
+## Class TestBatchRenderer
+# Checks the axes of the charts rendered by renderChart (run in this process, without the worker pool)
+class TestBatchRenderer(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.TemporaryDirectory()
+
+
+    def tearDown(self):
+
+        self._directory.cleanup()
+
+
+    ## Renders a chart and checks that it succeeded
+    # @param series List: The series of the chart
+    # @param ranges Dictionary: The explicit axes ranges
+    def render(self,series,ranges=None):
+
+        job = {"output":os.path.join(self._directory.name,"chart.png"),"series":series}
+        if ranges is not None:
+            job["ranges"] = ranges
+        result = renderChart(job)
+        self.assertIsNone(result["error"])
+        self.assertTrue(os.path.getsize(result["output"]) > 0)
+
+        return result
+
+
+    def testLinearAxesFitTheData(self):
+
+        x = np.linspace(1000,2000,500)
+        result = self.render([seriesJob("s","linlin",x,3 + 0.5*np.sin(x/50))])
+        self.assertAlmostEqual(result["ranges"]["bottom"][0],1000)
+        self.assertAlmostEqual(result["ranges"]["bottom"][1],2000)
+        self.assertAlmostEqual(result["ranges"]["left"][0],2.5,places=3)
+        self.assertAlmostEqual(result["ranges"]["left"][1],3.5,places=3)
+
+
+    def testLogAxesFitTheDecades(self):
+
+        x = np.linspace(1,1000,500)
+        result = self.render([seriesJob("s","linlog",x,np.logspace(2,6,500))])
+        self.assertEqual(result["ranges"]["logLeft"],[100.0,1e6])
+
+
+    def testExplicitRangesAreKept(self):
+
+        x = np.linspace(1000,2000,500)
+        result = self.render([seriesJob("s","linlin",x,x)],{"bottom":[0,5000]})
+        self.assertEqual(result["ranges"]["bottom"],[0.0,5000.0])
+        self.assertAlmostEqual(result["ranges"]["left"][0],1000)
+        self.assertAlmostEqual(result["ranges"]["left"][1],2000)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
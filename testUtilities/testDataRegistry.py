@@ -0,0 +1,87 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM","offscreen")
+os.environ.setdefault("QT_QUICK_BACKEND","software")
+os.environ.setdefault("QT_QUICK_CONTROLS_STYLE","Material")
+
+from PySide2.QtCore import QCoreApplication
+from PySide2.QtWidgets import QApplication
+from PySide2.QtQml import QQmlApplicationEngine
+
+from dynamoChart.dynamoChartManager import DynamoChartManager
+from dynamoChart.dynamoDataRegistry import DynamoDataRegistry
+
+QMLFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),"dynamoBenchmark.qml")
+
+## Class TestDataRegistry
+# Checks that the series subscribed to a registry channel are shown like the equivalent series fed directly
+class TestDataRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls._application = QApplication.instance() or QApplication([])
+
+
+    def setUp(self):
+
+        self._charts = []
+
+
+    def tearDown(self):
+
+        for manager,engine in self._charts:
+            for root in engine.rootObjects():
+                root.deleteLater()
+            engine.deleteLater()
+        self._charts = []
+        QCoreApplication.processEvents()
+
+
+    ## Creates a chart with a single autoscaled series "s"
+    # @return DynamoChartManager: The manager of the chart
+    def chart(self):
+
+        manager = DynamoChartManager()
+        engine = QQmlApplicationEngine()
+        engine.rootContext().setContextProperty("ChartMng",manager)
+        engine.rootContext().setContextProperty("BenchmarkRender",False)
+        engine.load(QMLFILE)
+        self.assertTrue(engine.rootObjects())
+        self._charts.append((manager,engine))
+        manager.addSeries({"type":"line","name":"s","color":"#FF0000","plotType":"linlin","bottom":True,
+                           "left":True,"points":False,"markerSize":0})
+        manager.setAutoScale(engine.toScriptValue({"x":{"bottom":True},"y":{"left":True}}))
+
+        return manager
+
+
+    def testWindowedChannelScrollsLikeStripChart(self):
+
+        strip = self.chart()
+        strip.setStripChart(self._charts[-1][1].toScriptValue({"doStrip":True,"points":50}))
+        subscribed = self.chart()
+        registry = DynamoDataRegistry()
+        registry.createChannel("ch",50)
+        subscribed.setDataRegistry(registry)
+        subscribed.subscribeSeries("s","ch")
+
+        for i in range(80):
+            strip.addPoint({"s":[float(i),2.0*i]})
+            registry.appendChannels({"ch":[float(i),2.0*i]})
+
+        for axisName in ["bottom","left"]:
+            self.assertEqual(subscribed.axisManager(axisName).getRange(),strip.axisManager(axisName).getRange())
+        self.assertEqual(subscribed.axisManager("bottom").getRange(),[30.0,79.0])
+        self.assertEqual(subscribed.axisManager("left").getRange(),[60.0,158.0])
+        self.assertEqual(subscribed.axisManager("left").getSeriesLimits("s"),(60.0,158.0))
+
+
+if __name__ == '__main__':
+
+    unittest.main()